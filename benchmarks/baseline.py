@@ -0,0 +1,63 @@
+"""
+Baseline version of pysubs2 for benchmarks
+
+Benchmarks compare the current code with pysubs2 as of :data:`BASELINE_REVISION`,
+checked out from git and imported as a separate package, so that the reference
+implementation is the real one instead of a copy which could drift from it.
+Set ``PYSUBS2_BASELINE_REVISION`` environment variable to compare with another revision.
+
+"""
+import atexit
+import importlib
+import io
+import os
+import shutil
+import subprocess
+import sys
+import tarfile
+import tempfile
+from functools import cache
+from pathlib import Path
+from types import ModuleType
+
+#: Git revision of pysubs2 used as baseline by default.
+BASELINE_REVISION = "e7adad779418bf5839ee092bb688d6d7dbc5281a"
+
+REPO_DIR = Path(__file__).parent.parent
+
+
+@cache
+def load_baseline(revision: str = "") -> ModuleType:
+    """
+    Import pysubs2 package from given git revision (default: :data:`BASELINE_REVISION`)
+
+    The package is imported under a different name, eg. ``pysubs2_e7adad779418``, its submodules
+    are available as usual (``load_baseline().formats.subrip``). Objects from the baseline
+    and from current pysubs2 cannot be mixed, eg. :class:`pysubs2.SSAEvent` instances
+    must be created with the respective module.
+
+    """
+    revision = revision or os.environ.get("PYSUBS2_BASELINE_REVISION", BASELINE_REVISION)
+    archive = subprocess.run(["git", "archive", "--format=tar", revision, "pysubs2"], cwd=REPO_DIR,
+                             capture_output=True, check=True).stdout
+    commit = subprocess.run(["git", "rev-parse", "--short=12", revision], cwd=REPO_DIR,
+                            capture_output=True, check=True, text=True).stdout.strip()
+
+    package_name = f"pysubs2_{commit}"
+    path = Path(tempfile.mkdtemp(prefix="pysubs2-baseline-"))
+    atexit.register(shutil.rmtree, path, ignore_errors=True)
+    with tarfile.open(fileobj=io.BytesIO(archive)) as tar:
+        for member in tar.getmembers():
+            fp = tar.extractfile(member)
+            if fp is None:
+                continue
+            _, _, relative_path = member.name.partition("/")
+            target = path / package_name / relative_path
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_bytes(fp.read())
+
+    sys.path.insert(0, str(path))
+    try:
+        return importlib.import_module(package_name)
+    finally:
+        sys.path.remove(str(path))
@@ -0,0 +1,62 @@
+"""
+Benchmark of loading SubStation files with embedded fonts
+
+Compares ``attachments="load"`` (the default), ``"lazy"`` and ``"skip"`` options
+of :meth:`pysubs2.formats.SubstationFormat.from_file()` on a file with 1000 events
+and 20 MB of ``[Fonts]`` (time, and memory kept by the loaded subtitles), and checks
+that lazy attachments are saved unchanged.
+
+Usage: python -m benchmarks.bench_attachments
+
+"""
+import os
+import random
+import tempfile
+import timeit
+import tracemalloc
+from functools import partial
+
+import pysubs2
+
+
+def make_ass(path: str, n_events: int, font_size: int) -> None:
+    subs = pysubs2.SSAFile()
+    for i in range(n_events):
+        subs.append(pysubs2.SSAEvent(start=i * 1000, end=i * 1000 + 900, text=f"Subtitle {i}"))
+
+    rng = random.Random(0)
+    for i in range(4):
+        # uuencoded data is 80 characters per line, from "!" to "`"
+        subs.fonts_opaque[f"font{i}.ttf"] = ["".join(chr(rng.randint(33, 96)) for _ in range(80))
+                                             for _ in range(font_size // 4 // 80)]
+    subs.save(path)
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "fonts.ass")
+        make_ass(path, 1000, 20_000_000)
+        print(f"{os.path.getsize(path) / 1e6:.1f} MB")
+
+        subs_ref = pysubs2.load(path)
+        subs_lazy = pysubs2.load(path, attachments="lazy")
+        assert subs_lazy.to_string("ass") == subs_ref.to_string("ass")
+
+        for attachments in ("load", "lazy", "skip"):
+            t = timeit.timeit(partial(pysubs2.load, path, attachments=attachments), number=3) / 3
+            tracemalloc.start()
+            subs = pysubs2.load(path, attachments=attachments)
+            memory, _ = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            del subs
+            print(f"attachments={attachments!r}: load {t * 1e3:7.1f} ms, {memory / 1e6:5.1f} MB")
+
+        out_path = os.path.join(tmp_dir, "out.ass")
+        for attachments in ("load", "lazy"):
+            subs = pysubs2.load(path, attachments=attachments)
+            t = timeit.timeit(partial(subs.save, out_path), number=3) / 3
+            print(f"attachments={attachments!r}: save {t * 1e3:7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
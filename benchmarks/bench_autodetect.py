@@ -0,0 +1,48 @@
+"""
+Benchmark of subtitle format autodetection
+
+Compares the single-pass detector (:func:`pysubs2.formats.detect_formats()`)
+with calling ``guess_format()`` of every registered format class.
+
+Usage: python -m benchmarks.bench_autodetect
+
+"""
+import timeit
+from functools import partial
+
+import pysubs2
+from pysubs2.formats import FORMAT_IDENTIFIER_TO_FORMAT_CLASS, detect_formats
+
+
+def guess_format_per_class(content: str) -> set[str]:
+    formats = set()
+    for impl in FORMAT_IDENTIFIER_TO_FORMAT_CLASS.values():
+        guess = impl.guess_format(content)
+        if guess is not None:
+            formats.add(guess)
+    return formats
+
+
+def make_fragments() -> dict[str, str]:
+    subs = pysubs2.SSAFile()
+    for i in range(1000):
+        subs.append(pysubs2.SSAEvent(start=i * 1000, end=i * 1000 + 900, text=f"Subtitle number {i}\\Nsecond line"))
+
+    return {
+        format_: subs.to_string(format_, fps=25)[:10000]
+        for format_ in ("srt", "vtt", "ass", "microdvd", "tmp", "mpl2", "ttml")
+    }
+
+
+def main() -> None:
+    n = 200
+    for format_, fragment in make_fragments().items():
+        assert {g.format for g in detect_formats(fragment)} == guess_format_per_class(fragment)
+        t_old = timeit.timeit(partial(guess_format_per_class, fragment), number=n) / n
+        t_new = timeit.timeit(partial(detect_formats, fragment), number=n) / n
+        print(f"{format_:>10}: per-class {t_old * 1e6:8.1f} us, single-pass {t_new * 1e6:8.1f} us, "
+              f"speedup {t_old / t_new:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
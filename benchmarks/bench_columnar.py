@@ -0,0 +1,45 @@
+"""
+Benchmark of memory usage of :class:`pysubs2.columnar.ColumnarEventList`
+
+Loads a generated SubStation file with many events into a plain list
+and into the columnar store, and compares memory allocated by each.
+
+Usage: python -m benchmarks.bench_columnar
+
+"""
+import time
+import tracemalloc
+
+import pysubs2
+
+
+def make_file(n: int) -> str:
+    subs = pysubs2.SSAFile()
+    for i in range(n):
+        subs.append(pysubs2.SSAEvent(start=i * 100, end=i * 100 + 90, text=f"Subtitle number {i}\\Nsecond line"))
+    return subs.to_string("ass")
+
+
+def measure(text: str, columnar: bool) -> tuple[int, float]:
+    t0 = time.perf_counter()
+    pysubs2.SSAFile.from_string(text, columnar=columnar)
+    elapsed = time.perf_counter() - t0
+
+    tracemalloc.start()
+    subs = pysubs2.SSAFile.from_string(text, columnar=columnar)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del subs
+    return size, elapsed
+
+
+def main() -> None:
+    n = 200_000
+    text = make_file(n)
+    for columnar in (False, True):
+        size, elapsed = measure(text, columnar)
+        print(f"columnar={columnar!s:>5}: {size / n:6.1f} bytes/event, load {elapsed:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+Benchmark of lazy SubStation events
+
+Compares loading with and without ``lazy_events=True`` (see :meth:`pysubs2.formats.SubstationFormat.from_file()`)
+on a file with 200k events, for a filtering workload (keep only one style, drop comments, save as ASS)
+and for loading all fields, and checks that both give the same result.
+
+Usage: python -m benchmarks.bench_lazy_events
+
+"""
+import timeit
+from functools import partial
+
+import pysubs2
+
+
+def make_ass(n: int) -> str:
+    subs = pysubs2.SSAFile()
+    styles = ["Default", "Signs", "Karaoke", "Top"]
+    for i in range(n):
+        subs.append(pysubs2.SSAEvent(start=i * 100, end=i * 100 + 90, text=f"Subtitle {i}, {{\\i1}}italic",
+                                     style=styles[i % len(styles)], type="Comment" if i % 10 == 0 else "Dialogue"))
+    return subs.to_string("ass")
+
+
+def main() -> None:
+    n = 200_000
+    text = make_ass(n)
+
+    def run_filter(lazy_events: bool) -> str:
+        subs = pysubs2.SSAFile.from_string(text, "ass", lazy_events=lazy_events)
+        subs.events = [ev for ev in subs if ev.style == "Signs" and not ev.is_comment]
+        return subs.to_string("ass")
+
+    def run_load_all(lazy_events: bool) -> list[dict[str, object]]:
+        subs = pysubs2.SSAFile.from_string(text, "ass", lazy_events=lazy_events)
+        return [ev.as_dict() for ev in subs]
+
+    for description, run in (("filter by style", run_filter), ("read all fields", run_load_all)):
+        assert run(False) == run(True)
+        t_eager = min(timeit.repeat(partial(run, False), number=1, repeat=3))
+        t_lazy = min(timeit.repeat(partial(run, True), number=1, repeat=3))
+        print(f"{description}: eager {t_eager * 1e3:7.1f} ms, lazy {t_lazy * 1e3:7.1f} ms, "
+              f"speedup {t_eager / t_lazy:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
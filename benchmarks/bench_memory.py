@@ -0,0 +1,43 @@
+"""
+Benchmark of memory footprint of loaded subtitles
+
+Loads a generated file with many events in several formats and reports
+memory allocated per event (as measured by :mod:`tracemalloc`).
+
+Usage: python -m benchmarks.bench_memory
+
+"""
+import tracemalloc
+
+import pysubs2
+
+
+def make_subs(n: int) -> pysubs2.SSAFile:
+    subs = pysubs2.SSAFile()
+    subs.styles["Signs"] = pysubs2.SSAStyle(fontname="Verdana")
+    for i in range(n):
+        subs.append(pysubs2.SSAEvent(start=i * 100, end=i * 100 + 90, style="Signs" if i % 10 == 0 else "Default",
+                                     name=f"Actor {i % 3}", text=f"Subtitle number {i}\\Nsecond line"))
+    return subs
+
+
+def measure(text: str, format_: str) -> int:
+    tracemalloc.start()
+    subs = pysubs2.SSAFile.from_string(text, format_)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del subs
+    return size
+
+
+def main() -> None:
+    n = 100_000
+    subs = make_subs(n)
+    for format_ in ("ass", "srt", "json"):
+        text = subs.to_string(format_)
+        size = measure(text, format_)
+        print(f"{format_:>5}: {size / n:6.1f} bytes/event")
+
+
+if __name__ == "__main__":
+    main()
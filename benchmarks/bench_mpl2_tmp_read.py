@@ -0,0 +1,71 @@
+"""
+Benchmark of MPL2 and TMP parsing
+
+Compares :meth:`pysubs2.formats.mpl2.MPL2Format.from_file()` and :meth:`pysubs2.formats.tmp.TmpFormat.from_file()`
+with the baseline version (see :mod:`benchmarks.baseline`; ``findall()`` on the whole file for MPL2, list of events
+with overlaps corrected afterwards for TMP) on files with 200k subtitles, measuring time and peak memory,
+and checks that both give the same result.
+
+Usage: python -m benchmarks.bench_mpl2_tmp_read
+
+"""
+import io
+import timeit
+import tracemalloc
+from functools import partial
+from types import ModuleType
+from typing import Any
+
+import pysubs2
+from pysubs2.formats import get_format_class
+
+from .baseline import load_baseline
+
+
+def read_baseline(baseline: ModuleType, text: str, format_: str) -> Any:
+    subs = baseline.SSAFile()
+    baseline.formats.get_format_class(format_).from_file(subs, io.StringIO(text), format_)
+    return subs
+
+
+def read(text: str, format_: str) -> pysubs2.SSAFile:
+    subs = pysubs2.SSAFile()
+    get_format_class(format_).from_file(subs, io.StringIO(text), format_)
+    return subs
+
+
+def read_streaming(text: str, format_: str) -> None:
+    for _ in get_format_class(format_).iter_events(pysubs2.SSAFile(), io.StringIO(text), format_):
+        pass
+
+
+def main() -> None:
+    n = 200_000
+    inputs = {
+        "mpl2": "".join(f"[{i * 20}][{i * 20 + 15}] Line {i}|/second line\n" for i in range(n)),
+        "tmp": "".join(f"{i // 3600:02d}:{i // 60 % 60:02d}:{i % 60:02d}:Line {i}|<u>second</u> line\n"
+                       for i in range(n)),
+    }
+    baseline = load_baseline()
+
+    for format_, text in inputs.items():
+        baseline_events = [(e.start, e.end, e.text) for e in read_baseline(baseline, text, format_)]
+        assert baseline_events == [(e.start, e.end, e.text) for e in read(text, format_)]
+
+        print(f"{format_}, {n} subtitles ({len(text) / 1e6:.1f} MB)")
+        runs = {
+            "baseline": partial(read_baseline, baseline, text, format_),
+            "line by line": partial(read, text, format_),
+            "iter_events": partial(read_streaming, text, format_),
+        }
+        for description, run in runs.items():
+            t = min(timeit.repeat(run, number=1, repeat=3))
+            tracemalloc.start()
+            run()
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(f"  {description:12}: {t * 1e3:7.1f} ms, peak memory {peak / 1e6:6.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
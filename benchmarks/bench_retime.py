@@ -0,0 +1,55 @@
+"""
+Benchmark of bulk retiming
+
+Compares :meth:`pysubs2.SSAFile.shift()` and :meth:`pysubs2.SSAFile.transform_framerate()`
+with the per-event loop of the baseline version (see :mod:`benchmarks.baseline`),
+with and without NumPy.
+
+Usage: python -m benchmarks.bench_retime
+
+"""
+import timeit
+from functools import partial
+
+import pysubs2
+import pysubs2.time
+import pysubs2.ssafile
+from pysubs2.columnar import ColumnarEventList
+
+from .baseline import load_baseline
+
+
+def main() -> None:
+    n = 200_000
+    baseline = load_baseline()
+    baseline_subs = baseline.SSAFile()
+    subs = pysubs2.SSAFile()
+    for i in range(n):
+        baseline_subs.append(baseline.SSAEvent(start=i * 100, end=i * 100 + 90))
+        subs.append(pysubs2.SSAEvent(start=i * 100, end=i * 100 + 90))
+    columnar_subs = pysubs2.SSAFile()
+    columnar_subs.events = ColumnarEventList(subs)
+
+    t_shift_baseline = timeit.timeit(partial(baseline_subs.shift, ms=1), number=3) / 3
+    t_transform_baseline = timeit.timeit(partial(baseline_subs.transform_framerate, 1.0001, 1), number=3) / 3
+
+    numpy_getter = pysubs2.time._get_numpy
+    for backend in ("numpy", "python"):
+        if backend == "python":
+            pysubs2.time._get_numpy = pysubs2.ssafile._get_numpy = lambda: None  # type: ignore[assignment]
+        elif numpy_getter() is None:
+            continue
+
+        print(f"{backend}:")
+        for name, s in (("list", subs), ("columnar", columnar_subs)):
+            t_bulk = timeit.timeit(partial(s.shift, ms=1), number=3) / 3
+            print(f"  {name:>8} shift: baseline {t_shift_baseline * 1e3:7.1f} ms, bulk {t_bulk * 1e3:7.1f} ms")
+            t_bulk = timeit.timeit(partial(s.transform_framerate, 1.0001, 1), number=3) / 3
+            print(f"  {name:>8} transform_framerate: baseline {t_transform_baseline * 1e3:7.1f} ms, "
+                  f"bulk {t_bulk * 1e3:7.1f} ms")
+
+    pysubs2.time._get_numpy = pysubs2.ssafile._get_numpy = numpy_getter
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Benchmark of SAMI parsing
+
+Compares :meth:`pysubs2.formats.sami.SAMIFormat.from_file()` with the baseline version
+(see :mod:`benchmarks.baseline`; whole file fed to the parser at once, text of ``<SYNC>`` elements built with ``+=``) on a file
+with 10k short ``<SYNC>`` elements and on a file with one big ``<SYNC>`` element, measuring time
+and peak memory, and checks that both give the same result.
+
+Usage: python -m benchmarks.bench_sami_read
+
+"""
+import io
+import timeit
+import tracemalloc
+from functools import partial
+from types import ModuleType
+from typing import Any
+
+import pysubs2
+from pysubs2.formats.sami import SAMIFormat
+
+from .baseline import load_baseline
+
+
+def read_baseline(baseline: ModuleType, text: str) -> Any:
+    subs = baseline.SSAFile()
+    baseline.formats.sami.SAMIFormat.from_file(subs, io.StringIO(text), "sami")
+    return subs
+
+
+def read(text: str) -> pysubs2.SSAFile:
+    subs = pysubs2.SSAFile()
+    SAMIFormat.from_file(subs, io.StringIO(text), "sami")
+    return subs
+
+
+def read_streaming(text: str) -> None:
+    for _ in SAMIFormat.iter_events(pysubs2.SSAFile(), io.StringIO(text), "sami"):
+        pass
+
+
+def make_sami(n_sync: int, n_lines: int, line: str) -> str:
+    parts = ["<SAMI>\n<Body>\n"]
+    for i in range(n_sync):
+        parts.append(f"<SYNC Start={i * 2000}><P Class=ENUSCC>\n")
+        parts.extend(line.format(i=i, j=j) for j in range(n_lines))
+    parts.append("</Body>\n</SAMI>\n")
+    return "".join(parts)
+
+
+def main() -> None:
+    inputs = {
+        "10k short SYNCs": make_sami(10_000, 2, "Subtitle {i}, <i>line</i> {j}<br>\n"),
+        "one big SYNC": make_sami(1, 20_000, "Line {j} with <b>bold</b> text<br>\n"),
+    }
+
+    baseline = load_baseline()
+
+    for description, text in inputs.items():
+        baseline_events = [(e.start, e.end, e.text) for e in read_baseline(baseline, text)]
+        assert baseline_events == [(e.start, e.end, e.text) for e in read(text)]
+
+        print(f"{description} ({len(text) / 1e6:.1f} MB)")
+        runs = {
+            "baseline": partial(read_baseline, baseline, text),
+            "chunked": partial(read, text),
+            "iter_events": partial(read_streaming, text),
+        }
+        for name, run in runs.items():
+            t = min(timeit.repeat(run, number=1, repeat=3))
+            tracemalloc.start()
+            run()
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(f"  {name:12}: {t * 1e3:7.1f} ms, peak memory {peak / 1e6:6.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Benchmark of SubRip parsing
+
+Compares :meth:`pysubs2.formats.SubripFormat.from_file()` with the baseline version
+(see :mod:`benchmarks.baseline`; timestamp regex on every line, then eleven ``re.sub()`` passes
+per subtitle) on a 100k-cue file, and checks that both give the same result for all combinations of ``keep_html_tags``
+and ``keep_unknown_html_tags``.
+
+Usage: python -m benchmarks.bench_subrip
+
+"""
+import io
+import timeit
+from typing import Any
+
+import pysubs2
+from pysubs2.formats.subrip import SubripFormat
+
+from .baseline import load_baseline
+
+
+def make_srt(n: int) -> str:
+    texts = [
+        "Plain subtitle number {i}",
+        "<i>Italic</i> subtitle {i}\nwith second line",
+        '<font color="#ffff00">Colored <b>bold</b></font> subtitle {i}',
+        "- Dialogue {i}\n- <u>Answer</u>",
+    ]
+    parts = []
+    for i in range(n):
+        start = SubripFormat.ms_to_timestamp(i * 2000)
+        end = SubripFormat.ms_to_timestamp(i * 2000 + 1500)
+        parts.append(f"{i + 1}\n{start} --> {end}\n{texts[i % len(texts)].format(i=i)}\n\n")
+    return "".join(parts)
+
+
+def main() -> None:
+    n = 100_000
+    text = make_srt(n)
+    print(f"{n} cues, {len(text) / 1e6:.1f} MB")
+    baseline = load_baseline()
+
+    for options in ({}, {"keep_unknown_html_tags": True}, {"keep_html_tags": True}):
+        def run_baseline(options: dict[str, Any] = options) -> Any:
+            subs = baseline.SSAFile()
+            baseline.formats.subrip.SubripFormat.from_file(subs, io.StringIO(text), "srt", **options)
+            return subs
+
+        def run_new(options: dict[str, Any] = options) -> pysubs2.SSAFile:
+            subs = pysubs2.SSAFile()
+            SubripFormat.from_file(subs, io.StringIO(text), "srt", **options)
+            return subs
+
+        assert [(e.start, e.end, e.text) for e in run_baseline()] == [(e.start, e.end, e.text) for e in run_new()]
+        t_baseline = timeit.timeit(run_baseline, number=3) / 3
+        t_new = timeit.timeit(run_new, number=3) / 3
+        print(f"{options or 'default options'}: baseline {t_baseline * 1e3:7.1f} ms, single-pass {t_new * 1e3:7.1f} ms, "
+              f"speedup {t_baseline / t_new:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Benchmark of SubStation writing
+
+Compares :meth:`pysubs2.SSAFile.to_string()` and :class:`pysubs2.formats.substation.SubstationWriter`
+with the baseline version (see :mod:`benchmarks.baseline`; ``print()`` of every line, with per-field
+type dispatch) on 200k events, in both ASS and SSA.
+
+Usage: python -m benchmarks.bench_substation_write
+
+"""
+import io
+import timeit
+from functools import partial
+
+import pysubs2
+from pysubs2.formats.substation import SubstationWriter
+
+from .baseline import load_baseline
+
+
+def write_events(subs: pysubs2.SSAFile, format_: str) -> str:
+    fp = io.StringIO()
+    with SubstationWriter(fp, format_, subs) as writer:
+        for event in subs.events:
+            writer.write_event(event)
+    return fp.getvalue()
+
+
+def main() -> None:
+    n = 200_000
+    baseline = load_baseline()
+    baseline_subs = baseline.SSAFile()
+    subs = pysubs2.SSAFile()
+    for i in range(n):
+        kwargs = dict(start=i * 100, end=i * 100 + 90, text=f"Subtitle {i}, {{\\i1}}italic",
+                      name="Actor", type="Comment" if i % 10 == 0 else "Dialogue")
+        baseline_subs.append(baseline.SSAEvent(**kwargs))
+        subs.append(pysubs2.SSAEvent(**kwargs))
+
+    for format_ in ("ass", "ssa"):
+        runs = {
+            "baseline": partial(baseline_subs.to_string, format_),
+            "to_string": partial(subs.to_string, format_),
+            "writer": partial(write_events, subs, format_),
+        }
+        assert len({run() for run in runs.values()}) == 1
+        times = {name: min(timeit.repeat(run, number=1, repeat=3)) for name, run in runs.items()}
+        print(f"{format_}: " + ", ".join(f"{name} {n / t / 1e3:6.0f}k events/s" for name, t in times.items()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Benchmark of TTML parsing
+
+Compares :meth:`pysubs2.formats.ttml.TTMLFormat.from_file()` with the baseline version
+(see :mod:`benchmarks.baseline`; ``ET.parse()`` of the whole document, event text built with ``+=`` and ``re.sub()`` on each text node)
+on a file with 100k ``<p>`` elements, measuring time and peak memory, and checks that both give
+the same result.
+
+Usage: python -m benchmarks.bench_ttml_read
+
+"""
+import io
+import timeit
+import tracemalloc
+from typing import Any
+
+import pysubs2
+from pysubs2.formats.ttml import TTMLFormat
+
+from .baseline import load_baseline
+
+
+def make_ttml(n: int) -> str:
+    texts = [
+        "Plain subtitle number {i}",
+        "Subtitle {i}<br/>with second line",
+        'Subtitle {i} with <span tts:fontStyle="italic">italic</span> and\n   <span tts:color="#FFFF00">color</span>',
+    ]
+    parts = ['<tt xmlns="http://www.w3.org/ns/ttml" xmlns:tts="http://www.w3.org/ns/ttml#styling">\n'
+             '<body begin="1s">\n<div>\n']
+    for i in range(n):
+        begin = TTMLFormat.ms_to_timestamp(i * 2000)
+        end = TTMLFormat.ms_to_timestamp(i * 2000 + 1500)
+        parts.append(f'  <p begin="{begin}" end="{end}">{texts[i % len(texts)].format(i=i)}</p>\n')
+    parts.append("</div>\n</body>\n</tt>\n")
+    return "".join(parts)
+
+
+def main() -> None:
+    n = 100_000
+    text = make_ttml(n)
+    print(f"{n} <p> elements, {len(text) / 1e6:.1f} MB")
+    baseline = load_baseline()
+
+    def run_baseline() -> Any:
+        subs = baseline.SSAFile()
+        baseline.formats.ttml.TTMLFormat.from_file(subs, io.StringIO(text), "ttml")
+        return subs
+
+    def run_new() -> pysubs2.SSAFile:
+        subs = pysubs2.SSAFile()
+        TTMLFormat.from_file(subs, io.StringIO(text), "ttml")
+        return subs
+
+    def run_new_streaming() -> None:
+        subs = pysubs2.SSAFile()
+        for _ in TTMLFormat.iter_events(subs, io.StringIO(text), "ttml"):
+            pass
+
+    assert [(e.start, e.end, e.text) for e in run_baseline()] == [(e.start, e.end, e.text) for e in run_new()]
+
+    for description, run in (("baseline", run_baseline), ("iterparse", run_new), ("iter_events", run_new_streaming)):
+        t = min(timeit.repeat(run, number=1, repeat=3))
+        tracemalloc.start()
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"{description:12}: {t * 1e3:7.1f} ms, peak memory {peak / 1e6:6.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
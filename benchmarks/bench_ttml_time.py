@@ -0,0 +1,41 @@
+"""
+Benchmark of TTML time expression parsing
+
+Compares :meth:`pysubs2.formats.ttml.TTMLFormat.timestamp_to_ms()` with the baseline version
+(see :mod:`benchmarks.baseline`; ``re.fullmatch()`` with string patterns, no caching) on clock-time
+expressions of 100k subtitles and on repeated offset-time expressions, and checks that both give
+the same result.
+
+Usage: python -m benchmarks.bench_ttml_time
+
+"""
+import timeit
+from functools import partial
+from typing import Callable
+
+from pysubs2.formats.ttml import TTMLFormat
+
+from .baseline import load_baseline
+
+
+def main() -> None:
+    n = 100_000
+    inputs = {
+        "clock-time": [TTMLFormat.ms_to_timestamp(i * 1000 + i % 1000) for i in range(n)],
+        "offset-time": ["0s", "1.5s", "500ms", "2s", "1h"] * (n // 5),
+    }
+    baseline_timestamp_to_ms = load_baseline().formats.ttml.TTMLFormat.timestamp_to_ms
+
+    for description, exprs in inputs.items():
+        def run(timestamp_to_ms: Callable[[str], int], exprs: list[str] = exprs) -> list[int]:
+            return list(map(timestamp_to_ms, exprs))
+
+        assert run(baseline_timestamp_to_ms) == run(TTMLFormat.timestamp_to_ms)
+        t_baseline = min(timeit.repeat(partial(run, baseline_timestamp_to_ms), number=1, repeat=3))
+        t_new = min(timeit.repeat(partial(run, TTMLFormat.timestamp_to_ms), number=1, repeat=3))
+        print(f"{description}: baseline {t_baseline * 1e3:6.1f} ms, precompiled + cached {t_new * 1e3:6.1f} ms, "
+              f"speedup {t_baseline / t_new:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Benchmark of TTML writing
+
+Compares :meth:`pysubs2.formats.ttml.TTMLFormat.to_file()` with the baseline version
+(see :mod:`benchmarks.baseline`; whole ``<tt>`` tree built in memory, ``ET.indent()`` and ``ET.tostring()`` of the whole document)
+on 100k events, measuring time and peak memory (writing to :data:`os.devnull`), and checks that both
+give the same output.
+
+Usage: python -m benchmarks.bench_ttml_write
+
+"""
+import io
+import os
+import timeit
+import tracemalloc
+from functools import partial
+from types import ModuleType
+from typing import Any, TextIO
+
+import pysubs2
+
+from .baseline import load_baseline
+
+
+def make_subs(package: ModuleType, n: int) -> Any:
+    """Make subtitles using given version of pysubs2"""
+    subs = package.SSAFile()
+    subs.styles["Italic"] = package.SSAStyle(italic=True)
+    texts = [
+        "Plain subtitle number {i}",
+        "Subtitle {i}\\Nwith second line",
+        "Subtitle {i} with {{\\i1}}italic{{\\i0}} and {{\\c&H00FFFF&}}color",
+        "Subtitle {i} in italic style & <special> characters, žluťoučký kůň",
+    ]
+    for i in range(n):
+        subs.append(package.SSAEvent(start=i * 2000, end=i * 2000 + 1500, text=texts[i % len(texts)].format(i=i),
+                                     style="Italic" if i % 4 == 3 else "Default"))
+    return subs
+
+
+def main() -> None:
+    n = 100_000
+    baseline = load_baseline()
+    baseline_subs = make_subs(baseline, n)
+    subs = make_subs(pysubs2, n)
+
+    def run_baseline(fp: TextIO) -> None:
+        baseline_subs.to_file(fp, "ttml")
+
+    def run_new(fp: TextIO) -> None:
+        subs.to_file(fp, "ttml")
+
+    fp_baseline, fp_new = io.StringIO(), io.StringIO()
+    run_baseline(fp_baseline)
+    run_new(fp_new)
+    assert fp_new.getvalue() == fp_baseline.getvalue()
+    print(f"{n} events, {len(fp_new.getvalue()) / 1e6:.1f} MB")
+
+    with open(os.devnull, "w", encoding="utf-8") as fp:
+        for description, run in (("baseline", run_baseline), ("streaming", run_new)):
+            t = min(timeit.repeat(partial(run, fp), number=1, repeat=3))
+            tracemalloc.start()
+            run(fp)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(f"{description:10}: {t * 1e3:7.1f} ms, peak memory {peak / 1e6:6.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
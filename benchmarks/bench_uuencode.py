@@ -0,0 +1,42 @@
+"""
+Benchmark of SubStation attachment encoding
+
+Measures :func:`pysubs2.attachments.uuencode()` and :func:`pysubs2.attachments.uudecode()`
+on the fonts in test data and 5 MB of random data. The baseline version of pysubs2 has no
+attachment encoder to compare with; instead, the encoding of the font is checked against
+the lines written by Aegisub in test data, and random data is checked to survive a round-trip.
+
+Usage: python -m benchmarks.bench_uuencode
+
+"""
+import os
+import timeit
+from functools import partial
+from pathlib import Path
+
+import pysubs2
+from pysubs2.attachments import uudecode, uuencode
+
+DATA_DIR = Path(__file__).parent.parent / "tests" / "data"
+
+
+def main() -> None:
+    aegisub_subs = pysubs2.load(str(DATA_DIR / "subtitle_with_attached_fonts_aegisub.ass"))
+    inputs = {
+        "EBGaramond08-Regular.ttf": (DATA_DIR / "EBGaramond08-Regular.ttf").read_bytes(),
+        "random 5 MB": os.urandom(5_000_000),
+    }
+    assert uuencode(inputs["EBGaramond08-Regular.ttf"]) == list(aegisub_subs.fonts_opaque["EBGaramond08-Regular_0.ttf"])
+
+    for description, data in inputs.items():
+        lines = uuencode(data)
+        assert uudecode(lines) == data
+
+        t_enc = timeit.timeit(partial(uuencode, data), number=1)
+        t_dec = timeit.timeit(partial(uudecode, lines), number=1)
+        print(f"{description}: encode {t_enc * 1e3:5.1f} ms ({len(data) / t_enc / 1e6:5.0f} MB/s), "
+              f"decode {t_dec * 1e3:5.1f} ms ({len(data) / t_dec / 1e6:5.0f} MB/s)")
+
+
+if __name__ == "__main__":
+    main()
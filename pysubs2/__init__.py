@@ -1,11 +1,15 @@
 from .ssafile import SSAFile
 from .ssaevent import SSAEvent
 from .ssastyle import SSAStyle
-from . import time, formats, cli, exceptions
+from typing import Any, TYPE_CHECKING
+from . import time, formats, exceptions
 from .formats import whisper
 from .exceptions import *  # noqa: F403
 from .common import Color, Alignment, VERSION
 
+if TYPE_CHECKING:
+    from . import cli
+
 __all__ = [
     "SSAFile",
     "SSAEvent",
@@ -19,6 +23,7 @@ __all__ = [
     "Alignment",
     "VERSION",
     "load",
+    "iter_events",
     "load_from_whisper",
     "make_time",
 ]
@@ -26,6 +31,9 @@ __all__ = [
 #: Alias for :meth:`SSAFile.load()`.
 load = SSAFile.load
 
+#: Alias for :meth:`SSAFile.iter_events()`.
+iter_events = SSAFile.iter_events
+
 #: Alias for :meth:`pysubs2.whisper.load_from_whisper()`.
 load_from_whisper = whisper.load_from_whisper
 
@@ -34,3 +42,11 @@ make_time = time.make_time
 
 #: Alias for `pysubs2.common.VERSION`.
 __version__ = VERSION
+
+
+def __getattr__(name: str) -> Any:
+    # the CLI module is imported on demand, it is not needed for using pysubs2 as a library
+    if name == "cli":
+        import importlib
+        return importlib.import_module(".cli", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,207 @@
+"""
+Embedded files in SubStation subtitles, ie. ``[Fonts]`` and ``[Graphics]`` sections.
+
+"""
+import binascii
+from itertools import islice
+import os
+from typing import Any, Iterable, Iterator, Optional, Sequence, TextIO, Union, overload, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .ssafile import SSAFile
+
+
+#: Values of the ``attachments`` option of :meth:`pysubs2.formats.SubstationFormat.from_file()`.
+ATTACHMENT_LOAD_MODES = ("load", "lazy", "skip")
+
+#: Length of lines of uuencoded attachments, as written by Aegisub.
+UUENCODE_LINE_LENGTH = 80
+
+# SubStation uuencoding is base64 with a different alphabet (6-bit value + 33, ie. "!" to "`")
+# and without padding, so we can let binascii do the heavy lifting and just translate the output
+_BASE64_ALPHABET = b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/"
+_UUENCODE_ALPHABET = bytes(range(33, 33 + 64))
+_BASE64_TO_UUENCODE = bytes.maketrans(_BASE64_ALPHABET, _UUENCODE_ALPHABET)
+# characters outside of uuencode alphabet are mapped to "*", which is not valid base64 either
+_UUENCODE_TO_BASE64 = bytes(_BASE64_ALPHABET[c - 33] if 33 <= c < 33 + 64 else ord("*") for c in range(256))
+_ENCODE_CHUNK_SIZE = UUENCODE_LINE_LENGTH * 3 // 4 * 1024  # bytes, ie. 1024 whole lines
+_DECODE_CHUNK_LINES = 1024
+
+
+class LazyAttachment(Sequence[str]):
+    """
+    Lines of an embedded file which are kept in the source subtitle file until they are needed.
+
+    This is used instead of ``list`` in :attr:`pysubs2.SSAFile.fonts_opaque` and
+    :attr:`pysubs2.SSAFile.graphics_opaque` when a SubStation file is loaded with
+    ``attachments="lazy"``. Only the position of the attachment (line numbers) is recorded
+    when loading; the lines are read from the source file when you access them, and they
+    are copied straight from the source file when the subtitles are saved.
+
+    Iterating over the object reads the lines without keeping them in memory, while
+    indexing reads all of them and caches them (see :meth:`LazyAttachment.load()`).
+
+    Note:
+        The source file must not change while the subtitles are loaded. This is checked
+        when the lines are read and :class:`ValueError` is raised if the attachment is no longer
+        there. :meth:`pysubs2.SSAFile.save()` takes care of loading attachments before
+        the source file is overwritten.
+
+    """
+    def __init__(self, path: str, encoding: Optional[str], errors: Optional[str], heading_lineno: int,
+                 heading: str, length: int) -> None:
+        self.path = path  #: Path to the source subtitle file.
+        self.encoding = encoding  #: Character encoding of the source subtitle file.
+        self.errors = errors  #: Error handling for character encoding of the source subtitle file.
+        self.heading_lineno = heading_lineno  #: Line number (1-based) of ``fontname:``/``filename:`` line.
+        self.heading = heading  #: The ``fontname:``/``filename:`` line, used to check that the file is unchanged.
+        self._length = length
+        self._lines: Optional[list[str]] = None
+
+    @staticmethod
+    def get_source(fp: TextIO) -> Optional[tuple[str, Optional[str], Optional[str]]]:
+        """
+        Return ``(path, encoding, errors)`` needed to reopen file behind given file object, or ``None``
+
+        ``None`` is returned when the file object has no path to reopen (eg. :class:`io.StringIO`
+        or a pipe), in which case attachments have to be loaded right away.
+
+        """
+        path = getattr(fp, "name", None)
+        if not isinstance(path, str) or not os.path.isfile(path):
+            return None
+        return path, getattr(fp, "encoding", None), getattr(fp, "errors", None)
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the lines have been read from the source file and are kept in memory"""
+        return self._lines is not None
+
+    def load(self) -> list[str]:
+        """Read the lines from the source file (if not already done), keep them in memory and return them"""
+        if self._lines is None:
+            self._lines = list(self._read_lines())
+        return self._lines
+
+    def refers_to(self, path: Union[str, "os.PathLike[str]"]) -> bool:
+        """Whether the attachment is read from given file"""
+        try:
+            return os.path.samefile(self.path, path)
+        except OSError:
+            return False
+
+    def _read_lines(self) -> Iterator[str]:
+        with open(self.path, encoding=self.encoding, errors=self.errors) as fp:
+            lines = islice(fp, self.heading_lineno - 1, self.heading_lineno + self._length)
+            if next(lines, "").strip() != self.heading:
+                raise ValueError(f"Cannot read attachment from {self.path!r}, the file has changed since it was "
+                                 f"loaded (expected {self.heading!r} at line {self.heading_lineno})")
+            n = 0
+            while chunk := list(islice(lines, 1000)):
+                n += len(chunk)
+                yield from map(str.strip, chunk)
+            if n != self._length:
+                raise ValueError(f"Cannot read attachment from {self.path!r}, the file has changed since it was "
+                                 f"loaded (expected {self._length} lines after line {self.heading_lineno})")
+
+    def __iter__(self) -> Iterator[str]:
+        if self._lines is not None:
+            return iter(self._lines)
+        return self._read_lines()
+
+    def __len__(self) -> int:
+        return self._length
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[str]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[str, list[str]]:
+        return self.load()[index]
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (LazyAttachment, list, tuple)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"<LazyAttachment {self.path!r}:{self.heading_lineno} ({self._length} lines)>"
+
+
+def load_attachments_from(subs: "SSAFile", path: Union[str, "os.PathLike[str]"]) -> None:
+    """
+    Load lazy attachments which are read from given file into memory
+
+    This must be done before the file is overwritten, otherwise the attachments would be lost.
+
+    """
+    for attachments in (subs.fonts_opaque, subs.graphics_opaque):
+        for attachment in attachments.values():
+            if isinstance(attachment, LazyAttachment) and not attachment.is_loaded and attachment.refers_to(path):
+                attachment.load()
+
+
+def uuencode(data: bytes) -> list[str]:
+    """
+    Encode binary data as lines of SubStation attachment (``[Fonts]`` or ``[Graphics]``)
+
+    Example:
+        >>> uuencode(b"pysubs2")
+        ['=(FT>7*T-A']
+
+    See also:
+        :func:`uudecode()`, :meth:`pysubs2.SSAFile.set_font()`
+
+    """
+    lines: list[str] = []
+    view = memoryview(data)
+    for i in range(0, len(view), _ENCODE_CHUNK_SIZE):
+        chunk = binascii.b2a_base64(view[i:i + _ENCODE_CHUNK_SIZE], newline=False)
+        encoded = chunk.rstrip(b"=").translate(_BASE64_TO_UUENCODE).decode("ascii")
+        lines.extend(encoded[j:j + UUENCODE_LINE_LENGTH] for j in range(0, len(encoded), UUENCODE_LINE_LENGTH))
+    return lines
+
+
+def uudecode(lines: Iterable[str]) -> bytes:
+    """
+    Decode lines of SubStation attachment (``[Fonts]`` or ``[Graphics]``) into binary data
+
+    Lines may be of any length, they are decoded as if they were joined together.
+
+    Raises:
+        ValueError: The lines are not valid uuencoded data.
+
+    See also:
+        :func:`uuencode()`, :meth:`pysubs2.SSAFile.get_font()`
+
+    """
+    data = bytearray()
+    rest = b""
+    it = iter(lines)
+    while batch := list(islice(it, _DECODE_CHUNK_LINES)):
+        encoded = rest + _to_ascii("".join(batch))
+        cut = len(encoded) - len(encoded) % 4
+        data += _decode_base64(encoded[:cut].translate(_UUENCODE_TO_BASE64))
+        rest = encoded[cut:]
+
+    if len(rest) == 1:
+        raise ValueError("Invalid uuencoded data, incomplete group of characters at the end")
+    data += _decode_base64(rest.translate(_UUENCODE_TO_BASE64) + b"=" * (-len(rest) % 4))
+    return bytes(data)
+
+
+def _to_ascii(s: str) -> bytes:
+    try:
+        return s.encode("ascii")
+    except UnicodeEncodeError:
+        raise ValueError("Invalid uuencoded data, found non-ASCII character") from None
+
+
+def _decode_base64(encoded: bytes) -> bytes:
+    if b"*" in encoded:
+        raise ValueError("Invalid uuencoded data, found character outside of uuencode alphabet")
+    return binascii.a2b_base64(encoded)
@@ -1,18 +1,25 @@
 import argparse
 import codecs
+import copy
+import json
+import os
 import re
 from pathlib import Path
 from io import TextIOWrapper
 import sys
 from textwrap import dedent
-from typing import Any, Optional
+from typing import Any, Optional, TextIO, BinaryIO, cast, TYPE_CHECKING
 
-from .formats import get_file_extension, FORMAT_IDENTIFIERS
+from .formats import get_file_extension, get_format_identifier, FORMAT_IDENTIFIERS
+from .exceptions import UnknownFileExtensionError
 from .time import make_time
 from .ssafile import SSAFile
 from .common import VERSION
 import logging
 
+if TYPE_CHECKING:
+    import socketserver
+
 
 def positive_float(s: str) -> float:
     x = float(s)
@@ -21,6 +28,13 @@ def positive_float(s: str) -> float:
     return x
 
 
+def non_negative_int(s: str) -> int:
+    x = int(s)
+    if x < 0:
+        raise argparse.ArgumentTypeError(f"{s!r} is not a non-negative integer")
+    return x
+
+
 def character_encoding(s: str) -> str:
     try:
         codecs.lookup(s)
@@ -52,6 +66,8 @@ class Pysubs2CLI:
                                                          python -m pysubs2 --shift 0.3s *.srt
                                                          python -m pysubs2 --shift 0.3s <my_file.srt >retimed_file.srt
                                                          python -m pysubs2 --shift-back 0.3s --output-dir retimed *.srt
+                                                         python -m pysubs2 --to srt --jobs 8 archive/*.ass
+                                                         python -m pysubs2 --serve /tmp/pysubs2.sock
                                                          python -m pysubs2 --transform-framerate 25 23.976 *.srt"""))
 
         parser.add_argument("files", nargs="*", metavar="FILE", type=Path,
@@ -94,6 +110,17 @@ class Pysubs2CLI:
                                  "strip styling information when saving to non-SSA formats")
         parser.add_argument("--verbose", action="store_true",
                             help="Print misc logging")
+        parser.add_argument("-j", "--jobs", metavar="N", type=non_negative_int, default=1,
+                            help="Process files in N parallel processes (0 means number of CPUs). By default, "
+                                 "files are processed one by one. With more than one job, a file that fails to "
+                                 "convert does not stop the others; failures are summarized at the end.")
+
+        parser.add_argument("--serve", metavar="SOCKET", nargs="?", const="-",
+                            help="Run as a server which stays alive and processes requests, one JSON object per line, "
+                                 "eg. {\"input\": \"in.ass\", \"output\": \"out.srt\", \"shift\": \"0.5s\"}. "
+                                 "Requests are read from standard input, or from connections to given Unix socket. "
+                                 "For each request, a JSON status line is written back. Other options given on "
+                                 "command line are used as defaults for the requests.")
 
         group = parser.add_mutually_exclusive_group()
 
@@ -153,7 +180,13 @@ class Pysubs2CLI:
         logging.debug("Extra arguments to SSAFile.to_file(): %r", extra_output_args)
 
         input_paths: list[Path] = args.files
-        if input_paths:
+        if args.serve is not None:
+            if input_paths:
+                self.parser.error("input files cannot be given with --serve")
+            self.serve(args, extra_input_args, extra_output_args)
+        elif input_paths:
+            jobs: int = args.jobs or os.cpu_count() or 1
+            valid_paths: list[Path] = []  # files for parallel processing
             for inpath in input_paths:
                 if not inpath.exists():
                     print(f"Skipping {inpath} (does not exist)")
@@ -161,29 +194,13 @@ class Pysubs2CLI:
                 elif not inpath.is_file():
                     print(f"Skipping {inpath} (not a file)")
                     errors += 1
+                elif jobs == 1:
+                    self.convert_file(inpath, args, extra_input_args, extra_output_args)
                 else:
-                    with inpath.open("r", encoding=args.input_enc, errors=args.enc_error_handling) as infile:
-                        subs = SSAFile.from_file(infile, args.input_format, args.fps, **extra_input_args)
-
-                    self.process(subs, args)
-
-                    if args.output_format is None:
-                        outpath = inpath
-                        output_format = subs.format
-                        assert output_format is not None, "subs.format must not be None (it was read from file)"
-                    else:
-                        ext = get_file_extension(args.output_format)
-                        outpath = inpath.with_suffix(ext)
-                        output_format = args.output_format
-                        assert output_format is not None, "args.output_format must not be None (see if/else)"
-
-                    if output_dir is not None:
-                        filename = outpath.name
-                        outpath = output_dir / filename
-
-                    with outpath.open("w", encoding=args.output_enc, errors=args.enc_error_handling) as outfile:
-                        subs.to_file(outfile, output_format, args.fps, apply_styles=not args.clean,
-                                     **extra_output_args)
+                    valid_paths.append(inpath)
+
+            if valid_paths:
+                errors += self.convert_files_parallel(valid_paths, jobs, args, extra_input_args, extra_output_args)
         elif not sys.stdin.isatty():
             infile = TextIOWrapper(sys.stdin.buffer, encoding=args.input_enc, errors=args.enc_error_handling)
             outfile = TextIOWrapper(sys.stdout.buffer, encoding=args.output_enc, errors=args.enc_error_handling)
@@ -199,6 +216,215 @@ class Pysubs2CLI:
 
         return 0 if errors == 0 else 1
 
+    @classmethod
+    def convert_files_parallel(cls, input_paths: list[Path], jobs: int, args: argparse.Namespace,
+                               extra_input_args: dict[str, Any], extra_output_args: dict[str, Any]) -> int:
+        """Convert files using a process pool, print summary of failures and return their number."""
+        # imported here, as multiprocessing takes a while to import and it's not needed for most invocations
+        from concurrent.futures import ProcessPoolExecutor
+
+        failures: list[tuple[Path, BaseException]] = []
+        with ProcessPoolExecutor(max_workers=min(jobs, len(input_paths) or 1)) as executor:
+            futures = [executor.submit(cls.convert_file, inpath, args, extra_input_args, extra_output_args)
+                       for inpath in input_paths]
+            for inpath, future in zip(input_paths, futures):
+                exc = future.exception()
+                if exc is not None:
+                    logging.debug("Failed to convert %s", inpath, exc_info=exc)
+                    failures.append((inpath, exc))
+
+        if failures:
+            print(f"Failed to convert {len(failures)} of {len(input_paths)} files:")
+            for inpath, exc in failures:
+                print(f"  {inpath}: {type(exc).__name__}: {exc}")
+        return len(failures)
+
+    @classmethod
+    def convert_file(cls, inpath: Path, args: argparse.Namespace, extra_input_args: dict[str, Any],
+                     extra_output_args: dict[str, Any], outpath: Optional[Path] = None) -> Path:
+        """Load, process and save one file, return the output path."""
+        with inpath.open("r", encoding=args.input_enc, errors=args.enc_error_handling) as infile:
+            subs = SSAFile.from_file(infile, args.input_format, args.fps, **extra_input_args)
+
+        cls.process(subs, args)
+
+        if outpath is not None:
+            output_format = args.output_format
+            if output_format is None:
+                try:
+                    output_format = get_format_identifier(outpath.suffix)
+                except UnknownFileExtensionError:
+                    output_format = subs.format
+            assert output_format is not None, "subs.format must not be None (it was read from file)"
+            with outpath.open("w", encoding=args.output_enc, errors=args.enc_error_handling) as outfile:
+                subs.to_file(outfile, output_format, args.fps, apply_styles=not args.clean,
+                             **extra_output_args)
+            return outpath
+
+        if args.output_format is None:
+            outpath = inpath
+            output_format = subs.format
+            assert output_format is not None, "subs.format must not be None (it was read from file)"
+        else:
+            ext = get_file_extension(args.output_format)
+            outpath = inpath.with_suffix(ext)
+            output_format = args.output_format
+            assert output_format is not None, "args.output_format must not be None (see if/else)"
+
+        output_dir: Optional[Path] = args.output_dir
+        if output_dir is not None:
+            filename = outpath.name
+            outpath = output_dir / filename
+
+        with outpath.open("w", encoding=args.output_enc, errors=args.enc_error_handling) as outfile:
+            subs.to_file(outfile, output_format, args.fps, apply_styles=not args.clean,
+                         **extra_output_args)
+
+        return outpath
+
+    #: Keys of ``--serve`` requests and the corresponding command line options
+    SERVE_REQUEST_KEYS = {
+        "input": None,
+        "output": None,
+        "output_dir": "output_dir",
+        "from": "input_format",
+        "to": "output_format",
+        "input_enc": "input_enc",
+        "output_enc": "output_enc",
+        "fps": "fps",
+        "shift": "shift",
+        "shift_back": "shift_back",
+        "transform_framerate": "transform_framerate",
+        "clean": "clean",
+    }
+
+    def serve(self, args: argparse.Namespace, extra_input_args: dict[str, Any],
+              extra_output_args: dict[str, Any]) -> None:
+        """Run the ``--serve`` mode, until end of input (or forever, when listening on socket)."""
+        if args.serve == "-":
+            self.serve_stream(sys.stdin, sys.stdout, args, extra_input_args, extra_output_args)
+        else:
+            with self.make_socket_server(args.serve, args, extra_input_args, extra_output_args) as server:
+                try:
+                    server.serve_forever()
+                finally:
+                    os.unlink(args.serve)
+
+    def make_socket_server(self, path: str, args: argparse.Namespace, extra_input_args: dict[str, Any],
+                           extra_output_args: dict[str, Any]) -> "socketserver.BaseServer":
+        """Create server listening on Unix socket, which handles each connection with :meth:`serve_stream()`."""
+        import socket
+        import socketserver
+
+        if not hasattr(socket, "AF_UNIX"):
+            raise OSError("Unix sockets are not supported on this platform")
+        cli = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self) -> None:
+                infile = TextIOWrapper(cast(BinaryIO, self.rfile), encoding="utf-8")
+                outfile = TextIOWrapper(cast(BinaryIO, self.wfile), encoding="utf-8", write_through=True)
+                try:
+                    cli.serve_stream(infile, outfile, args, extra_input_args, extra_output_args)
+                finally:
+                    # the socket streams are closed by the server
+                    infile.detach()
+                    outfile.detach()
+
+        return socketserver.UnixStreamServer(path, Handler)
+
+    def serve_stream(self, infile: TextIO, outfile: TextIO, args: argparse.Namespace,
+                     extra_input_args: dict[str, Any], extra_output_args: dict[str, Any]) -> None:
+        """Process JSON-lines requests from infile, write a JSON status line to outfile for each."""
+        for line in infile:
+            if not line.strip():
+                continue
+
+            request_id = None
+            try:
+                request = json.loads(line)
+                if not isinstance(request, dict):
+                    raise TypeError(f"Request must be a JSON object, not {type(request).__name__}")
+                request_id = request.pop("id", None)
+                inpath, outpath, request_args = self.parse_serve_request(request, args)
+                outpath = self.convert_file(inpath, request_args, extra_input_args, extra_output_args, outpath)
+                response = {"id": request_id, "status": "ok", "output": str(outpath)}
+            except Exception as e:
+                logging.debug("Failed to process request %r", line, exc_info=True)
+                response = {"id": request_id, "status": "error", "error": f"{type(e).__name__}: {e}"}
+
+            print(json.dumps(response), file=outfile, flush=True)
+
+    def parse_serve_request(self, request: dict[str, Any],
+                            args: argparse.Namespace) -> tuple[Path, Optional[Path], argparse.Namespace]:
+        """Validate ``--serve`` request, return input path, output path and options for :meth:`process()`."""
+        unknown_keys = request.keys() - self.SERVE_REQUEST_KEYS.keys()
+        if unknown_keys:
+            raise ValueError(f"Unknown request keys: {', '.join(sorted(unknown_keys))}")
+        if "input" not in request:
+            raise ValueError("Missing 'input' in request")
+        if sum(key in request for key in ("shift", "shift_back", "transform_framerate")) > 1:
+            raise ValueError("Only one of 'shift', 'shift_back', 'transform_framerate' may be given")
+
+        request_args = copy.copy(args)
+        if any(key in request for key in ("shift", "shift_back", "transform_framerate")):
+            request_args.shift = request_args.shift_back = request_args.transform_framerate = None
+
+        for key, value in request.items():
+            self._check_serve_request_value(key, value)
+            dest = self.SERVE_REQUEST_KEYS[key]
+            if dest is None:
+                continue
+            if key in {"shift", "shift_back"} and isinstance(value, str):
+                value = time(value)
+            elif key == "transform_framerate":
+                in_fps, out_fps = value
+                value = [positive_float(str(in_fps)), positive_float(str(out_fps))]
+            elif key == "fps" and value is not None:
+                value = positive_float(str(value))
+            elif key in {"input_enc", "output_enc"}:
+                value = character_encoding(value)
+            elif key in {"from", "to"} and value is not None and value not in FORMAT_IDENTIFIERS:
+                raise ValueError(f"Unknown format {value!r}")
+            elif key == "output_dir" and value is not None:
+                value = Path(value)
+            setattr(request_args, dest, value)
+
+        if "input_enc" in request and "output_enc" not in request:
+            request_args.output_enc = request_args.input_enc
+
+        inpath = Path(request["input"])
+        outpath = Path(request["output"]) if request.get("output") is not None else None
+        if request_args.output_dir is not None and outpath is None:
+            request_args.output_dir.mkdir(parents=True, exist_ok=True)
+        return inpath, outpath, request_args
+
+    @staticmethod
+    def _check_serve_request_value(key: str, value: Any) -> None:
+        """Raise TypeError if value of ``--serve`` request key has wrong JSON type."""
+        def is_number(v: Any) -> bool:
+            return isinstance(v, (int, float)) and not isinstance(v, bool)
+
+        if key in {"shift", "shift_back"}:
+            if not (isinstance(value, str) or is_number(value)):
+                raise TypeError(f"{key!r} must be a time string like \"1.5s\" or a number of milliseconds, "
+                                f"not {value!r}")
+        elif key == "transform_framerate":
+            if not (isinstance(value, list) and len(value) == 2 and all(map(is_number, value))):
+                raise TypeError(f"'transform_framerate' must be a list of two numbers [in_fps, out_fps], not {value!r}")
+        elif key == "clean":
+            if not isinstance(value, bool):
+                raise TypeError(f"'clean' must be true or false, not {value!r}")
+        elif key == "fps":
+            if not (value is None or is_number(value)):
+                raise TypeError(f"'fps' must be a number, not {value!r}")
+        elif key in {"input", "input_enc", "output_enc"}:
+            if not isinstance(value, str):
+                raise TypeError(f"{key!r} must be a string, not {value!r}")
+        elif key in {"output", "output_dir", "from", "to"}:
+            if not (value is None or isinstance(value, str)):
+                raise TypeError(f"{key!r} must be a string, not {value!r}")
+
     @staticmethod
     def process(subs: SSAFile, args: argparse.Namespace) -> None:
         if args.shift is not None:
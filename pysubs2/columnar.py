@@ -0,0 +1,293 @@
+"""
+Memory-efficient storage for :attr:`pysubs2.SSAFile.events`.
+
+"""
+from array import array
+import sys
+from typing import Any, Iterable, Iterator, Literal, MutableSequence, Optional, Callable, overload
+
+from .common import IntOrFloat
+from .ssaevent import SSAEvent
+
+
+class ColumnarEventList(MutableSequence[SSAEvent]):
+    """
+    List of subtitles stored column by column.
+
+    This is an alternative to plain ``list`` for :attr:`pysubs2.SSAFile.events`, intended for huge
+    subtitle files. Instead of one :class:`pysubs2.SSAEvent` object per subtitle, timestamps are stored
+    in ``array("q")`` columns, layers and margins in ``array("i")`` columns and strings in lists, with
+    style names, actor names, effects and line types interned. A numeric column which gets a value
+    that does not fit the array (eg. float timestamp) is converted to plain list, so that any value
+    accepted by :class:`pysubs2.SSAEvent` is stored as-is. Items are returned as :class:`ColumnarEvent` views,
+    which are created on demand and read/write the underlying columns.
+
+    Example::
+
+        >>> subs = pysubs2.load("huge-karaoke-file.ass", columnar=True)
+        >>> subs.shift(s=1.5)
+        >>> subs.save("huge-karaoke-file-shifted.ass")
+
+        >>> subs.events = ColumnarEventList(subs.events)  # convert existing subtitles
+
+    Note:
+        Events are stored by value. Inserting an :class:`pysubs2.SSAEvent` copies its fields,
+        so later changes to the inserted object are not reflected in the list; modify the
+        item returned by the list instead. Two lookups of the same item return distinct,
+        but equivalent views.
+
+        Removing or replacing items leaves their rows in the columns; once these take up more
+        than half of the rows, the columns are compacted. Compaction moves the remaining items
+        to other rows, so views obtained before the modification must not be used after it:
+        they may show a different item, or raise :class:`IndexError`. Get the items from the list
+        again, or use :meth:`pysubs2.SSAEvent.copy()` if you need to keep them. (:meth:`pop()`
+        returns such a copy.)
+
+    """
+
+    #: Columns which are stored in arrays, while all values fit into them.
+    _NUMERIC_COLUMNS = ("_start", "_end", "_layer", "_marginl", "_marginr", "_marginv")
+
+    def __init__(self, events: Iterable[SSAEvent] = ()) -> None:
+        self._start = array("q")
+        self._end = array("q")
+        self._layer = array("i")
+        self._marginl = array("i")
+        self._marginr = array("i")
+        self._marginv = array("i")
+        self._marked = bytearray()
+        self._text: list[str] = []
+        self._style: list[str] = []
+        self._name: list[str] = []
+        self._effect: list[str] = []
+        self._type: list[str] = []
+        #: Row indices in list order
+        self._order = array("i")
+        self.extend(events)
+
+    def _add_row(self, event: SSAEvent) -> int:
+        if not isinstance(event, SSAEvent):
+            raise TypeError("SSAFile.events must contain only SSAEvent objects")
+
+        row = len(self._text)
+        try:
+            self._start.append(event.start)
+            self._end.append(event.end)
+            self._layer.append(event.layer)
+            self._marginl.append(event.marginl)
+            self._marginr.append(event.marginr)
+            self._marginv.append(event.marginv)
+        except (TypeError, OverflowError):
+            # some value does not fit into array, undo the partial row and add it column by column
+            for column in self._NUMERIC_COLUMNS:
+                del getattr(self, column)[row:]
+            for column in self._NUMERIC_COLUMNS:
+                self._set_value(column, row, getattr(event, column[1:]))
+        self._marked.append(bool(event.marked))
+        self._text.append(event.text)
+        self._style.append(sys.intern(event.style))
+        self._name.append(sys.intern(event.name))
+        self._effect.append(sys.intern(event.effect))
+        self._type.append(sys.intern(event.type))
+        return row
+
+    def _set_value(self, column: str, row: int, value: Any) -> None:
+        """Set (or append, if row is past the end) value in numeric column, converting the column to list if needed"""
+        values = getattr(self, column)
+        try:
+            if row == len(values):
+                values.append(value)
+            else:
+                values[row] = value
+        except (TypeError, OverflowError):
+            if not isinstance(values, array):
+                raise
+            setattr(self, column, values.tolist())
+            self._set_value(column, row, value)
+
+    def append(self, value: SSAEvent) -> None:
+        self._order.append(self._add_row(value))
+
+    def extend(self, values: Iterable[SSAEvent]) -> None:
+        if values is self:
+            values = list(values)
+        order = self._order
+        add_row = self._add_row
+        for value in values:
+            order.append(add_row(value))
+
+    def insert(self, index: int, value: SSAEvent) -> None:
+        self._order.insert(index, self._add_row(value))
+
+    def clear(self) -> None:
+        del self._order[:]
+        self._compact()
+
+    def pop(self, index: int = -1) -> SSAEvent:
+        """Remove and return item at index (default last), as standalone :class:`pysubs2.SSAEvent`."""
+        event = self[index].copy()
+        del self[index]
+        return event
+
+    def reverse(self) -> None:
+        """Reverse items in-place."""
+        self._order.reverse()
+
+    def sort(self, *, key: Optional[Callable[[SSAEvent], Any]] = None, reverse: bool = False) -> None:
+        """Sort items in-place, like ``list.sort()``. Default order is by (start, end) timestamps."""
+        if key is None:
+            start, end = self._start, self._end
+            rows = sorted(self._order, key=lambda row: (start[row], end[row]), reverse=reverse)
+        else:
+            rows = sorted(self._order, key=lambda row: key(ColumnarEvent(self, row)), reverse=reverse)
+        self._order = array("i", rows)
+
+    def _compact(self) -> None:
+        """Reclaim rows of removed items once they are more than half of all rows."""
+        n_rows = len(self._text)
+        order = self._order
+        if 2 * (n_rows - len(order)) <= n_rows:
+            return
+
+        for column in self._NUMERIC_COLUMNS:
+            values = getattr(self, column)
+            compacted = [values[row] for row in order]
+            setattr(self, column, array(values.typecode, compacted) if isinstance(values, array) else compacted)
+        self._marked = bytearray([self._marked[row] for row in order])
+        for column in ("_text", "_style", "_name", "_effect", "_type"):
+            values = getattr(self, column)
+            setattr(self, column, [values[row] for row in order])
+        self._order = array("i", range(len(order)))
+
+    def transform_times(self, func: Callable[["array[int]"], "array[int]"],
+                        scalar_func: Callable[[IntOrFloat], IntOrFloat]) -> None:
+        """
+        Apply bulk transformation to start and end times of all items.
+
+        The function gets a contiguous ``array("q")`` buffer with timestamps and returns
+        a buffer of the same size and type with the new values; see :meth:`pysubs2.SSAFile.shift()`.
+        When the timestamps are not stored in arrays (see above) or the new values do not fit
+        into them, ``scalar_func`` is applied to each timestamp instead.
+
+        """
+        if isinstance(self._start, array) and isinstance(self._end, array):
+            try:
+                start, end = func(self._start), func(self._end)
+            except (TypeError, OverflowError):
+                pass
+            else:
+                if start.typecode != "q" or end.typecode != "q":
+                    raise TypeError("Expected array('q') of timestamps")
+                self._start, self._end = start, end
+                return
+
+        for column in ("_start", "_end"):
+            values = [scalar_func(t) for t in getattr(self, column)]
+            try:
+                setattr(self, column, array("q", values))
+            except (TypeError, OverflowError):
+                setattr(self, column, values)
+
+    def __iter__(self) -> Iterator[SSAEvent]:
+        for row in self._order:
+            yield ColumnarEvent(self, row)
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    @overload
+    def __getitem__(self, index: int) -> SSAEvent:
+        pass
+
+    @overload
+    def __getitem__(self, index: slice) -> list[SSAEvent]:
+        pass
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return [ColumnarEvent(self, row) for row in self._order[index]]
+        return ColumnarEvent(self, self._order[index])
+
+    @overload
+    def __setitem__(self, index: int, value: SSAEvent) -> None:
+        pass
+
+    @overload
+    def __setitem__(self, index: slice, value: Iterable[SSAEvent]) -> None:
+        pass
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        if isinstance(index, slice):
+            values = list(value)
+            self._order[index] = array("i", [self._add_row(v) for v in values])
+        else:
+            self._order[index] = self._add_row(value)
+        self._compact()
+
+    def __delitem__(self, index: Any) -> None:
+        del self._order[index]
+        self._compact()
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (ColumnarEventList, list)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"<ColumnarEventList with {len(self)} events>"
+
+
+def _column_property(column: str) -> Any:
+    def getter(self: "ColumnarEvent") -> Any:
+        return getattr(self._events, column)[self._row]
+
+    def setter(self: "ColumnarEvent", value: Any) -> None:
+        self._events._set_value(column, self._row, value)
+
+    return property(getter, setter)
+
+
+def _interned_column_property(column: str) -> Any:
+    def getter(self: "ColumnarEvent") -> Any:
+        return getattr(self._events, column)[self._row]
+
+    def setter(self: "ColumnarEvent", value: str) -> None:
+        getattr(self._events, column)[self._row] = sys.intern(value)
+
+    return property(getter, setter)
+
+
+class ColumnarEvent(SSAEvent):
+    """
+    View of one item in :class:`ColumnarEventList`.
+
+    Behaves like :class:`pysubs2.SSAEvent` (of which it is a subclass), but the fields are
+    read from and written to the list. Use :meth:`pysubs2.SSAEvent.copy()` to get
+    a standalone :class:`pysubs2.SSAEvent`.
+
+    """
+    __slots__ = ("_events", "_row")
+
+    def __init__(self, events: ColumnarEventList, row: int) -> None:
+        self._events = events
+        self._row = row
+
+    start: int = _column_property("_start")
+    end: int = _column_property("_end")
+    text: str = _column_property("_text")
+    layer: int = _column_property("_layer")
+    style: str = _interned_column_property("_style")
+    name: str = _interned_column_property("_name")
+    marginl: int = _column_property("_marginl")
+    marginr: int = _column_property("_marginr")
+    marginv: int = _column_property("_marginv")
+    effect: str = _interned_column_property("_effect")
+    type: Literal["Dialogue", "Comment"] = _interned_column_property("_type")
+
+    @property
+    def marked(self) -> bool:
+        return bool(self._events._marked[self._row])
+
+    @marked.setter
+    def marked(self, value: bool) -> None:
+        self._events._marked[self._row] = bool(value)
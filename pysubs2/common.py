@@ -1,10 +1,13 @@
-from dataclasses import dataclass
+import io
+from dataclasses import dataclass, fields
 from os import PathLike
-from typing import Union, Optional, Iterable, Iterator, Any
+from typing import Union, Optional, Iterable, Iterator, Any, TextIO, TypeVar, TYPE_CHECKING
 from enum import IntEnum
-import xml.etree.ElementTree as ET
 from contextlib import contextmanager
 
+if TYPE_CHECKING:
+    import xml.etree.ElementTree as ET
+
 
 @dataclass(init=False)
 class Color:
@@ -67,8 +70,98 @@ VERSION = "1.8.1"
 IntOrFloat = Union[int, float]
 PathOrStr = Union[str, PathLike[Any]]
 
+_T = TypeVar("_T")
+
+
+def add_slots(cls: type[_T]) -> type[_T]:
+    """
+    Class decorator which makes a dataclass use ``__slots__`` instead of instance ``__dict__``.
+
+    This is what ``@dataclass(slots=True, weakref_slot=True)`` does, which is not available
+    in Python 3.9. It must be applied on top of ``@dataclass``. Instances support weak references,
+    but cannot have attributes other than the dataclass fields.
+
+    """
+    field_names = tuple(f.name for f in fields(cls))  # type: ignore[arg-type]
+    cls_dict = dict(cls.__dict__)
+    cls_dict["__slots__"] = (*field_names, "__weakref__")
+    for name in field_names:
+        # default values are class attributes which would conflict with the slots
+        cls_dict.pop(name, None)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+
+    new_cls: type[_T] = type(cls.__name__, cls.__bases__, cls_dict)
+    new_cls.__qualname__ = cls.__qualname__
+    return new_cls
+
+
+class PrefixedTextIO(io.TextIOBase):
+    """
+    Read-only text stream which returns given prefix, followed by the rest of another stream
+
+    This is used to "unread" the beginning of a non-seekable file (like a pipe),
+    eg. after reading a fragment of it for subtitle format autodetection.
+
+    """
+    def __init__(self, prefix: str, fp: TextIO) -> None:
+        super().__init__()
+        self._prefix: Optional[io.StringIO] = io.StringIO(prefix) if prefix else None
+        self._prefix_length = len(prefix)
+        self._fp = fp
+
+    def readable(self) -> bool:
+        return True
+
+    @property
+    def name(self) -> Any:
+        return getattr(self._fp, "name", None)
+
+    @property
+    def encoding(self) -> Any:  # type: ignore[override]
+        return getattr(self._fp, "encoding", None)
 
-def etree_iter_child_nodes(elem: ET.Element) -> Iterator[Union[ET.Element, str]]:
+    @property
+    def errors(self) -> Any:  # type: ignore[override]
+        return getattr(self._fp, "errors", None)
+
+    def read(self, size: Optional[int] = -1, /) -> str:
+        if self._prefix is None:
+            return self._fp.read(-1 if size is None else size)
+
+        if size is None or size < 0:
+            data = self._prefix.read() + self._fp.read()
+        else:
+            data = self._prefix.read(size)
+            if len(data) < size:
+                data += self._fp.read(size - len(data))
+
+        self._release_prefix()
+        return data
+
+    def readline(self, size: int = -1, /) -> str:  # type: ignore[override]
+        if self._prefix is None:
+            return self._fp.readline(size)
+
+        if size < 0:
+            line = self._prefix.readline()
+            if not line.endswith("\n"):
+                # line was split between prefix and the rest of the stream
+                line += self._fp.readline()
+        else:
+            line = self._prefix.readline(size)
+            if len(line) < size and not line.endswith("\n"):
+                line += self._fp.readline(size - len(line))
+
+        self._release_prefix()
+        return line
+
+    def _release_prefix(self) -> None:
+        if self._prefix is not None and self._prefix.tell() == self._prefix_length:
+            self._prefix = None
+
+
+def etree_iter_child_nodes(elem: "ET.Element") -> Iterator[Union["ET.Element", str]]:
     """
     Yield child text nodes (as str) and subelements for given XML element
 
@@ -86,7 +179,7 @@ def etree_iter_child_nodes(elem: ET.Element) -> Iterator[Union[ET.Element, str]]
             yield child_elem.tail
 
 
-def etree_append_child_nodes(elem: ET.Element, nodes: Iterable[Union[ET.Element, str]]) -> None:
+def etree_append_child_nodes(elem: "ET.Element", nodes: Iterable[Union["ET.Element", str]]) -> None:
     """
     Add child text nodes and subelements to given XML element
 
@@ -120,6 +213,8 @@ def etree_register_namespace_override() -> Iterator[None]:
     Workaround for poor namespace handling in ``xml.etree.ElementTree``.
 
     """
+    import xml.etree.ElementTree as ET
+
     namespace_map: Optional[dict[str, str]] = None
     namespace_map_original_content = {}
     try:
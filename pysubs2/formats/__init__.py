@@ -1,18 +1,74 @@
-from typing import Type
-
-from .base import FormatBase
-from .microdvd import MicroDVDFormat
-from .sami import SAMIFormat
-from .subrip import SubripFormat
-from .jsonformat import JSONFormat
-from .substation import SubstationFormat
-from .mpl2 import MPL2Format
-from .tmp import TmpFormat
-from .ttml import TTMLFormat
-from .webvtt import WebVTTFormat
-from .whisper import WhisperJAXFormat
+import importlib
+from typing import Type, Iterator, Union, Any, MutableMapping, TYPE_CHECKING
+
+from .base import FormatBase, FormatWriter as FormatWriter
+from .autodetect import FormatGuess, detect_builtin_formats, CONFIDENCE_LINE
 from ..exceptions import UnknownFormatIdentifierError, UnknownFileExtensionError, FormatAutodetectionError
 
+if TYPE_CHECKING:
+    from .microdvd import MicroDVDFormat as MicroDVDFormat
+    from .sami import SAMIFormat as SAMIFormat
+    from .subrip import SubripFormat as SubripFormat
+    from .jsonformat import JSONFormat as JSONFormat
+    from .substation import SubstationFormat as SubstationFormat
+    from .mpl2 import MPL2Format as MPL2Format
+    from .tmp import TmpFormat as TmpFormat
+    from .ttml import TTMLFormat as TTMLFormat
+    from .webvtt import WebVTTFormat as WebVTTFormat
+    from .whisper import WhisperJAXFormat as WhisperJAXFormat
+
+
+class FormatRegistry(MutableMapping[str, Type[FormatBase]]):
+    """
+    Dict-like mapping of format identifiers to format classes, which imports the classes on first use.
+
+    Built-in formats are registered as ``"module:ClassName"`` strings, so that ``import pysubs2``
+    does not have to import all format modules (and their dependencies like ``xml.etree``).
+    The class is imported when it is looked up for the first time. Other formats can be added
+    as classes, like to a regular dict.
+
+    """
+    def __init__(self, builtin_formats: dict[str, str]) -> None:
+        self._builtin_formats = dict(builtin_formats)
+        self._entries: dict[str, Union[str, Type[FormatBase]]] = dict(builtin_formats)
+
+    def __getitem__(self, identifier: str) -> Type[FormatBase]:
+        entry = self._entries[identifier]
+        if isinstance(entry, str):
+            module_name, _, class_name = entry.partition(":")
+            cls: Type[FormatBase] = getattr(importlib.import_module(module_name), class_name)
+            self._entries[identifier] = entry = cls
+        return entry
+
+    def __setitem__(self, identifier: str, cls: Type[FormatBase]) -> None:
+        self._entries[identifier] = cls
+
+    def __delitem__(self, identifier: str) -> None:
+        del self._entries[identifier]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, identifier: object) -> bool:
+        return identifier in self._entries
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} {list(self._entries)!r}>"
+
+    def is_builtin(self, identifier: str) -> bool:
+        """Whether identifier refers to the built-in implementation (without importing it)."""
+        entry = self._entries.get(identifier)
+        spec = self._builtin_formats.get(identifier)
+        if entry is None or spec is None:
+            return False
+        elif isinstance(entry, str):
+            return entry == spec
+        else:
+            return f"{entry.__module__}:{entry.__qualname__}" == spec
+
 
 #: Dict mapping file extensions to format identifiers.
 FILE_EXTENSION_TO_FORMAT_IDENTIFIER: dict[str, str] = {
@@ -28,23 +84,41 @@ FILE_EXTENSION_TO_FORMAT_IDENTIFIER: dict[str, str] = {
     ".ttml": "ttml",
 }
 
-#: Dict mapping format identifiers to implementations (FormatBase subclasses).
-FORMAT_IDENTIFIER_TO_FORMAT_CLASS: dict[str, Type[FormatBase]] = {
-    "srt": SubripFormat,
-    "ass": SubstationFormat,
-    "ssa": SubstationFormat,
-    "microdvd": MicroDVDFormat,
-    "json": JSONFormat,
-    "mpl2": MPL2Format,
-    "tmp": TmpFormat,
-    "vtt": WebVTTFormat,
-    "sami": SAMIFormat,
-    "whisper_jax": WhisperJAXFormat,
-    "ttml": TTMLFormat,
+#: Dict-like mapping of format identifiers to implementations (FormatBase subclasses),
+#: see :class:`FormatRegistry`. Classes are imported on first use.
+FORMAT_IDENTIFIER_TO_FORMAT_CLASS = FormatRegistry({
+    "srt": "pysubs2.formats.subrip:SubripFormat",
+    "ass": "pysubs2.formats.substation:SubstationFormat",
+    "ssa": "pysubs2.formats.substation:SubstationFormat",
+    "microdvd": "pysubs2.formats.microdvd:MicroDVDFormat",
+    "json": "pysubs2.formats.jsonformat:JSONFormat",
+    "mpl2": "pysubs2.formats.mpl2:MPL2Format",
+    "tmp": "pysubs2.formats.tmp:TmpFormat",
+    "vtt": "pysubs2.formats.webvtt:WebVTTFormat",
+    "sami": "pysubs2.formats.sami:SAMIFormat",
+    "whisper_jax": "pysubs2.formats.whisper:WhisperJAXFormat",
+    "ttml": "pysubs2.formats.ttml:TTMLFormat",
+})
+
+#: Format classes which can be imported from this package, see :func:`__getattr__()`.
+_LAZY_FORMAT_CLASSES = {
+    "MicroDVDFormat": "microdvd",
+    "SAMIFormat": "sami",
+    "SubripFormat": "srt",
+    "JSONFormat": "json",
+    "SubstationFormat": "ass",
+    "MPL2Format": "mpl2",
+    "TmpFormat": "tmp",
+    "TTMLFormat": "ttml",
+    "WebVTTFormat": "vtt",
+    "WhisperJAXFormat": "whisper_jax",
 }
 
 FORMAT_IDENTIFIERS = list(FORMAT_IDENTIFIER_TO_FORMAT_CLASS.keys())
 
+_SUBMODULES = frozenset({"microdvd", "sami", "subrip", "jsonformat", "substation", "mpl2", "tmp", "ttml", "webvtt",
+                         "whisper"})
+
 
 def get_format_class(format_: str) -> Type[FormatBase]:
     """Format identifier -> format class (ie. subclass of FormatBase)"""
@@ -74,17 +148,44 @@ def get_file_extension(format_: str) -> str:
     raise RuntimeError(f"No file extension for format {format_!r}")
 
 
+def detect_formats(content: str) -> list[FormatGuess]:
+    """
+    Return formats matching given fragment, sorted by decreasing confidence.
+
+    Built-in formats are checked in a single pass over the fragment
+    (see :func:`pysubs2.formats.autodetect.detect_builtin_formats()`),
+    other registered formats are asked via :meth:`FormatBase.guess_format()`.
+    Only the format modules needed for this are imported.
+
+    """
+    registry = FORMAT_IDENTIFIER_TO_FORMAT_CLASS
+    builtin_identifiers = {f for f in registry if registry.is_builtin(f)}
+    guesses = detect_builtin_formats(content, builtin_identifiers)
+
+    other_classes = {registry[f] for f in registry if f not in builtin_identifiers}
+    for impl in other_classes:
+        guess = impl.guess_format(content)
+        if guess is not None and all(guess != g.format for g in guesses):
+            guesses.append(FormatGuess(guess, CONFIDENCE_LINE))
+
+    guesses.sort(key=lambda g: -g.confidence)
+    return guesses
+
+
 def autodetect_format(content: str) -> str:
     """Return format identifier for given fragment or raise FormatAutodetectionError."""
-    formats = set()
-    for impl in FORMAT_IDENTIFIER_TO_FORMAT_CLASS.values():
-        guess = impl.guess_format(content)
-        if guess is not None:
-            formats.add(guess)
+    formats = [guess.format for guess in detect_formats(content)]
 
     if len(formats) == 1:
-        return formats.pop()
-    elif not formats:
-        raise FormatAutodetectionError(content=content, formats=[])
+        return formats[0]
     else:
-        raise FormatAutodetectionError(content=content, formats=list(formats))
+        raise FormatAutodetectionError(content=content, formats=formats)
+
+
+def __getattr__(name: str) -> Any:
+    # format classes and submodules used to be imported eagerly, keep them accessible
+    if name in _LAZY_FORMAT_CLASSES:
+        return FORMAT_IDENTIFIER_TO_FORMAT_CLASS[_LAZY_FORMAT_CLASSES[name]]
+    if name in _SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,113 @@
+"""
+Single-pass format autodetection for the built-in subtitle formats
+
+Calling :meth:`FormatBase.guess_format()` of every format means splitting and scanning the same
+file fragment several times. Here, all built-in format signatures are checked in one pass over
+the fragment. The logic mirrors the ``guess_format()`` implementations of the individual formats
+(which are still used for formats not known to this module, eg. custom ones).
+
+Formats are referred to by identifier, so that autodetection does not need to import
+format modules with heavy dependencies (SAMI, TTML, JSON).
+
+"""
+import re
+from typing import NamedTuple, Collection
+
+from .microdvd import MICRODVD_LINE
+from .mpl2 import MPL2_FORMAT
+from .subrip import SubripFormat
+from .tmp import TMP_LINE
+from .whisper import WhisperJAXFormat
+
+
+class FormatGuess(NamedTuple):
+    """Format identifier detected in file fragment, with confidence from 0 to 1."""
+    format: str
+    confidence: float
+
+
+#: Confidence of guess based on unambiguous signature, eg. ``[V4+ Styles]`` or ``WEBVTT`` header.
+CONFIDENCE_SIGNATURE = 1.0
+
+#: Confidence of guess based on finding a line which looks like the format, eg. SubRip timestamp line.
+CONFIDENCE_LINE = 0.5
+
+#: Format identifiers handled by :func:`detect_builtin_formats()`.
+BUILTIN_FORMAT_IDENTIFIERS: frozenset[str] = frozenset({
+    "ass", "ssa", "srt", "vtt", "microdvd", "json", "mpl2", "tmp", "sami", "ttml", "whisper_jax",
+})
+
+STYLES_HEADING = re.compile(r"V4(\+?) Styles", re.IGNORECASE)
+ASS_STYLES_HEADING = re.compile(r"V4\+ Styles", re.IGNORECASE)
+FIRST_LINE = re.compile(r"[^\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]*")
+TTML_NAMESPACE = "http://www.w3.org/ns/ttml"
+
+
+def detect_builtin_formats(text: str, formats: Collection[str] = BUILTIN_FORMAT_IDENTIFIERS) -> list[FormatGuess]:
+    """
+    Return formats matching given fragment, sorted by decreasing confidence.
+
+    Arguments:
+        text: Content of subtitle file, or its first few thousand characters.
+        formats: Format identifiers to consider, identifiers not in :data:`BUILTIN_FORMAT_IDENTIFIERS` are ignored.
+
+    Returns:
+        List of :class:`FormatGuess`, empty when no format matches.
+
+    """
+    guesses: list[FormatGuess] = []
+
+    lstripped_text = text.lstrip()
+    has_ssa_header = "[Script Info]" in text or "[V4+ Styles]" in text
+    has_ttml_namespace = TTML_NAMESPACE in text
+    has_webvtt_header = lstripped_text.startswith("WEBVTT")
+
+    # formats with signature
+    if "ass" in formats or "ssa" in formats:
+        m = STYLES_HEADING.search(text)
+        if m is not None:
+            if m.group(1) or ASS_STYLES_HEADING.search(text, m.end()):
+                if "ass" in formats:
+                    guesses.append(FormatGuess("ass", CONFIDENCE_SIGNATURE))
+            elif "ssa" in formats:
+                guesses.append(FormatGuess("ssa", CONFIDENCE_SIGNATURE))
+    if "vtt" in formats and has_webvtt_header:
+        guesses.append(FormatGuess("vtt", CONFIDENCE_SIGNATURE))
+    if "ttml" in formats and has_ttml_namespace:
+        guesses.append(FormatGuess("ttml", CONFIDENCE_SIGNATURE))
+    if "sami" in formats and lstripped_text.startswith("<SAMI>"):
+        guesses.append(FormatGuess("sami", CONFIDENCE_SIGNATURE))
+    if "json" in formats and text.startswith("{\"") and "\"info\":" in text:
+        guesses.append(FormatGuess("json", CONFIDENCE_SIGNATURE))
+    if "whisper_jax" in formats:
+        m = FIRST_LINE.match(lstripped_text)
+        if m is not None and m.group(0) and WhisperJAXFormat.parse_line(m.group(0)):
+            guesses.append(FormatGuess("whisper_jax", CONFIDENCE_SIGNATURE))
+
+    # line-based formats
+    if "mpl2" in formats and MPL2_FORMAT.search(text):
+        guesses.append(FormatGuess("mpl2", CONFIDENCE_LINE))
+
+    check_srt = "srt" in formats and not (has_ssa_header or has_webvtt_header or has_ttml_namespace)
+    check_tmp = "tmp" in formats and not has_ssa_header
+    check_microdvd = "microdvd" in formats
+
+    if check_srt or check_tmp or check_microdvd:
+        for line in text.splitlines():
+            # two SubRip timestamps contain at least four colons, skip the regex otherwise
+            if check_srt and line.count(":") >= 4 and len(SubripFormat.TIMESTAMP.findall(line)) == 2:
+                guesses.append(FormatGuess("srt", CONFIDENCE_LINE))
+                check_srt = False
+            # TMP line starts with "H:MM:SS:" or "HH:MM:SS:", skip the regex if there is no colon at these positions
+            if check_tmp and ":" in line[7:9] and TMP_LINE.match(line) and len(TMP_LINE.findall(line)) == 1:
+                guesses.append(FormatGuess("tmp", CONFIDENCE_LINE))
+                check_tmp = False
+            # MicroDVD line starts with "{", possibly preceded by spaces
+            if check_microdvd and line.lstrip(" ").startswith("{") and MICRODVD_LINE.match(line):
+                guesses.append(FormatGuess("microdvd", CONFIDENCE_LINE))
+                check_microdvd = False
+            if not (check_srt or check_tmp or check_microdvd):
+                break
+
+    guesses.sort(key=lambda guess: -guess.confidence)
+    return guesses
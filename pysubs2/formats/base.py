@@ -1,5 +1,6 @@
-from typing import Optional, Any, TextIO
+from typing import Optional, Any, TextIO, Iterator
 from ..ssafile import SSAFile
+from ..ssaevent import SSAEvent
 
 
 class FormatBase:
@@ -40,6 +41,32 @@ class FormatBase:
         """
         raise NotImplementedError("Parsing is not supported for this format")
 
+    @classmethod
+    def iter_events(cls, subs: "SSAFile", fp: TextIO, format_: str, **kwargs: Any) -> Iterator[SSAEvent]:
+        """
+        Load subtitle file into an empty SSAFile, yielding events instead of storing them.
+
+        Everything except the events (ie. :attr:`SSAFile.info`, :attr:`SSAFile.styles`, etc.)
+        is stored in ``subs`` as in :meth:`FormatBase.from_file()`; ``subs.events`` is left empty.
+
+        The default implementation reads the whole file using :meth:`FormatBase.from_file()`
+        and then yields the events. Formats which can be read incrementally override this method
+        so that memory usage does not grow with the number of events.
+
+        Arguments:
+            subs (SSAFile): An empty :class:`SSAFile`.
+            fp (file object): Text file object, the subtitle file.
+            format_ (str): Format identifier.
+            kwargs: Extra options, eg. `fps`.
+
+        Yields:
+            :class:`SSAEvent` instances in file order.
+
+        """
+        cls.from_file(subs, fp, format_, **kwargs)
+        events, subs.events = subs.events, []
+        yield from events
+
     @classmethod
     def to_file(cls, subs: "SSAFile", fp: TextIO, format_: str, **kwargs: Any) -> None:
         """
@@ -65,6 +92,28 @@ class FormatBase:
         """
         raise NotImplementedError("Writing is not supported for this format")
 
+    @classmethod
+    def get_writer(cls, fp: TextIO, format_: str, subs: "SSAFile", **kwargs: Any) -> "FormatWriter":
+        """
+        Create incremental writer, see :class:`FormatWriter`.
+
+        Arguments:
+            fp (file object): Text file object used as output.
+            format_ (str): Format identifier of desired output format.
+            subs (SSAFile): Subtitle file with header data (styles, info, etc.)
+                to be used for output. Its events are not written.
+            kwargs: Extra options, the same as for :meth:`FormatBase.to_file()`.
+
+        Returns:
+            FormatWriter
+
+        Raises:
+            NotImplementedError: The format does not support incremental writing.
+            pysubs2.exceptions.UnknownFPSError: Framerate was not provided and
+                ``subs.fps is None``.
+        """
+        raise NotImplementedError("Incremental writing is not supported for this format")
+
     @classmethod
     def guess_format(cls, text: str) -> Optional[str]:
         """
@@ -78,3 +127,87 @@ class FormatBase:
             format identifier (eg. ``"srt"``) or None (unknown format)
         """
         return None
+
+
+class FormatWriter:
+    """
+    Base class for incremental subtitle writers.
+
+    Unlike :meth:`FormatBase.to_file()`, which needs a fully populated :class:`SSAFile`,
+    a writer lets you output subtitles one at a time, so that memory usage does not grow
+    with the number of events (the output may be a pipe or a socket). Writers are obtained
+    from :meth:`FormatBase.get_writer()`, or more conveniently, :meth:`SSAFile.writer()`
+    and :meth:`SSAFile.open_writer()`.
+
+    Example::
+
+        with subs.open_writer("output.srt") as writer:
+            for e in generate_subtitles():
+                writer.write_event(e)
+
+    Writers may be used as context managers, which calls :meth:`FormatWriter.close()` on exit.
+
+    Attributes:
+        fp: Text file object used as output.
+        format_: Format identifier of output format.
+        subs: :class:`SSAFile` with header data (styles, info, etc.); its events are ignored.
+        fps: Framerate, if applicable.
+        close_fp: When true, :meth:`FormatWriter.close()` also closes ``fp``.
+
+    """
+    def __init__(self, fp: TextIO, format_: str, subs: "SSAFile", fps: Optional[float] = None,
+                 **kwargs: Any) -> None:
+        self.fp = fp
+        self.format_ = format_
+        self.subs = subs
+        self.fps = fps
+        self.close_fp = False
+        self.header_written = False
+        self.closed = False
+
+    def write_header(self) -> None:
+        """
+        Write file header, if it has not been written yet.
+
+        This is called automatically by :meth:`FormatWriter.write_event()`
+        and :meth:`FormatWriter.close()`, so you don't have to call it yourself.
+        """
+        if not self.header_written:
+            self.header_written = True
+            self._write_header()
+
+    def write_event(self, event: SSAEvent) -> None:
+        """
+        Write one subtitle.
+
+        Events which cannot be represented in the output format (eg. comments in SubRip) are skipped.
+        """
+        if self.closed:
+            raise ValueError("Cannot write to closed writer")
+        self.write_header()
+        self._write_event(event)
+
+    def close(self) -> None:
+        """Finish writing the file (and close the file object if ``close_fp`` is set)."""
+        if self.closed:
+            return
+        self.write_header()
+        self._write_footer()
+        self.closed = True
+        if self.close_fp:
+            self.fp.close()
+
+    def _write_header(self) -> None:
+        pass
+
+    def _write_event(self, event: SSAEvent) -> None:
+        raise NotImplementedError
+
+    def _write_footer(self) -> None:
+        pass
+
+    def __enter__(self) -> "FormatWriter":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
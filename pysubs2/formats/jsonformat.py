@@ -1,5 +1,6 @@
 import dataclasses
 import json
+import sys
 from typing import Any, Optional, TextIO
 
 from ..common import Color
@@ -50,7 +51,16 @@ class JSONFormat(FormatBase):
                 else:
                     setattr(sty, k, v)
 
-        subs.events = [SSAEvent(**fields) for fields in data["events"]]
+        subs.events = [SSAEvent(**cls.intern_fields(fields)) for fields in data["events"]]
+
+    @staticmethod
+    def intern_fields(fields: dict[str, Any]) -> dict[str, Any]:
+        """Share string objects of low-cardinality event fields (style name, etc.)"""
+        for k in ("style", "name", "effect", "type"):
+            v = fields.get(k)
+            if isinstance(v, str):
+                fields[k] = sys.intern(v)
+        return fields
 
     @classmethod
     def to_file(cls, subs: "SSAFile", fp: TextIO, format_: str, **kwargs: Any) -> None:
@@ -5,8 +5,8 @@ from typing import Optional, TextIO, Any, Match
 from ..exceptions import UnknownFPSError
 from ..ssaevent import SSAEvent
 from ..ssastyle import SSAStyle
-from .base import FormatBase
-from .substation import parse_tags
+from .base import FormatBase, FormatWriter
+from .substation import parse_tags, parse_event_tags
 from ..time import ms_to_frames, frames_to_ms
 from ..ssafile import SSAFile
 
@@ -103,43 +103,79 @@ class MicroDVDFormat(FormatBase):
             apply_styles: If False, do not write any styling.
 
         """
+        with cls.get_writer(fp, format_, subs, fps=fps, write_fps_declaration=write_fps_declaration,
+                            apply_styles=apply_styles, **kwargs) as writer:
+            for line in subs:
+                writer.write_event(line)
+
+    @classmethod
+    def get_writer(cls, fp: TextIO, format_: str, subs: "SSAFile", **kwargs: Any) -> "MicroDVDWriter":
+        """
+        See :meth:`pysubs2.formats.FormatBase.get_writer()`
+
+        Supports the same keyword args as :meth:`MicroDVDFormat.to_file()`.
+        """
+        return MicroDVDWriter(fp, format_, subs, **kwargs)
+
+
+class MicroDVDWriter(FormatWriter):
+    """Incremental writer for MicroDVD, see :meth:`MicroDVDFormat.get_writer()`"""
+    fps: float
+
+    def __init__(self, fp: TextIO, format_: str, subs: "SSAFile", fps: Optional[float] = None,
+                 write_fps_declaration: bool = True, apply_styles: bool = True, **kwargs: Any) -> None:
         if fps is None:
             fps = subs.fps
 
         if fps is None:
             raise UnknownFPSError("Framerate must be specified when writing MicroDVD.")
-        to_frames = partial(ms_to_frames, fps=fps)
-
-        def is_entirely_italic(line: SSAEvent) -> bool:
-            style = subs.styles.get(line.style, SSAStyle.DEFAULT_STYLE)
-            for fragment, sty in parse_tags(line.text, style, subs.styles):
-                fragment = fragment.replace(r"\h", " ")
-                fragment = fragment.replace(r"\n", "\n")
-                fragment = fragment.replace(r"\N", "\n")
-                if not sty.italic and fragment and not fragment.isspace():
-                    return False
-            return True
 
+        super().__init__(fp, format_, subs, fps)
+        self.write_fps_declaration = write_fps_declaration
+        self.apply_styles = apply_styles
+
+    def is_entirely_italic(self, line: SSAEvent) -> bool:
+        style = self.subs.styles.get(line.style, SSAStyle.DEFAULT_STYLE)
+        return self._is_entirely_italic(parse_tags(line.text, style, self.subs.styles))
+
+    @staticmethod
+    def _is_entirely_italic(fragments: list[tuple[str, SSAStyle]]) -> bool:
+        for fragment, sty in fragments:
+            fragment = fragment.replace(r"\h", " ")
+            fragment = fragment.replace(r"\n", "\n")
+            fragment = fragment.replace(r"\N", "\n")
+            if not sty.italic and fragment and not fragment.isspace():
+                return False
+        return True
+
+    def _write_header(self) -> None:
         # Write an artificial first line declaring the framerate. The reader
         # identifies it by the literal {1}{1} frame markers (see the
         # strict_fps_inference check in from_file), so emit them directly.
         # Routing a placeholder event through to_frames() instead would
         # convert its 1 ms start/end to frame 0 for any realistic fps, writing
         # an unreadable {0}{0} line (it only worked for fps == 1000).
-        if write_fps_declaration:
-            print("{1}{1}%s" % fps, file=fp)
-
-        for line in subs.get_text_events():
-            text = "|".join(line.plaintext.splitlines())
-            if apply_styles and is_entirely_italic(line):
-                text = "{Y:i}" + text
-
-            start, end = map(to_frames, (line.start, line.end))
-
-            # XXX warn on underflow?
-            if start < 0:
-                start = 0
-            if end < 0:
-                end = 0
-
-            print("{%d}{%d}%s" % (start, end, text), file=fp)
+        if self.write_fps_declaration:
+            print("{1}{1}%s" % self.fps, file=self.fp)
+
+    def _write_event(self, event: SSAEvent) -> None:
+        fragments = parse_event_tags(event, self.subs.styles)
+        if fragments is None:
+            return
+
+        # same as SSAEvent.plaintext, the fragments are the text without override sequences
+        text = "".join(fragment for fragment, _ in fragments)
+        text = text.replace(r"\h", " ").replace(r"\n", "\n").replace(r"\N", "\n")
+        text = "|".join(text.splitlines())
+        if self.apply_styles and self._is_entirely_italic(fragments):
+            text = "{Y:i}" + text
+
+        start, end = (ms_to_frames(ms, self.fps) for ms in (event.start, event.end))
+
+        # XXX warn on underflow?
+        if start < 0:
+            start = 0
+        if end < 0:
+            end = 0
+
+        print("{%d}{%d}%s" % (start, end, text), file=self.fp)
@@ -1,5 +1,5 @@
 import re
-from typing import Optional, Any, TextIO
+from typing import Iterator, Optional, Any, TextIO
 from ..time import times_to_ms
 from .base import FormatBase
 from ..ssaevent import SSAEvent
@@ -23,6 +23,16 @@ class MPL2Format(FormatBase):
     @classmethod
     def from_file(cls, subs: "SSAFile", fp: TextIO, format_: str, **kwargs: Any) -> None:
         """See :meth:`pysubs2.formats.FormatBase.from_file()`"""
+        subs.events.extend(cls.iter_events(subs, fp, format_, **kwargs))
+
+    @classmethod
+    def iter_events(cls, subs: "SSAFile", fp: TextIO, format_: str, **kwargs: Any) -> Iterator[SSAEvent]:
+        """
+        See :meth:`pysubs2.formats.FormatBase.iter_events()`
+
+        The file is read line by line and each subtitle is yielded as soon as its line is read.
+
+        """
         def prepare_text(lines: str) -> str:
             out = []
             for s in lines.split("|"):
@@ -35,14 +45,17 @@ class MPL2Format(FormatBase):
                 out.append(s)
             return "\\N".join(out)
 
-        text = fp.read()
-        for start, end, text in MPL2_FORMAT.findall(text):
-            e = SSAEvent(
+        for line in fp:
+            match = MPL2_FORMAT.match(line)
+            if not match:
+                continue
+
+            start, end, text = match.groups()
+            yield SSAEvent(
                 start=times_to_ms(s=float(start) / 10),
                 end=times_to_ms(s=float(end) / 10),
                 text=prepare_text(text)
             )
-            subs.append(e)
 
     @classmethod
     def to_file(cls, subs: "SSAFile", fp: TextIO, format_: str, **kwargs: Any) -> None:
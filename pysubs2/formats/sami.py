@@ -1,12 +1,16 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from html.parser import HTMLParser
-from typing import Optional, TextIO, Any
+from typing import Iterator, Optional, TextIO, Any
 
 from .base import FormatBase
 from ..ssaevent import SSAEvent
 from ..ssafile import SSAFile
 
 
+#: Size of chunks (in characters) in which SAMI files are read and fed to the parser.
+SAMI_CHUNK_SIZE = 64 * 1024
+
+
 class SAMIFormat(FormatBase):
     """Synchronized Accessible Media Interchange (SAMI) subtitle format implementation"""
 
@@ -34,34 +38,57 @@ class SAMIFormat(FormatBase):
         CSS formatting is not supported.
 
         """
-        parser = SAMIParser()
-        parser.feed(fp.read())
+        subs.events.extend(cls.iter_events(subs, fp, format_, **kwargs))
 
-        events = []
-        for sync_element in parser.sync_elements:
-            plaintext = "\n".join(line.strip() for line in sync_element.text.strip().splitlines())
-            start_ms = sync_element.start_ms
-            # Unfortunately, end timestamp is not given; try to estimate something reasonable:
-            # start + 500 ms + 67 ms/character (15 chars per second)
-            end_ms = start_ms + 500 + (len(plaintext) * 67)
-            event = SSAEvent(
-                start=start_ms,
-                end=end_ms,
-            )
-            event.plaintext = plaintext
-            events.append(event)
+    @classmethod
+    def iter_events(cls, subs: "SSAFile", fp: TextIO, format_: str, **kwargs: Any) -> Iterator[SSAEvent]:
+        """
+        See :meth:`pysubs2.formats.FormatBase.iter_events()`
 
-        # correct any overlapping subtitles
-        for i in range(len(events) - 1):
-            events[i].end = min(events[i].end, events[i + 1].start)
+        The file is fed to the parser in chunks and each event is yielded as soon as
+        the following ``<SYNC>`` element starts (which gives its end time), so that memory
+        usage does not depend on the size of the file.
 
-        subs.events.extend(events)
+        """
+        parser = SAMIParser()
+        previous_event: Optional[SSAEvent] = None
+        while chunk := fp.read(SAMI_CHUNK_SIZE):
+            parser.feed(chunk)
+            for sync_element in parser.sync_elements:
+                event = cls.sync_element_to_event(sync_element)
+                if previous_event is not None:
+                    # correct any overlapping subtitles
+                    previous_event.end = min(previous_event.end, event.start)
+                    yield previous_event
+                previous_event = event
+            parser.sync_elements.clear()
+
+        if previous_event is not None:
+            yield previous_event
+
+    @staticmethod
+    def sync_element_to_event(sync_element: "SyncElement") -> SSAEvent:
+        plaintext = "\n".join(line.strip() for line in sync_element.text.strip().splitlines())
+        start_ms = sync_element.start_ms
+        # Unfortunately, end timestamp is not given; try to estimate something reasonable:
+        # start + 500 ms + 67 ms/character (15 chars per second)
+        end_ms = start_ms + 500 + (len(plaintext) * 67)
+        event = SSAEvent(
+            start=start_ms,
+            end=end_ms,
+        )
+        event.plaintext = plaintext
+        return event
 
 
 @dataclass
 class SyncElement:
     start_ms: int
-    text: str
+    fragments: list[str] = field(default_factory=list)
+
+    @property
+    def text(self) -> str:
+        return "".join(self.fragments)
 
 
 class SAMIParser(HTMLParser):
@@ -73,7 +100,7 @@ class SAMIParser(HTMLParser):
     def begin_sync_element(self, start_ms: int) -> None:
         if self.current_sync_element is not None:
             self.close_sync_element()
-        self.current_sync_element = SyncElement(start_ms=start_ms, text="")
+        self.current_sync_element = SyncElement(start_ms=start_ms)
 
     def close_sync_element(self) -> None:
         if self.current_sync_element is not None:
@@ -82,7 +109,7 @@ class SAMIParser(HTMLParser):
 
     def append_text(self, text: str) -> None:
         if self.current_sync_element is not None:
-            self.current_sync_element.text += text
+            self.current_sync_element.fragments.append(text)
 
     def handle_starttag(self, tag: str, attrs: list[tuple[str, Optional[str]]]) -> None:
         if tag == "sync":
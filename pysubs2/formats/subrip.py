@@ -1,11 +1,11 @@
 import re
 import warnings
-from typing import Sequence, Optional, TextIO, Any
+from typing import Sequence, Optional, TextIO, Any, Iterable, ClassVar, Iterator
 
-from .base import FormatBase
+from .base import FormatBase, FormatWriter
 from ..ssaevent import SSAEvent
 from ..ssastyle import SSAStyle
-from .substation import parse_tags
+from .substation import parse_tags, parse_event_tags
 from ..time import ms_to_times, make_time, TIMESTAMP, timestamp_to_ms
 from ..ssafile import SSAFile
 
@@ -13,11 +13,34 @@ from ..ssafile import SSAFile
 #: Largest timestamp allowed in SubRip, ie. 99:59:59,999.
 MAX_REPRESENTABLE_TIME = make_time(h=100) - 1
 
+#: Supported HTML tags (``<i>``, ``</i>``, etc.) and other HTML tags, in one pattern for a single pass over text.
+HTML_TAG = re.compile(r"< *(/?) *([ibsu]) *>|< */? *[a-zA-Z][^>]*>")
+
+#: Supported HTML tags only, used when other HTML tags are kept.
+SUPPORTED_HTML_TAG = re.compile(r"< *(/?) *([ibsu]) *>")
+
+#: Unknown HTML tag, as stripped in the original multi-pass implementation.
+UNKNOWN_HTML_TAG = re.compile(r"< */? *[a-zA-Z][^>]*>")
+
+#: Number of the next subtitle at the end of text, when there is no blank line before it.
+TRAILING_NUMBER = re.compile(r"\n+ *\d+ *$")
+
+#: SubStation equivalents of supported HTML tags.
+HTML_TAG_TO_SSA_TAG = {
+    slash + tag: f"{{\\{tag}{0 if slash else 1}}}"
+    for slash in ("", "/")
+    for tag in "ibsu"
+}
+
 
 class SubripFormat(FormatBase):
     """SubRip Text (SRT) subtitle format implementation"""
     TIMESTAMP = TIMESTAMP
 
+    #: Smallest number of colons in a line with two ``TIMESTAMP`` matches, lines with fewer colons
+    #: are not checked with the regex (subclasses with different ``TIMESTAMP`` should update this).
+    TIMESTAMP_LINE_MIN_COLONS: ClassVar[int] = 4
+
     @staticmethod
     def ms_to_timestamp(ms: int) -> str:
         """Convert ms to 'HH:MM:SS,mmm'"""
@@ -77,47 +100,65 @@ class SubripFormat(FormatBase):
                 If False, these other HTML tags will be stripped from output
                 (in the previous example, you would get only ``example {\\i1}text{\\i0}``).
         """
-        timestamps: list[tuple[int, int]] = [] # (start, end)
-        following_lines: list[list[str]] = [] # contains lists of lines following each timestamp
+        subs.events.extend(cls.iter_events(subs, fp, format_, keep_html_tags=keep_html_tags,
+                                           keep_unknown_html_tags=keep_unknown_html_tags, **kwargs))
+
+    @classmethod
+    def iter_events(cls, subs: "SSAFile", fp: TextIO, format_: str, keep_html_tags: bool = False,
+                    keep_unknown_html_tags: bool = False, **kwargs: Any) -> Iterator[SSAEvent]:
+        """
+        See :meth:`pysubs2.formats.FormatBase.iter_events()`
+
+        Subtitles are read in a single pass and yielded one by one, each when the timestamp line
+        of the next subtitle (or end of file) is reached. Supports the same keyword args
+        as :meth:`SubripFormat.from_file()`.
+
+        """
+        timestamp_regex = cls.TIMESTAMP
+        min_colons = cls.TIMESTAMP_LINE_MIN_COLONS
+        stamp_to_ms = cls.timestamp_to_ms
+
+        start = end = 0
+        lines: Optional[list[str]] = None  # lines following the last timestamp line
 
         for line in fp:
-            stamps = cls.TIMESTAMP.findall(line)
-            if len(stamps) == 2: # timestamp line
-                start, end = map(cls.timestamp_to_ms, stamps)
-                timestamps.append((start, end))
-                following_lines.append([])
+            # a timestamp line has exactly two timestamps, skip the regex if there are not enough colons
+            if line.count(":") >= min_colons:
+                stamps = timestamp_regex.findall(line)
+                if len(stamps) == 2:
+                    if lines is not None:
+                        yield SSAEvent(start=start, end=end,
+                                       text=cls._prepare_text(lines, keep_html_tags, keep_unknown_html_tags))
+                    start, end = map(stamp_to_ms, stamps)
+                    lines = []
+                    continue
+            if lines is not None:
+                lines.append(line)
+
+        if lines is not None:
+            yield SSAEvent(start=start, end=end,
+                           text=cls._prepare_text(lines, keep_html_tags, keep_unknown_html_tags))
+
+    @staticmethod
+    def _prepare_text(lines: list[str], keep_html_tags: bool, keep_unknown_html_tags: bool) -> str:
+        """Convert lines following timestamp line to SubStation text."""
+        # Handle the "happy" empty subtitle case, which is timestamp line followed by blank line(s)
+        # followed by number line and timestamp line of the next subtitle. Fixes issue #11.
+        if (len(lines) >= 2
+                and lines[-1].strip().isdecimal()
+                and not any(line.strip() for line in lines[:-1])):
+            return ""
+
+        # Handle the general case.
+        s = "".join(lines).strip()
+        if s[-1:].isdigit():
+            s = TRAILING_NUMBER.sub("", s)  # strip number of next subtitle
+        if not keep_html_tags and "<" in s:
+            if keep_unknown_html_tags:
+                s = SUPPORTED_HTML_TAG.sub(_html_tag_to_ssa_tag, s)
             else:
-                if timestamps:
-                    following_lines[-1].append(line)
-
-        def prepare_text(lines: list[str]) -> str:
-            # Handle the "happy" empty subtitle case, which is timestamp line followed by blank line(s)
-            # followed by number line and timestamp line of the next subtitle. Fixes issue #11.
-            if (len(lines) >= 2
-                    and all(re.match(r"\s*$", line) for line in lines[:-1])
-                    and re.match(r"\s*\d+\s*$", lines[-1])):
-                return ""
-
-            # Handle the general case.
-            s = "".join(lines).strip()
-            s = re.sub(r"\n+ *\d+ *$", "", s) # strip number of next subtitle
-            if not keep_html_tags:
-                s = re.sub(r"< *i *>", r"{\\i1}", s)
-                s = re.sub(r"< */ *i *>", r"{\\i0}", s)
-                s = re.sub(r"< *s *>", r"{\\s1}", s)
-                s = re.sub(r"< */ *s *>", r"{\\s0}", s)
-                s = re.sub(r"< *u *>", r"{\\u1}", s)
-                s = re.sub(r"< */ *u *>", r"{\\u0}", s)
-                s = re.sub(r"< *b *>", r"{\\b1}", s)
-                s = re.sub(r"< */ *b *>", r"{\\b0}", s)
-            if not (keep_html_tags or keep_unknown_html_tags):
-                s = re.sub(r"< */? *[a-zA-Z][^>]*>", "", s) # strip other HTML tags
-            s = re.sub(r"\n", r"\\N", s) # convert newlines
-            return s
-
-        for (start, end), lines in zip(timestamps, following_lines):
-            e = SSAEvent(start=start, end=end, text=prepare_text(lines))
-            subs.append(e)
+                s = _convert_html_tags(s)
+        return s.replace("\n", "\\N")  # convert newlines
 
     @classmethod
     def to_file(cls, subs: "SSAFile", fp: TextIO, format_: str, apply_styles: bool = True,
@@ -143,37 +184,103 @@ class SubripFormat(FormatBase):
                 is SRT which doesn't use line styles - this shouldn't be much
                 of an issue in practice.)
         """
-        def prepare_text(text: str, style: SSAStyle) -> str:
+        with cls.get_writer(fp, format_, subs, apply_styles=apply_styles, keep_ssa_tags=keep_ssa_tags,
+                            **kwargs) as writer:
+            for line in cls._get_output_events(subs):
+                writer.write_event(line)
+
+    @classmethod
+    def get_writer(cls, fp: TextIO, format_: str, subs: "SSAFile", **kwargs: Any) -> "SubripWriter":
+        """
+        See :meth:`pysubs2.formats.FormatBase.get_writer()`
+
+        Supports the same keyword args as :meth:`SubripFormat.to_file()`.
+        """
+        return SubripWriter(fp, format_, subs, **kwargs)
+
+    @classmethod
+    def _get_output_events(cls, subs: "SSAFile") -> Iterable[SSAEvent]:
+        return subs.events
+
+
+def _html_tag_to_ssa_tag(m: re.Match[str]) -> str:
+    return HTML_TAG_TO_SSA_TAG[m.group(1) + m.group(2)]
+
+
+def _convert_html_tags(s: str) -> str:
+    """Convert supported HTML tags to SubStation tags and strip other HTML tags."""
+    nested = False
+
+    def replace(m: re.Match[str]) -> str:
+        nonlocal nested
+        if m.group(2) is not None:
+            return HTML_TAG_TO_SSA_TAG[m.group(1) + m.group(2)]
+        if "<" in m.group(0)[1:]:
+            nested = True
+        return ""
+
+    result = HTML_TAG.sub(replace, s)
+    if nested:
+        # Unknown tag containing "<", like "<font <i>". The regex stops at the first ">", while
+        # originally, supported tags were converted first and other tags were stripped afterwards.
+        # Do it in two passes, so that the output does not change for such text.
+        result = UNKNOWN_HTML_TAG.sub("", SUPPORTED_HTML_TAG.sub(_html_tag_to_ssa_tag, s))
+    return result
+
+
+class SubripWriter(FormatWriter):
+    """Incremental writer for SubRip, see :meth:`SubripFormat.get_writer()`"""
+    format_class: ClassVar[type[SubripFormat]] = SubripFormat
+
+    def __init__(self, fp: TextIO, format_: str, subs: "SSAFile", fps: Optional[float] = None,
+                 apply_styles: bool = True, keep_ssa_tags: bool = False, **kwargs: Any) -> None:
+        super().__init__(fp, format_, subs, fps)
+        self.apply_styles = apply_styles
+        self.keep_ssa_tags = keep_ssa_tags
+        self.lineno = 0
+
+    def prepare_text(self, text: str, style: SSAStyle) -> str:
+        if self.keep_ssa_tags:
             text = text.replace(r"\h", " ")
             text = text.replace(r"\n", "\n")
             text = text.replace(r"\N", "\n")
+            return re.sub("\n+", "\n", text.strip())
+        else:
+            return self.prepare_fragments(parse_tags(text, style, self.subs.styles))
 
-            body = []
-            if keep_ssa_tags:
-                body.append(text)
-            else:
-                for fragment, sty in parse_tags(text, style, subs.styles):
-                    if apply_styles:
-                        if sty.italic:
-                            fragment = f"<i>{fragment}</i>"
-                        if sty.underline:
-                            fragment = f"<u>{fragment}</u>"
-                        if sty.strikeout:
-                            fragment = f"<s>{fragment}</s>"
-                    body.append(fragment)
-
-            return re.sub("\n+", "\n", "".join(body).strip())
-
-        for lineno, line in enumerate(cls._get_visible_lines(subs), 1):
-            start = cls.ms_to_timestamp(line.start)
-            end = cls.ms_to_timestamp(line.end)
-            text = prepare_text(line.text, subs.styles.get(line.style, SSAStyle.DEFAULT_STYLE))
-
-            print(lineno, file=fp)
-            print(start, "-->", end, file=fp)
-            print(text, end="\n\n", file=fp)
-            lineno += 1
+    def prepare_fragments(self, fragments: list[tuple[str, SSAStyle]]) -> str:
+        """Convert text fragments from :func:`pysubs2.formats.substation.parse_tags()` to SubRip text."""
+        body = []
+        for fragment, sty in fragments:
+            fragment = fragment.replace(r"\h", " ")
+            fragment = fragment.replace(r"\n", "\n")
+            fragment = fragment.replace(r"\N", "\n")
+            if self.apply_styles:
+                if sty.italic:
+                    fragment = f"<i>{fragment}</i>"
+                if sty.underline:
+                    fragment = f"<u>{fragment}</u>"
+                if sty.strikeout:
+                    fragment = f"<s>{fragment}</s>"
+            body.append(fragment)
 
-    @classmethod
-    def _get_visible_lines(cls, subs: "SSAFile") -> list[SSAEvent]:
-        return subs.get_text_events()
+        return re.sub("\n+", "\n", "".join(body).strip())
+
+    def _write_event(self, event: SSAEvent) -> None:
+        if self.keep_ssa_tags:
+            if not event.is_text:
+                return
+            text = self.prepare_text(event.text, self.subs.styles.get(event.style, SSAStyle.DEFAULT_STYLE))
+        else:
+            fragments = parse_event_tags(event, self.subs.styles)
+            if fragments is None:
+                return
+            text = self.prepare_fragments(fragments)
+
+        self.lineno += 1
+        start = self.format_class.ms_to_timestamp(event.start)
+        end = self.format_class.ms_to_timestamp(event.end)
+
+        print(self.lineno, file=self.fp)
+        print(start, "-->", end, file=self.fp)
+        print(text, end="\n\n", file=self.fp)
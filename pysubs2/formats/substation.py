@@ -1,14 +1,18 @@
 import logging
 import re
+import sys
 import warnings
-from typing import Any, Union, Optional, TextIO
+from functools import lru_cache, partial
+from operator import attrgetter
+from typing import Any, Union, Optional, TextIO, Iterable, Iterator, Callable, Collection, Sequence
 
-from .base import FormatBase
+from .base import FormatBase, FormatWriter
 from ..ssaevent import SSAEvent
 from ..ssastyle import SSAStyle
 from ..common import Color, Alignment, SSA_ALIGNMENT
 from ..time import make_time, ms_to_times, timestamp_to_ms, TIMESTAMP, TIMESTAMP_SHORT
 from ..ssafile import SSAFile
+from ..attachments import ATTACHMENT_LOAD_MODES, LazyAttachment
 
 
 def ass_to_ssa_alignment(i: int) -> int:
@@ -85,6 +89,317 @@ def is_valid_field_content(s: str) -> bool:
     return "\n" not in s and "," not in s
 
 
+# Per issue #45, we should handle the case where there is extra whitespace around the values.
+# Extra whitespace is removed in non-string fields where it would break the parser otherwise,
+# and in font name (where it doesn't really make sense). It is preserved in Dialogue string
+# fields like Text, Name and Effect (to avoid introducing unnecessary change to parser output).
+
+def _parse_timestamp(v: str) -> int:
+    v = v.strip()
+    if v.startswith("-"):
+        # handle negative timestamps
+        v = v[1:]
+        sign = -1
+    else:
+        sign = 1
+
+    m = TIMESTAMP.match(v)
+    if m is None:
+        m = TIMESTAMP_SHORT.match(v)
+        if m is None:
+            raise ValueError(f"Failed to parse timestamp: {v!r}")
+
+    return sign * timestamp_to_ms(m.groups())
+
+def _parse_color(v: str) -> Color:
+    return rgba_to_color(v.strip())
+
+def _parse_bool(v: str) -> bool:
+    return v != "0"
+
+def _parse_marked(v: str) -> bool:
+    return v.endswith("1")
+
+def _parse_int(f: str, v: str) -> int:
+    try:
+        return int(v)
+    except ValueError:
+        warnings.warn(f"Failed to parse {f}, using default", RuntimeWarning)
+        return 0
+
+def _parse_alignment(format_: str, v: str) -> Alignment:
+    try:
+        if format_ == "ass":
+            return Alignment(int(v))
+        else:
+            return Alignment.from_ssa_alignment(int(v))
+    except Exception:
+        warnings.warn("Failed to parse alignment, using default", RuntimeWarning)
+        return Alignment.BOTTOM_CENTER
+
+def _get_field_converter(f: str, format_: str) -> Callable[[str], Any]:
+    if f in {"start", "end"}:
+        return _parse_timestamp
+    elif "color" in f:
+        return _parse_color
+    elif f in {"bold", "underline", "italic", "strikeout"}:
+        return _parse_bool
+    elif f in {"borderstyle", "encoding", "marginl", "marginr", "marginv", "layer", "alphalevel"}:
+        return partial(_parse_int, f)
+    elif f in {"fontsize", "scalex", "scaley", "spacing", "angle", "outline", "shadow"}:
+        return float
+    elif f == "marked":
+        return _parse_marked
+    elif f == "alignment":
+        return partial(_parse_alignment, format_)
+    elif f == "fontname":
+        return str.strip
+    elif f in {"style", "name", "effect"}:
+        # these repeat a lot across events, share the string objects
+        return sys.intern
+    else:
+        return str
+
+#: Section names for the ``sections`` option of :meth:`SubstationFormat.from_file()`,
+#: with keywords identifying them in section headings.
+SECTION_KEYWORDS = {
+    "info": "Info",
+    "aegisub": "Aegisub",
+    "styles": "Styles",
+    "fonts": "Fonts",
+    "graphics": "Graphics",
+    "events": "Events",
+}
+
+#: Fields which can be given in ``Format:`` line of ``[V4+ Styles]`` and ``[Events]`` sections.
+SECTION_FIELDS = {
+    "styles": frozenset(["name", *STYLE_FIELDS["ass"], *STYLE_FIELDS["ssa"]]),
+    "events": frozenset([*EVENT_FIELDS["ass"], *EVENT_FIELDS["ssa"]]),
+}
+
+#: Field names for ``Format:`` line columns which are not simply the lowercased column name.
+FORMAT_COLUMN_ALIASES = {
+    "actor": "name",
+}
+
+
+class FieldDecoder:
+    """
+    Converts fields of ``Style:`` or ``Dialogue:`` line to keyword arguments for SSAStyle/SSAEvent.
+
+    The decoder is built from the ``Format:`` line of the section, so that column order of the file
+    is respected. Each column gets its converter function up front, which is then applied to each row.
+    Columns which do not correspond to a known field are skipped.
+
+    Attributes:
+        fields: Field name for each column (empty string for unknown columns).
+        converters: Converter function for each column.
+        maxsplit: Number of commas separating the fields when Text is the last column (so that
+            it may contain commas), otherwise -1 and the line is split by :meth:`FieldDecoder.split()`.
+        indices: Column index for each known field.
+
+    """
+    def __init__(self, fields: Sequence[str], format_: str) -> None:
+        self.fields = tuple(fields)
+        self.converters = tuple(_get_field_converter(f, format_) for f in fields)
+        self.indices = {f: i for i, f in enumerate(self.fields) if f}
+        self.maxsplit = len(fields) - 1 if self.indices.get("text") == len(fields) - 1 else -1
+
+    def split(self, line: str) -> list[str]:
+        """Split line (without ``Style:``/``Dialogue:`` prefix) to fields."""
+        raw_fields = line.split(",", self.maxsplit)
+        text_index = self.indices.get("text")
+        extra = len(raw_fields) - len(self.fields)
+        if text_index is not None and extra > 0:
+            # Text is not the last column, commas beyond the expected number belong to it
+            raw_fields[text_index:text_index + extra + 1] = [",".join(raw_fields[text_index:text_index + extra + 1])]
+        return raw_fields
+
+    def decode(self, raw_fields: Sequence[str]) -> dict[str, Any]:
+        """Convert fields of one line to dict. Missing trailing fields are left out."""
+        return {f: convert(v) for f, convert, v in zip(self.fields, self.converters, raw_fields) if f}
+
+    def decode_field(self, f: str, raw_fields: Sequence[str], default: Any) -> Any:
+        """Convert one field of a line, or return default if the field is missing."""
+        i = self.indices.get(f)
+        if i is None or i >= len(raw_fields):
+            return default
+        return self.converters[i](raw_fields[i])
+
+
+@lru_cache(maxsize=None)
+def _get_default_field_decoder(section: str, format_: str) -> FieldDecoder:
+    """Decoder for files without ``Format:`` line, assuming the standard column order."""
+    if section == "styles":
+        return FieldDecoder(["name", *STYLE_FIELDS[format_]], format_)
+    else:
+        return FieldDecoder(EVENT_FIELDS[format_], format_)
+
+
+@lru_cache(maxsize=64)
+def get_field_decoder(format_line: str, section: str, format_: str) -> Optional[FieldDecoder]:
+    """
+    Return :class:`FieldDecoder` for given ``Format:`` line, or None if it's not usable.
+
+    Arguments:
+        format_line: The ``Format:`` line, eg. ``"Format: Layer, Start, End, Style, Name, MarginL, ..."``.
+        section: Either ``"styles"`` or ``"events"``.
+        format_: Either ``"ass"`` or ``"ssa"``.
+
+    """
+    _, columns = format_line.split(":", 1)
+    known_fields = SECTION_FIELDS[section]
+    fields = []
+    for column in columns.split(","):
+        f = column.strip().lower().replace("colour", "color")
+        f = FORMAT_COLUMN_ALIASES.get(f, f)
+        fields.append(f if f in known_fields else "")
+
+    required_field = "name" if section == "styles" else "text"
+    if required_field not in fields:
+        return None
+    return FieldDecoder(fields, format_)
+
+#: Fields of :class:`LazySSAEvent` which are decoded on first access (ie. all but ``type``).
+LAZY_EVENT_FIELDS = ("start", "end", "text", "marked", "layer", "style", "name", "marginl", "marginr", "marginv",
+                     "effect")
+_LAZY_EVENT_SLOTS = [(f, SSAEvent.__dict__[f], SSAEvent.__dataclass_fields__[f].default) for f in LAZY_EVENT_FIELDS]
+
+
+def _lazy_field_property(f: str) -> Any:
+    slot = SSAEvent.__dict__[f]  # descriptor of the underlying slot in SSAEvent
+    default = SSAEvent.__dataclass_fields__[f].default
+
+    def getter(self: "LazySSAEvent") -> Any:
+        try:
+            return slot.__get__(self, SSAEvent)
+        except AttributeError:
+            # not decoded yet (which means the event has not been modified, so we have the original line)
+            if self._raw_fields is None:
+                # first field to be read, decode just this one (eg. when filtering by style)
+                self._raw_fields = self._decoder.split(self._raw)  # type: ignore[arg-type]
+                value = self._decoder.decode_field(f, self._raw_fields, default)
+                slot.__set__(self, value)
+                self._decoded_field = f
+                return value
+            else:
+                # more fields are needed, decode all of them at once
+                self._decode_all()
+                return slot.__get__(self, SSAEvent)
+
+    def setter(self: "LazySSAEvent", value: Any) -> None:
+        if self._raw is not None and getter(self) != value:
+            # the original line no longer represents the event
+            self._decode_all()
+            self._raw = None
+        slot.__set__(self, value)
+
+    return property(getter, setter)
+
+
+class LazySSAEvent(SSAEvent):
+    """
+    Subtitle read from SubStation file, with fields decoded from the line on first access.
+
+    This is used instead of :class:`pysubs2.SSAEvent` when loading with ``lazy_events=True``,
+    see :meth:`SubstationFormat.from_file()`. Behaves like :class:`pysubs2.SSAEvent` (of which it
+    is a subclass), except that parse errors (eg. invalid timestamp) are raised when the field
+    is read, not when the file is loaded.
+
+    The original line is kept for writing, so that events which were not modified are
+    written to SubStation files unchanged, without formatting their fields again.
+
+    """
+    __slots__ = ("_raw", "_raw_fields", "_decoded_field", "_decoder")
+
+    def __init__(self, type_: str, raw: str, decoder: FieldDecoder) -> None:
+        self.type = type_  # type: ignore[assignment]
+        self._raw: Optional[str] = raw
+        self._raw_fields: Optional[list[str]] = None
+        self._decoded_field: Optional[str] = None
+        self._decoder = decoder
+
+    def _decode_all(self) -> None:
+        raw_fields = self._raw_fields
+        if raw_fields is None:
+            raw_fields = self._decoder.split(self._raw)  # type: ignore[arg-type]
+        decoder = self._decoder
+        for f, slot, default in _LAZY_EVENT_SLOTS:
+            if f != self._decoded_field:
+                slot.__set__(self, decoder.decode_field(f, raw_fields, default))
+        self._raw_fields = None
+
+    @property
+    def raw(self) -> Optional[str]:
+        """
+        The original line without ``Dialogue:``/``Comment:`` prefix, or ``None`` if the event has been modified
+
+        Note that this reflects the column order of the source file.
+        """
+        return self._raw
+
+    start: int = _lazy_field_property("start")
+    end: int = _lazy_field_property("end")
+    text: str = _lazy_field_property("text")
+    marked: bool = _lazy_field_property("marked")
+    layer: int = _lazy_field_property("layer")
+    style: str = _lazy_field_property("style")
+    name: str = _lazy_field_property("name")
+    marginl: int = _lazy_field_property("marginl")
+    marginr: int = _lazy_field_property("marginr")
+    marginv: int = _lazy_field_property("marginv")
+    effect: str = _lazy_field_property("effect")
+
+
+#: Matches override tags supported by :func:`parse_tags()` inside an override sequence.
+OVERRIDE_TAG = re.compile(r"\\[ibusp][0-9]|\\r[a-zA-Z_0-9 ]*|\\fn[a-zA-Z_0-9 ]+")
+
+
+@lru_cache(maxsize=4096)
+def _split_override_tags(text: str) -> tuple[tuple[str, ...], tuple[tuple[str, ...], ...]]:
+    """
+    Split text into fragments and supported tags of the override sequences between them.
+
+    This does not depend on styles, so it's cached for repeated texts (eg. when writing the same
+    file in several formats, or when checking :attr:`SSAEvent.is_drawing` before writing the text).
+    """
+    fragments = tuple(SSAEvent.OVERRIDE_SEQUENCE.split(text))
+    tags = tuple(tuple(OVERRIDE_TAG.findall(overrides)) for overrides in SSAEvent.OVERRIDE_SEQUENCE.findall(text))
+    return fragments, tags
+
+
+def _apply_override_tags(s: SSAStyle, tags: tuple[str, ...], style: SSAStyle,
+                         styles: dict[str, SSAStyle]) -> SSAStyle:
+    for tag in tags:
+        if tag == r"\r":
+            s = style.copy() # reset to original line style
+        elif tag.startswith(r"\r"):
+            name = tag[2:]
+            if name in styles:
+                # reset to named style
+                s = styles[name].copy()
+        elif tag.startswith(r"\fn"):
+            fontname = tag[3:]
+            s.fontname = fontname
+        else:
+            if "i" in tag:
+                s.italic = "1" in tag
+            elif "b" in tag:
+                s.bold = "1" in tag
+            elif "u" in tag:
+                s.underline = "1" in tag
+            elif "s" in tag:
+                s.strikeout = "1" in tag
+            elif "p" in tag:
+                try:
+                    scale = int(tag[2:])
+                except (ValueError, IndexError):
+                    continue
+
+                s.drawing = scale > 0
+    return s
+
+
 def parse_tags(text: str, style: SSAStyle = SSAStyle.DEFAULT_STYLE,
                styles: Optional[dict[str, SSAStyle]] = None,
                skip_empty_fragments: bool = False) -> list[tuple[str, SSAStyle]]:
@@ -107,56 +422,86 @@ def parse_tags(text: str, style: SSAStyle = SSAStyle.DEFAULT_STYLE,
     """
     if styles is None:
         styles = {}
-    
-    fragments = SSAEvent.OVERRIDE_SEQUENCE.split(text)
+
+    fragments, tags_per_override = _split_override_tags(text)
+    return _compute_fragment_styles(text, fragments, tags_per_override, style, styles, skip_empty_fragments)
+
+
+def _compute_fragment_styles(text: str, fragments: tuple[str, ...], tags_per_override: tuple[tuple[str, ...], ...],
+                             style: SSAStyle, styles: dict[str, SSAStyle],
+                             skip_empty_fragments: bool) -> list[tuple[str, SSAStyle]]:
     if len(fragments) == 1:
         if skip_empty_fragments and not text:
             return []
         else:
             return [(text, style)]
-    
-    def apply_overrides(all_overrides: str) -> SSAStyle:
-        s = style.copy()
-        for tag in re.findall(r"\\[ibusp][0-9]|\\r[a-zA-Z_0-9 ]*|\\fn[a-zA-Z_0-9 ]+", all_overrides):
-            if tag == r"\r":
-                s = style.copy() # reset to original line style
-            elif tag.startswith(r"\r"):
-                name = tag[2:]
-                if name in styles:
-                    # reset to named style
-                    s = styles[name].copy()
-            elif tag.startswith(r"\fn"):
-                fontname = tag[3:]
-                s.fontname = fontname
-            else:
-                if "i" in tag:
-                    s.italic = "1" in tag
-                elif "b" in tag:
-                    s.bold = "1" in tag
-                elif "u" in tag:
-                    s.underline = "1" in tag
-                elif "s" in tag:
-                    s.strikeout = "1" in tag
-                elif "p" in tag:
-                    try:
-                        scale = int(tag[2:])
-                    except (ValueError, IndexError):
-                        continue
-
-                    s.drawing = scale > 0
-        return s
-    
-    overrides = SSAEvent.OVERRIDE_SEQUENCE.findall(text)
-    overrides_prefix_sum = ["".join(overrides[:i]) for i in range(len(overrides) + 1)]
-    computed_styles = map(apply_overrides, overrides_prefix_sum)
-    output = list(zip(fragments, computed_styles))
+
+    # Each override sequence is applied once, to a copy of the style computed for the previous fragment.
+    s = style.copy()
+    output = [(fragments[0], s)]
+    for fragment, tags in zip(fragments[1:], tags_per_override):
+        s = _apply_override_tags(s.copy(), tags, style, styles)
+        output.append((fragment, s))
+
     if skip_empty_fragments:
         output = [(fragment, sty) for fragment, sty in output if fragment]
     return output
 
 
+def _has_drawing(tags_per_override: tuple[tuple[str, ...], ...]) -> bool:
+    """
+    Whether drawing mode is on after any of the override sequences.
+
+    This gives the same result as checking styles from :func:`parse_tags()` called
+    without line style and styles (as in :attr:`SSAEvent.is_drawing`), without computing the styles.
+    """
+    drawing = False
+    for tags in tags_per_override:
+        for tag in tags:
+            if tag == r"\r":
+                drawing = False
+            elif tag.startswith(r"\p"):
+                drawing = tag[2:] != "0"
+        if drawing:
+            return True
+    return False
+
+
+def is_drawing_text(text: str) -> bool:
+    """Returns True if text contains SSA drawing tag, see :attr:`SSAEvent.is_drawing`."""
+    if "{" not in text:
+        return False
+    return _has_drawing(_split_override_tags(text)[1])
+
+
+def parse_event_tags(event: SSAEvent, styles: dict[str, SSAStyle],
+                     skip_empty_fragments: bool = False) -> Optional[list[tuple[str, SSAStyle]]]:
+    """
+    Split event text into fragments with computed SSAStyles, for output in non-SSA formats.
+
+    This is :func:`parse_tags()` with the event's style, combined with the :attr:`SSAEvent.is_text` check,
+    so that writers need to parse tags of each event only once.
+
+    Returns:
+        ``None`` for comments and drawings (which should be skipped), otherwise
+        list of tuples (fragment, style) as returned by :func:`parse_tags()`.
+
+    """
+    if event.is_comment:
+        return None
+    text = event.text
+    fragments, tags_per_override = _split_override_tags(text)
+    if _has_drawing(tags_per_override):
+        return None
+    style = styles.get(event.style, SSAStyle.DEFAULT_STYLE)
+    return _compute_fragment_styles(text, fragments, tags_per_override, style, styles, skip_empty_fragments)
+
+
 NOTICE = "Script generated by pysubs2\nhttps://pypi.python.org/pypi/pysubs2"
 
+#: Number of event lines joined into one write by :meth:`SubstationFormat.to_file()`.
+SUBSTATION_WRITE_CHUNK_SIZE = 1000
+
 class SubstationFormat(FormatBase):
     """SubStation Alpha (ASS, SSA) subtitle format implementation"""
 
@@ -170,6 +515,13 @@ class SubstationFormat(FormatBase):
             requested_ms = MAX_REPRESENTABLE_TIME
 
         # Aegisub does rounding, see https://github.com/Aegisub/Aegisub/blob/6f546951b4f004da16ce19ba638bf3eedefb9f31/libaegisub/include/libaegisub/ass/time.h#L32
+        if type(requested_ms) is int:
+            # same as below, in integer centiseconds
+            s, cs = divmod((requested_ms + 5) // 10, 100)
+            m, s = divmod(s, 60)
+            h, m = divmod(m, 60)
+            return f"{h:01d}:{m:02d}:{s:02d}.{cs:02d}"
+
         round_ms = ((requested_ms + 5) - (requested_ms + 5) % 10)
         h, m, s, ms = ms_to_times(round_ms)
         cs = ms // 10
@@ -188,58 +540,62 @@ class SubstationFormat(FormatBase):
 
     @classmethod
     def from_file(cls, subs: "SSAFile", fp: TextIO, format_: str, **kwargs: Any) -> None:
-        """See :meth:`pysubs2.formats.FormatBase.from_file()`"""
-
-        def string_to_field(f: str, v: str) -> Any:
-            # Per issue #45, we should handle the case where there is extra whitespace around the values.
-            # Extra whitespace is removed in non-string fields where it would break the parser otherwise,
-            # and in font name (where it doesn't really make sense). It is preserved in Dialogue string
-            # fields like Text, Name and Effect (to avoid introducing unnecessary change to parser output).
-
-            if f in {"start", "end"}:
-                v = v.strip()
-                if v.startswith("-"):
-                    # handle negative timestamps
-                    v = v[1:]
-                    sign = -1
-                else:
-                    sign = 1
-
-                m = TIMESTAMP.match(v)
-                if m is None:
-                    m = TIMESTAMP_SHORT.match(v)
-                    if m is None:
-                        raise ValueError(f"Failed to parse timestamp: {v!r}")
-
-                return sign * timestamp_to_ms(m.groups())
-            elif "color" in f:
-                v = v.strip()
-                return rgba_to_color(v)
-            elif f in {"bold", "underline", "italic", "strikeout"}:
-                return v != "0"
-            elif f in {"borderstyle", "encoding", "marginl", "marginr", "marginv", "layer", "alphalevel"}:
-                try:
-                    return int(v)
-                except ValueError:
-                    warnings.warn(f"Failed to parse {f}, using default", RuntimeWarning)
-                    return 0
-            elif f in {"fontsize", "scalex", "scaley", "spacing", "angle", "outline", "shadow"}:
-                return float(v)
-            elif f == "marked":
-                return v.endswith("1")
-            elif f == "alignment":
-                try:
-                    if format_ == "ass":
-                        return Alignment(int(v))
-                    else:
-                        return Alignment.from_ssa_alignment(int(v))
-                except Exception:
-                    warnings.warn("Failed to parse alignment, using default", RuntimeWarning)
-                    return Alignment.BOTTOM_CENTER
-            elif f == "fontname":
-                return v.strip()
-            else:
-                return v
+        """
+        See :meth:`pysubs2.formats.FormatBase.from_file()`
+
+        Keyword args:
+            attachments: How to load embedded fonts and pictures (``[Fonts]`` and ``[Graphics]`` sections)
+                into :attr:`pysubs2.SSAFile.fonts_opaque` and :attr:`pysubs2.SSAFile.graphics_opaque`:
+
+                - ``"load"`` (default) reads them into memory as lists of lines,
+                - ``"lazy"`` only records where they are in the file and reads them
+                  when they are accessed or saved, see :class:`pysubs2.attachments.LazyAttachment`
+                  (this requires a file on disk; for other file objects, attachments are loaded
+                  as usual),
+                - ``"skip"`` does not load them at all, they will be missing when the subtitles
+                  are saved.
+
+                Embedded fonts can make up most of a typeset subtitle file, so the ``"lazy"``
+                and ``"skip"`` options speed up loading when you only need the subtitles.
+            sections: If given, only these sections are parsed, the rest of the file is skipped
+                and reading stops as soon as all of them have been read. Use this when you only need
+                the header, eg. ``sections={"info", "styles"}`` is much faster than loading a file
+                with all its subtitles and attachments. See :data:`SECTION_KEYWORDS` for section names.
+
+                Example:
+                    >>> subs = pysubs2.load("huge-karaoke-file.ass", sections={"info", "styles"})
+                    >>> print(subs.info["PlayResX"], subs.styles.keys())
+            lazy_events: If True, subtitles are read as :class:`LazySSAEvent`, which keeps the original line
+                and only converts fields (timestamps, numbers) when they are accessed. Unmodified events
+                are written back to SubStation as they were. This speeds up loading and filtering of
+                big files, eg. when you only look at :attr:`pysubs2.SSAEvent.style` to throw away most events.
+        """
+        subs.events.extend(cls.iter_events(subs, fp, format_, **kwargs))
+
+    @classmethod
+    def iter_events(cls, subs: "SSAFile", fp: TextIO, format_: str, attachments: str = "load",
+                    sections: Optional[Collection[str]] = None, lazy_events: bool = False,
+                    **kwargs: Any) -> Iterator[SSAEvent]:
+        """
+        See :meth:`pysubs2.formats.FormatBase.iter_events()`
+
+        This is a true streaming implementation: events are yielded as the ``[Events]`` section
+        is being read, while ``[Script Info]`` and styles (which precede it in a well-formed file)
+        are already stored in ``subs``. See :meth:`SubstationFormat.from_file()` for the ``attachments``,
+        ``sections`` and ``lazy_events`` options.
+
+        """
+        if attachments not in ATTACHMENT_LOAD_MODES:
+            raise ValueError(f"attachments must be one of {ATTACHMENT_LOAD_MODES}, got {attachments!r}")
+        remaining_sections: Optional[set[str]] = None
+        if sections is not None:
+            remaining_sections = set(sections)
+            unknown_sections = remaining_sections.difference(SECTION_KEYWORDS)
+            if unknown_sections:
+                raise ValueError(f"Unknown sections {sorted(unknown_sections)}, expected some of "
+                                 f"{list(SECTION_KEYWORDS)}")
+        skip_attachments = attachments == "skip"
+        attachment_source = LazyAttachment.get_source(fp) if attachments == "lazy" else None
 
         subs.info.clear()
         subs.aegisub_project.clear()
@@ -251,19 +607,66 @@ class SubstationFormat(FormatBase):
         inside_aegisub_section = False
         inside_font_section = False
         inside_graphic_section = False
+        inside_styles_section = False
+        inside_events_section = False
+        style_decoder = _get_default_field_decoder("styles", format_)
+        event_decoder = _get_default_field_decoder("events", format_)
         current_attachment_name = None
-        current_attachment_lines_buffer = []
+        current_attachment_lines_buffer: list[str] = []
+        current_attachment_heading = (0, "")
+        current_attachment_length = 0
         current_attachment_is_font = None
+        current_section: Optional[str] = None
+        skip_section = False
+
+        def take_attachment_data() -> Sequence[str]:
+            nonlocal current_attachment_lines_buffer, current_attachment_length
+            attachment_data: Sequence[str]
+            if attachment_source is not None:
+                attachment_data = LazyAttachment(*attachment_source, *current_attachment_heading,
+                                                 current_attachment_length)
+            else:
+                attachment_data = current_attachment_lines_buffer
+            current_attachment_lines_buffer = []
+            current_attachment_length = 0
+            return attachment_data
 
         for lineno, line in enumerate(fp, 1):
+            if skip_section and "[" not in line:
+                continue  # fast path, this cannot be a section heading
+
+            if (inside_font_section or inside_graphic_section) and "[" not in line:
+                # fast path for attachment data: without "[", the line cannot be a section heading,
+                # and starting with uuencoded character (no lowercase letters), it cannot be "fontname:" line
+                if skip_attachments:
+                    continue
+                if current_attachment_name and "!" <= line[:1] <= "`":
+                    if attachment_source is not None:
+                        current_attachment_length += 1
+                    else:
+                        current_attachment_lines_buffer.append(line.strip())
+                    continue
+
             line = line.strip()
 
             if SECTION_HEADING.match(line):
                 logging.debug("at line %d: section heading %s", lineno, line)
+                if remaining_sections is not None:
+                    remaining_sections.discard(current_section)
+                    if not remaining_sections:
+                        logging.debug("at line %d: all requested sections have been read", lineno)
+                        break
+                    current_section = next((name for name, keyword in SECTION_KEYWORDS.items() if keyword in line),
+                                           None)
+                    skip_section = current_section not in remaining_sections
                 inside_info_section = "Info" in line
                 inside_aegisub_section = "Aegisub" in line
                 inside_font_section = "Fonts" in line
                 inside_graphic_section = "Graphics" in line
+                inside_styles_section = "Styles" in line
+                inside_events_section = "Events" in line
+            elif skip_section:
+                continue
             elif inside_info_section or inside_aegisub_section:
                 if line.startswith(";"):
                     continue  # skip comments
@@ -276,12 +679,15 @@ class SubstationFormat(FormatBase):
                 except ValueError:
                     pass
             elif inside_font_section or inside_graphic_section:
+                if skip_attachments:
+                    continue
+
                 m = ATTACHMENT_FILE_HEADING.match(line)
                 current_attachment_is_font = inside_font_section
 
                 if current_attachment_name and (m or not line):
                     # flush last font/picture on newline or new font/picture name
-                    attachment_data = current_attachment_lines_buffer[:]
+                    attachment_data = take_attachment_data()
                     if inside_font_section:
                         subs.fonts_opaque[current_attachment_name] = attachment_data
                     elif inside_graphic_section:
@@ -289,35 +695,52 @@ class SubstationFormat(FormatBase):
                     else:
                         raise NotImplementedError("Bad attachment section, expected [Fonts] or [Graphics]")
                     logging.debug("at line %d: finished attachment definition %s", lineno, current_attachment_name)
-                    current_attachment_lines_buffer.clear()
                     current_attachment_name = None
 
                 if m:
                     # start new font/picture
                     attachment_name = m.group("name")
                     current_attachment_name = attachment_name
+                    current_attachment_heading = (lineno, line)
                 elif line:
                     # add non-empty line to current buffer
-                    current_attachment_lines_buffer.append(line)
+                    if attachment_source is not None:
+                        if current_attachment_name:
+                            current_attachment_length += 1
+                    else:
+                        current_attachment_lines_buffer.append(line)
+            elif line.startswith("Format:") and (inside_styles_section or inside_events_section):
+                section = "styles" if inside_styles_section else "events"
+                decoder = get_field_decoder(line, section, format_)
+                if decoder is None:
+                    warnings.warn(f"Failed to parse {section} format line {line!r}, using default", RuntimeWarning)
+                elif inside_styles_section:
+                    style_decoder = decoder
+                else:
+                    event_decoder = decoder
             elif line.startswith("Style:"):
                 _, rest = line.split(":", 1)
-                buf = rest.strip().split(",")
-                name, *raw_fields = buf
-                field_dict = {f: string_to_field(f, v) for f, v in zip(STYLE_FIELDS[format_], raw_fields)}
-                sty = SSAStyle(**field_dict)
-                subs.styles[name] = sty
+                field_dict = style_decoder.decode(style_decoder.split(rest.strip()))
+                if "name" not in field_dict:
+                    warnings.warn(f"Style line {line!r} is missing Name column, using default column order",
+                                  RuntimeWarning)
+                    default_decoder = _get_default_field_decoder("styles", format_)
+                    field_dict = default_decoder.decode(default_decoder.split(rest.strip()))
+                name = field_dict.pop("name")
+                subs.styles[name] = SSAStyle(**field_dict)
             elif line.startswith("Dialogue:") or line.startswith("Comment:"):
                 ev_type, rest = line.split(":", 1)
-                raw_fields = rest.strip().split(",", len(EVENT_FIELDS[format_])-1)
-                field_dict = {f: string_to_field(f, v) for f, v in zip(EVENT_FIELDS[format_], raw_fields)}
-                field_dict["type"] = ev_type
-                ev = SSAEvent(**field_dict)
-                subs.events.append(ev)
+                if lazy_events:
+                    yield LazySSAEvent(sys.intern(ev_type), rest.strip(), event_decoder)
+                    continue
+                field_dict = event_decoder.decode(event_decoder.split(rest.strip()))
+                field_dict["type"] = sys.intern(ev_type)
+                yield SSAEvent(**field_dict)
 
         # cleanup fonts/pictures
         if current_attachment_name:
             # flush last font on EOF or new section w/o newline
-            attachment_data = current_attachment_lines_buffer[:]
+            attachment_data = take_attachment_data()
 
             if current_attachment_is_font:
                 subs.fonts_opaque[current_attachment_name] = attachment_data
@@ -325,82 +748,174 @@ class SubstationFormat(FormatBase):
                 subs.graphics_opaque[current_attachment_name] = attachment_data
 
             logging.debug("at EOF: finished attachment definition %s", current_attachment_name)
-            current_attachment_lines_buffer.clear()
             current_attachment_name = None
 
     @classmethod
     def to_file(cls, subs: "SSAFile", fp: TextIO, format_: str, header_notice: str = NOTICE, **kwargs: Any) -> None:
         """See :meth:`pysubs2.formats.FormatBase.to_file()`"""
-        print("[Script Info]", file=fp)
-        for line in header_notice.splitlines(False):
-            print(";", line, file=fp)
+        writer = cls.get_writer(fp, format_, subs, header_notice=header_notice, **kwargs)
+        with writer:
+            writer.write_header()
+            writer._write_events_in_chunks(subs.events)
+
+    @classmethod
+    def get_writer(cls, fp: TextIO, format_: str, subs: "SSAFile", **kwargs: Any) -> "SubstationWriter":
+        """
+        See :meth:`pysubs2.formats.FormatBase.get_writer()`
+
+        The header, ie. everything up to the ``[Events]`` section including styles
+        and embedded fonts, is written from ``subs`` before the first event.
+        """
+        return SubstationWriter(fp, format_, subs, **kwargs)
+
+
+#: Event fields written by :class:`SubstationWriter` in the fast path, with their expected types.
+_EVENT_FIELD_TYPES = {
+    "layer": int, "marked": bool, "start": int, "end": int, "style": str, "name": str,
+    "marginl": int, "marginr": int, "marginv": int, "effect": str, "text": str,
+}
+
+
+class SubstationWriter(FormatWriter):
+    """
+    Incremental writer for SubStation, see :meth:`SubstationFormat.get_writer()`
+
+    """
+
+    def __init__(self, fp: TextIO, format_: str, subs: "SSAFile", fps: Optional[float] = None,
+                 header_notice: str = NOTICE, **kwargs: Any) -> None:
+        super().__init__(fp, format_, subs, fps)
+        self.header_notice = header_notice
+        self._color_strings: dict[tuple[int, int, int, int], str] = {}
+
+        # the serializer is compiled for the format: field getter and types expected for the fast path
+        fields = EVENT_FIELDS[format_]
+        self._event_fields = fields
+        self._get_event_fields = attrgetter(*fields)
+        self._event_field_types = tuple(_EVENT_FIELD_TYPES[f] for f in fields)
+        self._first_field_template = "Marked={:d}" if fields[0] == "marked" else "{}"
+        # subclasses overriding field_to_string() get it called for every field
+        self._fast_path = type(self).field_to_string is SubstationWriter.field_to_string
+        # whether unmodified LazySSAEvent read with given decoder can be written as the original line
+        self._raw_compatible_decoders: dict[FieldDecoder, bool] = {}
+
+    def field_to_string(self, f: str, v: Any, line: Union[SSAEvent, SSAStyle]) -> str:
+        format_ = self.format_
+        if f in {"start", "end"}:
+            return SubstationFormat.ms_to_timestamp(v)
+        elif f == "marked":
+            return f"Marked={v:d}"
+        elif f == "alignment":
+            if isinstance(v, Alignment):
+                alignment = v
+            else:
+                warnings.warn("The 'alignment' attribute of SSAStyle should be an Alignment instance, using plain int is deprecated", DeprecationWarning)
+                alignment = Alignment(v)
+
+            if format_ == "ssa":
+                return str(alignment.to_ssa_alignment())
+            else:
+                return str(alignment.value)
+        elif isinstance(v, bool):
+            return "-1" if v else "0"
+        elif isinstance(v, int):
+            return str(v)
+        elif isinstance(v, float):
+            return str(int(v) if v.is_integer() else v)
+        elif isinstance(v, str):
+            return v
+        elif isinstance(v, Color):
+            key = (v.r, v.g, v.b, v.a)
+            color_string = self._color_strings.get(key)
+            if color_string is None:
+                if format_ == "ass":
+                    color_string = color_to_ass_rgba(v)
+                else:
+                    color_string = color_to_ssa_rgb(v)
+                self._color_strings[key] = color_string
+            return color_string
+        else:
+            raise TypeError(f"Unexpected type when writing a SubStation field {f!r} for line {line!r}")
+
+    def _write_header(self) -> None:
+        subs = self.subs
+        format_ = self.format_
+        out = ["[Script Info]\n"]
+        for line in self.header_notice.splitlines(False):
+            out.append(f"; {line}\n")
 
         subs.info["ScriptType"] = "v4.00+" if format_ == "ass" else "v4.00"
         for k, v in subs.info.items():
-            print(k, v, sep=": ", file=fp)
+            out.append(f"{k}: {v}\n")
 
         if subs.aegisub_project:
-            print("\n[Aegisub Project Garbage]", file=fp)
+            out.append("\n[Aegisub Project Garbage]\n")
             for k, v in subs.aegisub_project.items():
-                print(k, v, sep=": ", file=fp)
-
-        def field_to_string(f: str, v: Any, line: Union[SSAEvent, SSAStyle]) -> str:
-            if f in {"start", "end"}:
-                return cls.ms_to_timestamp(v)
-            elif f == "marked":
-                return f"Marked={v:d}"
-            elif f == "alignment":
-                if isinstance(v, Alignment):
-                    alignment = v
-                else:
-                    warnings.warn("The 'alignment' attribute of SSAStyle should be an Alignment instance, using plain int is deprecated", DeprecationWarning)
-                    alignment = Alignment(v)
-
-                if format_ == "ssa":
-                    return str(alignment.to_ssa_alignment())
-                else:
-                    return str(alignment.value)
-            elif isinstance(v, bool):
-                return "-1" if v else "0"
-            elif isinstance(v, int):
-                return str(v)
-            elif isinstance(v, float):
-                return str(int(v) if v.is_integer() else v)
-            elif isinstance(v, str):
-                return v
-            elif isinstance(v, Color):
-                if format_ == "ass":
-                    return color_to_ass_rgba(v)
-                else:
-                    return color_to_ssa_rgb(v)
-            else:
-                raise TypeError(f"Unexpected type when writing a SubStation field {f!r} for line {line!r}")
+                out.append(f"{k}: {v}\n")
 
-        print("\n[V4+ Styles]" if format_ == "ass" else "\n[V4 Styles]", file=fp)
-        print(STYLE_FORMAT_LINE[format_], file=fp)
+        out.append("\n[V4+ Styles]\n" if format_ == "ass" else "\n[V4 Styles]\n")
+        out.append(STYLE_FORMAT_LINE[format_] + "\n")
         for name, sty in subs.styles.items():
-            fields = [field_to_string(f, getattr(sty, f), sty) for f in STYLE_FIELDS[format_]]
-            print(f"Style: {name}", *fields, sep=",", file=fp)
-
-        if subs.fonts_opaque:
-            print("\n[Fonts]", file=fp)
-            for font_name, font_lines in sorted(subs.fonts_opaque.items()):
-                print(f"fontname: {font_name}", file=fp)
-                for line in font_lines:
-                    print(line, file=fp)
-                print(file=fp)
-
-        if subs.graphics_opaque:
-            print("\n[Graphics]", file=fp)
-            for picture_name, picture_lines in sorted(subs.graphics_opaque.items()):
-                print(f"filename: {picture_name}", file=fp)
-                for line in picture_lines:
-                    print(line, file=fp)
-                print(file=fp)
-
-        print("\n[Events]", file=fp)
-        print(EVENT_FORMAT_LINE[format_], file=fp)
-        for ev in subs.events:
-            fields = [field_to_string(f, getattr(ev, f), ev) for f in EVENT_FIELDS[format_]]
-            print(ev.type, end=": ", file=fp)
-            print(*fields, sep=",", file=fp)
+            fields = [self.field_to_string(f, getattr(sty, f), sty) for f in STYLE_FIELDS[format_]]
+            out.append(",".join([f"Style: {name}", *fields]) + "\n")
+
+        self._write_attachments(out, "[Fonts]", "fontname", subs.fonts_opaque)
+        self._write_attachments(out, "[Graphics]", "filename", subs.graphics_opaque)
+
+        out.append("\n[Events]\n")
+        out.append(EVENT_FORMAT_LINE[format_] + "\n")
+        self.fp.write("".join(out))
+
+    def _write_attachments(self, out: list[str], heading: str, name_field: str,
+                           attachments: dict[str, Sequence[str]]) -> None:
+        if not attachments:
+            return
+        out.append(f"\n{heading}\n")
+        for name, lines in sorted(attachments.items()):
+            out.append(f"{name_field}: {name}\n")
+            if isinstance(lines, LazyAttachment) and not lines.is_loaded:
+                # copy the lines straight from the source file, without keeping them in memory
+                self.fp.write("".join(out))
+                out.clear()
+                self.fp.writelines(f"{line}\n" for line in lines)
+            else:
+                out.extend(f"{line}\n" for line in lines)
+            out.append("\n")
+
+    def _write_event(self, event: SSAEvent) -> None:
+        self.fp.write(self._event_to_row(event))
+
+    def _write_events_in_chunks(self, events: Iterable[SSAEvent]) -> None:
+        """Write many events, joining up to :data:`SUBSTATION_WRITE_CHUNK_SIZE` lines per file write"""
+        rows: list[str] = []
+        for event in events:
+            rows.append(self._event_to_row(event))
+            if len(rows) >= SUBSTATION_WRITE_CHUNK_SIZE:
+                self.fp.write("".join(rows))
+                rows.clear()
+        self.fp.write("".join(rows))
+
+    def _event_to_row(self, event: SSAEvent) -> str:
+        if self._fast_path and type(event) is LazySSAEvent and event.raw is not None \
+                and self._is_raw_compatible(event._decoder):
+            # unmodified event, write the original line
+            row = f"{event.type}: {event.raw}\n"
+        else:
+            values = self._get_event_fields(event)
+            if self._fast_path and tuple(map(type, values)) == self._event_field_types:
+                # all fields have the usual types, render them without per-field dispatch
+                first, start, end, style, name, marginl, marginr, marginv, effect, text = values
+                to_timestamp = SubstationFormat.ms_to_timestamp
+                row = (f"{event.type}: {self._first_field_template.format(first)},{to_timestamp(start)},"
+                       f"{to_timestamp(end)},{style},{name},{marginl},{marginr},{marginv},{effect},{text}\n")
+            else:
+                fields = [self.field_to_string(f, v, event) for f, v in zip(self._event_fields, values)]
+                row = f"{event.type}: {','.join(fields)}\n"
+        return row
+
+    def _is_raw_compatible(self, decoder: FieldDecoder) -> bool:
+        """Whether the original line of :class:`LazySSAEvent` read with given decoder has the columns we write"""
+        raw_compatible = self._raw_compatible_decoders.get(decoder)
+        if raw_compatible is None:
+            raw_compatible = self._raw_compatible_decoders[decoder] = decoder.fields == tuple(self._event_fields)
+        return raw_compatible
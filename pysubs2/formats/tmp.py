@@ -1,11 +1,11 @@
 import re
 import warnings
-from typing import Optional, TextIO, Any
+from typing import Iterator, Optional, TextIO, Any
 
 from .base import FormatBase
 from ..ssaevent import SSAEvent
 from ..ssastyle import SSAStyle
-from .substation import parse_tags
+from .substation import parse_event_tags
 from ..time import ms_to_times, make_time, TIMESTAMP_SHORT, timestamp_to_ms
 from ..ssafile import SSAFile
 
@@ -47,14 +47,24 @@ class TmpFormat(FormatBase):
     @classmethod
     def from_file(cls, subs: "SSAFile", fp: TextIO, format_: str, **kwargs: Any) -> None:
         """See :meth:`pysubs2.formats.FormatBase.from_file()`"""
-        events = []
+        subs.events.extend(cls.iter_events(subs, fp, format_, **kwargs))
 
+    @classmethod
+    def iter_events(cls, subs: "SSAFile", fp: TextIO, format_: str, **kwargs: Any) -> Iterator[SSAEvent]:
+        """
+        See :meth:`pysubs2.formats.FormatBase.iter_events()`
+
+        The file is read line by line and each subtitle is yielded when the next one is read
+        (which is needed to correct its end time), so that memory usage does not depend on the size of the file.
+
+        """
         def prepare_text(text: str) -> str:
             text = text.replace("|", r"\N")  # convert newlines
             text = re.sub(r"< *u *>", r"{\\u1}", text)
             text = re.sub(r"< */? *[a-zA-Z][^>]*>", "", text) # strip other HTML tags
             return text
 
+        previous_event: Optional[SSAEvent] = None
         for line in fp:
             match = TMP_LINE.match(line)
             if not match:
@@ -70,13 +80,14 @@ class TmpFormat(FormatBase):
             end_guess = start + 500 + (len(line) * 67)
 
             event = SSAEvent(start=start, end=end_guess, text=prepare_text(text))
-            events.append(event)
-
-        # correct any overlapping subtitles created by end_guess
-        for i in range(len(events) - 1):
-            events[i].end = min(events[i].end, events[i+1].start)
+            if previous_event is not None:
+                # correct any overlapping subtitles created by end_guess
+                previous_event.end = min(previous_event.end, event.start)
+                yield previous_event
+            previous_event = event
 
-        subs.events = events
+        if previous_event is not None:
+            yield previous_event
 
     @classmethod
     def to_file(cls, subs: "SSAFile", fp: TextIO, format_: str, apply_styles: bool = True, **kwargs: Any) -> None:
@@ -89,9 +100,9 @@ class TmpFormat(FormatBase):
             apply_styles: If False, do not write any styling.
 
         """
-        def prepare_text(text: str, style: SSAStyle) -> str:
+        def prepare_text(fragments: list[tuple[str, SSAStyle]]) -> str:
             body = []
-            for fragment, sty in parse_tags(text, style, subs.styles):
+            for fragment, sty in fragments:
                 fragment = fragment.replace(r"\h", " ")
                 fragment = fragment.replace(r"\n", "\n")
                 fragment = fragment.replace(r"\N", "\n")
@@ -106,8 +117,11 @@ class TmpFormat(FormatBase):
 
             return re.sub("\n+", "|", "".join(body).strip())
 
-        for line in subs.get_text_events():
+        for line in subs:
+            fragments = parse_event_tags(line, subs.styles)
+            if fragments is None:
+                continue
             start = cls.ms_to_timestamp(line.start)
-            text = prepare_text(line.text, subs.styles.get(line.style, SSAStyle.DEFAULT_STYLE))
+            text = prepare_text(fragments)
 
             print(start + ":" + text, end="\n", file=fp)
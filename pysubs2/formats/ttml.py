@@ -1,19 +1,34 @@
 import re
 from enum import Enum
-from typing import Optional, TextIO, Any, Union
+from functools import lru_cache
+from typing import Iterator, Mapping, NamedTuple, Optional, TextIO, Any, Union
 import xml.etree.ElementTree as ET
 
-from .base import FormatBase
-from ..common import etree_iter_child_nodes, etree_register_namespace_override, etree_append_child_nodes
+from .base import FormatBase, FormatWriter
+from ..common import etree_iter_child_nodes, etree_append_child_nodes, IntOrFloat
 from ..ssaevent import SSAEvent
 from ..ssastyle import SSAStyle
-from .substation import parse_tags
-from ..time import ms_to_times, make_time
+from .substation import parse_event_tags
+from ..time import ms_to_times, times_to_ms
 from ..ssafile import SSAFile
 
 
 TT_NS = "{http://www.w3.org/ns/ttml}"
 TTS_NS = "{http://www.w3.org/ns/ttml#styling}"
+TTP_NS = "{http://www.w3.org/ns/ttml#parameter}"
+
+#: Namespace prefixes used by :class:`TTMLWriter`, the default namespace is TTML.
+TTML_NAMESPACE_PREFIXES = {TT_NS: "", TTS_NS: "tts:"}
+
+WHITESPACE = re.compile(r"\s+")
+NEWLINE_WITH_WHITESPACE = re.compile(r"\s*\\N\s*")
+
+#: Matches TTML offset-time expression, eg. ``"1.5s"``, ``"12f"`` or ``"10010000t"``.
+OFFSET_TIME = re.compile(r"(\d+(?:\.\d+)?)(h|m|s|ms|f|t)")
+
+#: Matches TTML clock-time expression, eg. ``"00:01:02.500"`` or ``"00:01:02:12.1"`` (frames and sub-frames).
+#: Groups are hours, minutes, seconds, fraction of seconds, frames, sub-frames.
+CLOCK_TIME = re.compile(r"(?:(?:(\d+):)?(\d{1,2}):)?(\d{2})(?:(\.\d+)|:(\d+)(?:\.(\d+))?)?")
 
 
 class TimeContainer(Enum):
@@ -21,6 +36,52 @@ class TimeContainer(Enum):
     SEQ = "seq"
 
 
+class TTMLTimeParameters(NamedTuple):
+    """
+    Parameters of TTML time expressions, given by ``ttp:`` attributes of the ``<tt>`` element.
+
+    Attributes:
+        frame_rate: Effective frame rate, ie. ``ttp:frameRate`` (default 30) multiplied by
+            ``ttp:frameRateMultiplier``. Used for ``"f"`` metric and frames in clock-time.
+        sub_frame_rate: ``ttp:subFrameRate`` (default 1), used for sub-frames in clock-time.
+        tick_rate: ``ttp:tickRate``, used for ``"t"`` metric. When not given, it defaults to effective
+            frame rate multiplied by sub-frame rate if ``ttp:frameRate`` is given, otherwise 1.
+
+    """
+    frame_rate: float = 30.0
+    sub_frame_rate: int = 1
+    tick_rate: float = 1.0
+
+    @classmethod
+    def from_attrib(cls, attrib: Mapping[str, str]) -> "TTMLTimeParameters":
+        """
+        Get parameters from attributes of ``<tt>`` element
+
+        Raises:
+            ValueError: Invalid value of some of the attributes.
+
+        """
+        try:
+            frame_rate = int(attrib.get(f"{TTP_NS}frameRate", 30))
+            numerator, denominator = map(int, attrib.get(f"{TTP_NS}frameRateMultiplier", "1 1").split())
+            sub_frame_rate = int(attrib.get(f"{TTP_NS}subFrameRate", 1))
+            tick_rate: float = int(attrib.get(f"{TTP_NS}tickRate", 0))
+        except ValueError:
+            raise ValueError(f"Invalid TTML time parameters: {dict(attrib)}") from None
+        if min(frame_rate, numerator, denominator, sub_frame_rate) <= 0 or tick_rate < 0:
+            raise ValueError(f"Invalid TTML time parameters: {dict(attrib)}")
+
+        effective_frame_rate = frame_rate * numerator / denominator
+        if not tick_rate:
+            tick_rate = effective_frame_rate * sub_frame_rate if f"{TTP_NS}frameRate" in attrib else 1
+
+        return cls(effective_frame_rate, sub_frame_rate, tick_rate)
+
+
+#: Time parameters of documents without ``ttp:`` attributes.
+DEFAULT_TIME_PARAMETERS = TTMLTimeParameters()
+
+
 class TTMLFormat(FormatBase):
     """Timed Text Markup Language (TTML) subtitle format implementation"""
 
@@ -33,23 +94,20 @@ class TTMLFormat(FormatBase):
         return f"{h:02d}:{m:02d}:{s:02d}.{ms:03d}"
 
     @staticmethod
-    def timestamp_to_ms(expr: str) -> int:
-        # offset-time (not supported: f, t)
-        m = re.fullmatch(r"(\d+(?:\.\d+)?)(h|m|s|ms)", expr)
-        if m is not None:
-            count = int(m.group(1)) if m.group(1).isnumeric() else float(m.group(1))
-            metric = m.group(2)
-            return make_time(**{metric: count})  # type: ignore[arg-type]
-
-        # clock-time (not supported: frames, subframes)
-        m = re.fullmatch(r"(((?P<h>\d+):)?(?P<m>\d{1,2}):)?(?P<s>\d{2}(?:\.\d+)?)", expr)
-        if m is not None:
-            hours = int(m.group("h")) if m.group("h") else 0
-            minutes = int(m.group("m")) if m.group("m") else 0
-            seconds = int(m.group("s")) if m.group("s").isnumeric() else float(m.group("s"))
-            return make_time(h=hours, m=minutes, s=seconds)
-
-        raise NotImplementedError(f"Unsupported time expression: {expr}")
+    def timestamp_to_ms(expr: str, time_parameters: TTMLTimeParameters = DEFAULT_TIME_PARAMETERS) -> int:
+        """
+        Convert TTML time expression (eg. ``"00:00:01.500"`` or ``"1.5s"``) to ms
+
+        Arguments:
+            expr: Clock-time or offset-time expression.
+            time_parameters: Frame rate and tick rate of the document,
+                needed for frames (``"f"``) and ticks (``"t"``).
+
+        Raises:
+            NotImplementedError: Unsupported time expression (eg. wall-clock time).
+
+        """
+        return _time_expression_to_ms(expr, time_parameters)
 
     @classmethod
     def guess_format(cls, text: str) -> Optional[str]:
@@ -70,7 +128,7 @@ class TTMLFormat(FormatBase):
     ) -> None:
         """
         Rudimentary TTML parser. No formatting/styling apart from newlines is supported.
-        Frame-based time expressions are not supported.
+        Frames and ticks in time expressions are supported, see :class:`TTMLTimeParameters`.
 
         Keyword Args:
             ignore_par_time_offset: Interpret all "begin" and "end" attributes of ``<p>`` elements
@@ -80,15 +138,21 @@ class TTMLFormat(FormatBase):
                 but is used in Apple Music lyrics.
 
         """
-        tree = ET.parse(fp)
-        root = tree.getroot()
+        subs.events.extend(cls.iter_events(subs, fp, format_, ignore_par_time_offset=ignore_par_time_offset,
+                                           **kwargs))
 
-        body_elem = root.find(f"{TT_NS}body")
-        if body_elem is None:
-            return
+    @classmethod
+    def iter_events(cls, subs: "SSAFile", fp: TextIO, format_: str, ignore_par_time_offset: bool = False,
+                    **kwargs: Any) -> Iterator[SSAEvent]:
+        """
+        See :meth:`pysubs2.formats.FormatBase.iter_events()`
 
-        parser = _TTMLParser(subs, ignore_par_time_offset)
-        parser.parse_body(body_elem)
+        This is a streaming implementation: the file is read incrementally and each ``<p>`` element
+        is discarded once it has been converted to :class:`pysubs2.SSAEvent`, so that memory usage
+        does not depend on the size of the file. See :meth:`TTMLFormat.from_file()` for the options.
+
+        """
+        return _TTMLParser(ignore_par_time_offset).iter_events(fp)
 
     @classmethod
     def to_file(cls, subs: "SSAFile", fp: TextIO, format_: str, **kwargs: Any) -> None:
@@ -104,50 +168,19 @@ class TTMLFormat(FormatBase):
             - strikeout
         """
 
-        tt_elem = ET.Element(f"{TT_NS}tt")
-        head_elem = ET.SubElement(tt_elem, f"{TT_NS}head")
-        body_elem = ET.SubElement(tt_elem, f"{TT_NS}body")
-        div_elem = ET.SubElement(body_elem, f"{TT_NS}div")
-        styling_elem = ET.SubElement(head_elem, f"{TT_NS}styling")
-
-        for name, style in subs.styles.items():
-            attrs = {
-                "id": name,
-                **cls.ssastyle_to_tts(style),
-            }
-            ET.SubElement(styling_elem, f"{TT_NS}style", attrs)
+        with cls.get_writer(fp, format_, subs, **kwargs) as writer:
+            for event in subs:
+                writer.write_event(event)
 
-        for event in subs.get_text_events():
-            event_style = subs.styles.get(event.style, SSAStyle.DEFAULT_STYLE)
-            attrs = {
-                "begin": str(cls.ms_to_timestamp(event.start)),
-                "end": str(cls.ms_to_timestamp(event.end)),
-                "style": event.style,
-            }
-            p_elem = ET.SubElement(div_elem, f"{TT_NS}p", attrs)
-
-            runs = parse_tags(event.text, event_style, subs.styles, skip_empty_fragments=True)
+    @classmethod
+    def get_writer(cls, fp: TextIO, format_: str, subs: "SSAFile", **kwargs: Any) -> "TTMLWriter":
+        """
+        See :meth:`pysubs2.formats.FormatBase.get_writer()`
 
-            if len(runs) == 1:
-                fragment, sty = runs[0]
-                p_elem.attrib.update(cls.ssastyle_to_tts(sty, event_style))
-                cls._append_text(p_elem, fragment)
-            else:
-                for fragment, sty in runs:
-                    attrs = cls.ssastyle_to_tts(sty, event_style)
-                    if attrs:
-                        span_elem = ET.SubElement(p_elem, f"{TT_NS}span", attrs)
-                        cls._append_text(span_elem, fragment)
-                    else:
-                        cls._append_text(p_elem, fragment)
-
-        with etree_register_namespace_override():
-            ET.register_namespace("", "http://www.w3.org/ns/ttml")
-            ET.register_namespace("ttm", "http://www.w3.org/ns/ttml#metadata")
-            ET.register_namespace("tts", "http://www.w3.org/ns/ttml#styling")
-            ET.indent(tt_elem)
-            output_xml = ET.tostring(tt_elem).decode("utf-8")
-            print(output_xml, file=fp)
+        The ``<p>`` elements are written to the file one at a time, so that memory usage
+        does not depend on the number of events. See :meth:`TTMLFormat.to_file()` for supported styling.
+        """
+        return TTMLWriter(fp, format_, subs, **kwargs)
 
     @classmethod
     def ssastyle_to_tts(cls, style: SSAStyle, base_style: Optional[SSAStyle] = None) -> dict[str, str]:
@@ -195,63 +228,242 @@ class TTMLFormat(FormatBase):
         etree_append_child_nodes(elem, nodes)
 
 
-class _TTMLParser:
-    def __init__(self, subs: "SSAFile", ignore_par_time_offset: bool = False) -> None:
-        self.subs = subs
-        self.ignore_par_time_offset = ignore_par_time_offset
+# Time expressions are often repeated in a file (eg. "0s"), so they are cached.
+@lru_cache(maxsize=1024)
+def _time_expression_to_ms(expr: str, time_parameters: TTMLTimeParameters) -> int:
+    m = CLOCK_TIME.fullmatch(expr)
+    if m is not None:
+        hours, minutes, seconds, fraction, frames, sub_frames = m.groups()
+        ms: IntOrFloat = 0
+        if frames is not None:
+            frame_count: IntOrFloat = int(frames)
+            if sub_frames is not None:
+                frame_count += int(sub_frames) / time_parameters.sub_frame_rate
+            ms = frame_count * 1000 / time_parameters.frame_rate
+        # same arithmetic as times_to_ms(), so that the result is rounded in the same way
+        ms += (int(seconds) if fraction is None else float(seconds + fraction)) * 1000
+        if minutes:
+            ms += int(minutes) * 60000
+        if hours:
+            ms += int(hours) * 3600000
+        return int(round(ms))
+
+    m = OFFSET_TIME.fullmatch(expr)
+    if m is not None:
+        count_str, metric = m.groups()
+        count = int(count_str) if count_str.isnumeric() else float(count_str)
+        if metric == "f":
+            return times_to_ms(ms=count * 1000 / time_parameters.frame_rate)
+        elif metric == "t":
+            return times_to_ms(ms=count * 1000 / time_parameters.tick_rate)
+        return times_to_ms(**{metric: count})
+
+    raise NotImplementedError(f"Unsupported time expression: {expr}")
+
+
+class TTMLWriter(FormatWriter):
+    """Incremental writer for TTML, see :meth:`TTMLFormat.get_writer()`"""
+
+    # Output is the same as ``ET.indent()`` + ``ET.tostring()`` of the whole document would give,
+    # except that the styling namespace is always declared, since we don't know in advance whether
+    # it will be used. Elements are built and indented one <p> at a time at the depth they would
+    # have in the document, ie. <tt> <body> <div> <p>.
+    P_LEVEL = 3
+
+    def __init__(self, fp: TextIO, format_: str, subs: "SSAFile", **kwargs: Any) -> None:
+        super().__init__(fp, format_, subs)
+        self._div_opened = False
+
+    def _write_header(self) -> None:
+        head_elem = ET.Element(f"{TT_NS}head")
+        styling_elem = ET.SubElement(head_elem, f"{TT_NS}styling")
+        for name, style in self.subs.styles.items():
+            attrs = {
+                "id": name,
+                **TTMLFormat.ssastyle_to_tts(style),
+            }
+            ET.SubElement(styling_elem, f"{TT_NS}style", attrs)
+        ET.indent(head_elem, level=1)
 
-    def parse_body(self, body_elem: ET.Element) -> None:
-        begin_ms = TTMLFormat.timestamp_to_ms(body_elem.attrib.get("begin", "0s"))
-        time_container = TimeContainer(body_elem.attrib.get("timeContainer", "par"))
-        if time_container != TimeContainer.PAR:
-            raise NotImplementedError("Only 'par' timeContainer is supported")
+        self.fp.write('<tt xmlns="http://www.w3.org/ns/ttml" xmlns:tts="http://www.w3.org/ns/ttml#styling">\n  ')
+        self._write_element(head_elem)
+        self.fp.write("\n  <body>")
+
+    def _write_event(self, event: SSAEvent) -> None:
+        p_elem = self.event_to_p_elem(event)
+        if p_elem is None:
+            return
+        ET.indent(p_elem, level=self.P_LEVEL)
+
+        if not self._div_opened:
+            self._div_opened = True
+            self.fp.write("\n    <div>")
+        self.fp.write("\n      ")
+        self._write_element(p_elem)
+
+    def _write_footer(self) -> None:
+        self.fp.write("\n    </div>" if self._div_opened else "\n    <div />")
+        self.fp.write("\n  </body>\n</tt>\n")
+
+    def event_to_p_elem(self, event: SSAEvent) -> Optional[ET.Element]:
+        """Convert event to ``<p>`` element, or return ``None`` if the event has no text to write"""
+        runs = parse_event_tags(event, self.subs.styles, skip_empty_fragments=True)
+        if runs is None:
+            return None
+        event_style = self.subs.styles.get(event.style, SSAStyle.DEFAULT_STYLE)
+        attrs = {
+            "begin": str(TTMLFormat.ms_to_timestamp(event.start)),
+            "end": str(TTMLFormat.ms_to_timestamp(event.end)),
+            "style": event.style,
+        }
+        p_elem = ET.Element(f"{TT_NS}p", attrs)
+
+        if len(runs) == 1:
+            fragment, sty = runs[0]
+            p_elem.attrib.update(TTMLFormat.ssastyle_to_tts(sty, event_style))
+            TTMLFormat._append_text(p_elem, fragment)
+        else:
+            for fragment, sty in runs:
+                attrs = TTMLFormat.ssastyle_to_tts(sty, event_style)
+                if attrs:
+                    span_elem = ET.SubElement(p_elem, f"{TT_NS}span", attrs)
+                    TTMLFormat._append_text(span_elem, fragment)
+                else:
+                    TTMLFormat._append_text(p_elem, fragment)
+
+        return p_elem
+
+    def _write_element(self, elem: ET.Element) -> None:
+        chunks: list[str] = []
+        _serialize_element(elem, chunks)
+        # same as ET.tostring() with its default "us-ascii" encoding
+        self.fp.write("".join(chunks).encode("ascii", "xmlcharrefreplace").decode("ascii"))
+
+
+def _serialize_element(elem: ET.Element, chunks: list[str]) -> None:
+    """
+    Serialize XML element like ``ET.tostring()``, but without namespace declarations
+
+    The element must only use namespaces from :data:`TTML_NAMESPACE_PREFIXES`, which are expected
+    to be declared on the ``<tt>`` element. Output is appended to ``chunks``.
+
+    """
+    tag = _qualified_name(elem.tag)
+    chunks.append("<" + tag)
+    for key, value in elem.items():
+        chunks.append(f' {_qualified_name(key)}="{_escape_attribute(value)}"')
+    if elem.text or len(elem):
+        chunks.append(">")
+        if elem.text:
+            chunks.append(_escape_text(elem.text))
+        for child_elem in elem:
+            _serialize_element(child_elem, chunks)
+        chunks.append(f"</{tag}>")
+    else:
+        chunks.append(" />")
+    if elem.tail:
+        chunks.append(_escape_text(elem.tail))
+
+
+def _qualified_name(name: str) -> str:
+    """Convert ``{namespace}name`` from ElementTree to ``prefix:name``"""
+    if name.startswith("{"):
+        namespace, _, local_name = name.partition("}")
+        return TTML_NAMESPACE_PREFIXES[namespace + "}"] + local_name
+    return name
+
+
+def _escape_text(text: str) -> str:
+    """Escape XML character data"""
+    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+
+def _escape_attribute(text: str) -> str:
+    """Escape XML attribute value (to be enclosed in double quotes)"""
+    return (_escape_text(text).replace("\"", "&quot;")
+            .replace("\r", "&#13;").replace("\n", "&#10;").replace("\t", "&#09;"))
 
-        for div_elem in body_elem.iterfind(f"{TT_NS}div"):
-            self.parse_div(div_elem, begin_ms)
 
-    def parse_div(self, div_elem: ET.Element, parent_begin_ms: int) -> None:
-        begin_ms = TTMLFormat.timestamp_to_ms(div_elem.attrib.get("begin", "0s")) + parent_begin_ms
-        time_container = TimeContainer(div_elem.attrib.get("timeContainer", "par"))
+class _TTMLParser:
+    def __init__(self, ignore_par_time_offset: bool = False) -> None:
+        self.ignore_par_time_offset = ignore_par_time_offset
+        self.time_parameters = DEFAULT_TIME_PARAMETERS
+
+    def iter_events(self, fp: TextIO) -> Iterator[SSAEvent]:
+        # We only look at <p> elements in <div> elements in the first <body> element of <tt>.
+        # Elements are discarded as soon as they are processed; note that iterparse() reads ahead,
+        # so elements may be removed from the tree before we get their "end" event, which is fine
+        # since we only work with the elements from the events.
+        depth = 0
+        body_elem: Optional[ET.Element] = None
+        div_elem: Optional[ET.Element] = None
+        begin_ms_stack: list[int] = []  # begin offsets of current <body> and <div>
+
+        for event, elem in ET.iterparse(fp, events=("start", "end")):
+            if event == "start":
+                depth += 1
+                if depth == 1:
+                    self.time_parameters = TTMLTimeParameters.from_attrib(elem.attrib)
+                elif depth == 2 and body_elem is None and elem.tag == f"{TT_NS}body":
+                    body_elem = elem
+                    begin_ms_stack.append(self.parse_time_container(elem, 0))
+                elif depth == 3 and begin_ms_stack and elem.tag == f"{TT_NS}div":
+                    div_elem = elem
+                    begin_ms_stack.append(self.parse_time_container(elem, begin_ms_stack[-1]))
+            else:
+                if depth == 4 and div_elem is not None:
+                    if elem.tag == f"{TT_NS}p":
+                        yield self.parse_p(elem, begin_ms_stack[-1])
+                    del div_elem[:]
+                elif depth == 3 and body_elem is not None:
+                    if elem is div_elem:
+                        div_elem = None
+                        begin_ms_stack.pop()
+                    del body_elem[:]
+                elif depth == 2 and elem is body_elem:
+                    begin_ms_stack.pop()
+                depth -= 1
+
+    def parse_time_container(self, elem: ET.Element, parent_begin_ms: int) -> int:
+        """Return begin time of <body> or <div> element"""
+        begin_ms = self.timestamp_to_ms(elem.attrib.get("begin", "0s")) + parent_begin_ms
+        time_container = TimeContainer(elem.attrib.get("timeContainer", "par"))
         if time_container != TimeContainer.PAR:
             raise NotImplementedError("Only 'par' timeContainer is supported")
+        return begin_ms
 
-        for p_elem in div_elem.iterfind(f"{TT_NS}p"):
-            self.parse_p(p_elem, begin_ms)
+    def timestamp_to_ms(self, expr: str) -> int:
+        return _time_expression_to_ms(expr, self.time_parameters)
 
-    def parse_p(self, p_elem: ET.Element, parent_begin_ms: int) -> None:
+    def parse_p(self, p_elem: ET.Element, parent_begin_ms: int) -> SSAEvent:
         if self.ignore_par_time_offset:
             parent_begin_ms = 0
 
-        begin_ms = TTMLFormat.timestamp_to_ms(p_elem.attrib.get("begin", "0s")) + parent_begin_ms
+        begin_ms = self.timestamp_to_ms(p_elem.attrib.get("begin", "0s")) + parent_begin_ms
         if "duration" in p_elem.attrib:
-            end_ms = begin_ms + TTMLFormat.timestamp_to_ms(p_elem.attrib["duration"])
+            end_ms = begin_ms + self.timestamp_to_ms(p_elem.attrib["duration"])
         else:
-            end_ms = TTMLFormat.timestamp_to_ms(p_elem.attrib["end"]) + parent_begin_ms
+            end_ms = self.timestamp_to_ms(p_elem.attrib["end"]) + parent_begin_ms
         time_container = TimeContainer(p_elem.attrib.get("timeContainer", "par"))
         if time_container != TimeContainer.PAR:
             raise NotImplementedError("Only 'par' timeContainer is supported")
 
-        event = SSAEvent(start=begin_ms, end=end_ms)
-        self.subs.events.append(event)
+        nodes: list[str] = []
+        self.collect_text_nodes(p_elem, nodes)
+        # Whitespace is collapsed in each text node separately. Nodes are joined with NUL, which cannot
+        # appear in XML and is not whitespace, so that this can be done with one regex call per <p>.
+        text = WHITESPACE.sub(" ", "\0".join(nodes)).replace("\0", "").strip()
+        if "\\N" in text:
+            text = NEWLINE_WITH_WHITESPACE.sub(r"\\N", text)
 
-        for node in etree_iter_child_nodes(p_elem):
-            if isinstance(node, str):
-                event.text += re.sub(r"\s+", " ", node)
-            else:
-                if node.tag == f"{TT_NS}br":
-                    event.text += "\\N"
-                elif node.tag == f"{TT_NS}span":
-                    self.parse_span(event, node)
-
-        event.text = event.text.strip()
-        event.text = re.sub(r"\s*\\N\s*", r"\\N", event.text)
+        return SSAEvent(start=begin_ms, end=end_ms, text=text)
 
-    def parse_span(self, event: SSAEvent, span_elem: ET.Element) -> None:
-        for node in etree_iter_child_nodes(span_elem):
+    def collect_text_nodes(self, elem: ET.Element, nodes: list[str]) -> None:
+        """Append text of <p> or <span> element to the list, with <br> as ``\\N``"""
+        for node in etree_iter_child_nodes(elem):
             if isinstance(node, str):
-                event.text += re.sub(r"\s+", " ", node)
-            else:
-                if node.tag == f"{TT_NS}br":
-                    event.text += "\\N"
-                elif node.tag == f"{TT_NS}span":
-                    self.parse_span(event, node)
+                nodes.append(node)
+            elif node.tag == f"{TT_NS}br":
+                nodes.append("\\N")
+            elif node.tag == f"{TT_NS}span":
+                self.collect_text_nodes(node, nodes)
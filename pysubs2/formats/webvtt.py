@@ -1,8 +1,8 @@
 import re
-from typing import Sequence, Optional, TextIO, Any
+from typing import Sequence, Optional, TextIO, Any, Iterable, ClassVar
 
 from ..ssaevent import SSAEvent
-from .subrip import SubripFormat
+from .subrip import SubripFormat, SubripWriter
 from ..time import make_time
 from ..ssafile import SSAFile
 
@@ -14,6 +14,7 @@ class WebVTTFormat(SubripFormat):
     Currently, this shares implementation with :class:`pysubs2.formats.subrip.SubripFormat`.
     """
     TIMESTAMP = re.compile(r"(\d{0,4}:)?(\d{2}):(\d{2})\.(\d{2,3})")
+    TIMESTAMP_LINE_MIN_COLONS: ClassVar[int] = 2
 
     @staticmethod
     def ms_to_timestamp(ms: int) -> str:
@@ -43,12 +44,28 @@ class WebVTTFormat(SubripFormat):
         """
         See :meth:`pysubs2.formats.SubripFormat.to_file()`, additional SRT options are supported by VTT as well
         """
-        print("WEBVTT\n", file=fp)
         return super(WebVTTFormat, cls).to_file(
             subs=subs, fp=fp, format_=format_, **kwargs)
 
     @classmethod
-    def _get_visible_lines(cls, subs: "SSAFile") -> list[SSAEvent]:
-        visible_lines = super()._get_visible_lines(subs)
-        visible_lines.sort(key=lambda e: e.start)
-        return visible_lines
+    def get_writer(cls, fp: TextIO, format_: str, subs: "SSAFile", **kwargs: Any) -> "WebVTTWriter":
+        """
+        See :meth:`pysubs2.formats.FormatBase.get_writer()`
+
+        Supports the same keyword args as :meth:`pysubs2.formats.SubripFormat.to_file()`.
+        Note that unlike :meth:`WebVTTFormat.to_file()`, the writer does not sort subtitles
+        by start time; they are written in the order they are given.
+        """
+        return WebVTTWriter(fp, format_, subs, **kwargs)
+
+    @classmethod
+    def _get_output_events(cls, subs: "SSAFile") -> Iterable[SSAEvent]:
+        return sorted(subs.events, key=lambda e: e.start)
+
+
+class WebVTTWriter(SubripWriter):
+    """Incremental writer for WebVTT, see :meth:`WebVTTFormat.get_writer()`"""
+    format_class: ClassVar[type[SubripFormat]] = WebVTTFormat
+
+    def _write_header(self) -> None:
+        print("WEBVTT\n", file=self.fp)
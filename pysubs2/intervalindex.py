@@ -0,0 +1,92 @@
+"""
+Index of subtitles by time, see :meth:`pysubs2.SSAFile.events_at()`.
+
+"""
+from bisect import bisect_left, bisect_right
+import heapq
+from typing import Sequence
+
+from .common import IntOrFloat
+from .ssaevent import SSAEvent
+
+
+class IntervalIndex:
+    """
+    Static index of time intervals of events for fast time-range queries.
+
+    Events are sorted by start time and a max-end segment tree is built over them.
+    Queries use binary search to exclude events that start too late, and the tree to skip
+    runs of events that end too early, which gives O(log n + k) lookups in typical subtitle
+    files (k is the number of events returned).
+
+    Events are treated as half-open intervals ``[start, end)``. The index refers to events
+    by their position in the sequence it was built from; it does not notice changes to it,
+    see :meth:`pysubs2.SSAFile.events_at()`.
+
+    """
+
+    def __init__(self, events: Sequence[SSAEvent]) -> None:
+        order = sorted(range(len(events)), key=lambda i: events[i].start)
+        self._positions = order
+        self._starts = [events[i].start for i in order]
+        self._ends = [events[i].end for i in order]
+
+        size = 1
+        while size < len(order):
+            size *= 2
+        self._size = size
+        tree: list[IntOrFloat] = [float("-inf")] * (2 * size)
+        tree[size:size + len(order)] = self._ends
+        for node in range(size - 1, 0, -1):
+            tree[node] = max(tree[2 * node], tree[2 * node + 1])
+        self._max_end = tree
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def _query(self, count: int, after: IntOrFloat) -> list[int]:
+        """Positions of events among the first ``count`` (by start) which end after given time."""
+        result: list[int] = []
+        max_end = self._max_end
+        stack = [(1, 0, self._size)]
+        while stack:
+            node, lo, hi = stack.pop()
+            if lo >= count or max_end[node] <= after:
+                continue
+            if hi - lo == 1:
+                result.append(self._positions[lo])
+            else:
+                mid = (lo + hi) // 2
+                stack.append((2 * node + 1, mid, hi))
+                stack.append((2 * node, lo, mid))
+        result.sort()
+        return result
+
+    def at(self, ms: IntOrFloat) -> list[int]:
+        """Positions of events with ``start <= ms < end``, in ascending order."""
+        return self._query(bisect_right(self._starts, ms), ms)
+
+    def between(self, start: IntOrFloat, end: IntOrFloat) -> list[int]:
+        """Positions of events intersecting ``[start, end)``, ie. ``event.start < end and event.end > start``."""
+        return self._query(bisect_left(self._starts, end), start)
+
+    def overlaps(self) -> list[tuple[int, int]]:
+        """
+        Pairs of positions of events which overlap in time, ie. are visible at the same time.
+
+        Events with zero (or negative) duration do not overlap anything.
+        Each pair ``(i, j)`` has ``i < j``; pairs are sorted.
+
+        """
+        result: list[tuple[int, int]] = []
+        active: list[tuple[IntOrFloat, int]] = []  # heap of (end, position)
+        for start, end, position in zip(self._starts, self._ends, self._positions):
+            if end <= start:
+                continue
+            while active and active[0][0] <= start:
+                heapq.heappop(active)
+            for _, other in active:
+                result.append((other, position) if other < position else (position, other))
+            heapq.heappush(active, (end, position))
+        result.sort()
+        return result
@@ -2,11 +2,13 @@ import re
 import warnings
 from typing import Optional, Any, ClassVar, Literal
 import dataclasses
+from operator import attrgetter
 
-from .common import IntOrFloat
+from .common import IntOrFloat, add_slots
 from .time import ms_to_str, make_time
 
 
+@add_slots
 @dataclasses.dataclass(repr=False, eq=False, order=False)
 class SSAEvent:
     """
@@ -20,6 +22,9 @@ class SSAEvent:
 
     .. tip :: Use :func:`pysubs2.make_time()` to get times in milliseconds.
 
+    .. note :: The class uses ``__slots__``, so attributes other than the fields
+       and properties listed here cannot be set on instances.
+
     Example::
 
         >>> ev = SSAEvent(start=make_time(s=1), end=make_time(s=2.5), text="Hello World!")
@@ -97,8 +102,8 @@ class SSAEvent:
     @property
     def is_drawing(self) -> bool:
         """Returns True if line is SSA drawing tag (ie. not text)"""
-        from .formats.substation import parse_tags
-        return any(sty.drawing for _, sty in parse_tags(self.text))
+        from .formats.substation import is_drawing_text
+        return is_drawing_text(self.text)
 
     @property
     def is_text(self) -> bool:
@@ -142,11 +147,11 @@ class SSAEvent:
 
     def copy(self) -> "SSAEvent":
         """Return a copy of the SSAEvent."""
-        return SSAEvent(**self.as_dict())
+        return SSAEvent(*_get_field_values(self))
 
     def as_dict(self) -> dict[str, Any]:
         # dataclasses.asdict() would recursively dictify Color objects, which we don't want
-        return {field.name: getattr(self, field.name) for field in dataclasses.fields(self)}
+        return dict(zip(_FIELD_NAMES, _get_field_values(self)))
 
     def equals(self, other: "SSAEvent") -> bool:
         """Field-based equality for SSAEvents."""
@@ -188,3 +193,7 @@ class SSAEvent:
 
     def __repr__(self) -> str:
         return f"<SSAEvent type={self.type} start={ms_to_str(self.start)} end={ms_to_str(self.end)} text={self.text!r}>"
+
+
+_FIELD_NAMES: tuple[str, ...] = tuple(field.name for field in dataclasses.fields(SSAEvent))
+_get_field_values = attrgetter(*_FIELD_NAMES)
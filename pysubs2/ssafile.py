@@ -1,13 +1,79 @@
+from array import array
 import io
 from itertools import chain
+from operator import attrgetter
 from pathlib import Path
 import logging
-from typing import Optional, Iterable, Any, overload, Iterator, TextIO, MutableSequence
+from types import TracebackType
+from typing import Optional, Iterable, Any, overload, Iterator, TextIO, MutableSequence, TYPE_CHECKING, Union, cast, Sequence, Callable
 
-from .common import IntOrFloat, PathOrStr
+from .attachments import load_attachments_from, uudecode, uuencode
+from .columnar import ColumnarEventList
+from .common import IntOrFloat, PathOrStr, PrefixedTextIO
+from .intervalindex import IntervalIndex
 from .ssaevent import SSAEvent
 from .ssastyle import SSAStyle
-from .time import make_time, ms_to_str
+from .time import make_time, make_time_map, ms_to_str, shift_times, scale_times, map_times, _get_numpy
+
+if TYPE_CHECKING:
+    from .formats.base import FormatWriter
+
+
+class EventStream(Iterator[SSAEvent]):
+    """
+    Iterator of events read from a file, as returned by :meth:`SSAFile.iter_events()`
+    and :meth:`SSAFile.iter_events_from_file()`.
+
+    The stream is closed once the iterator is exhausted or the reader fails. If you stop
+    iterating early, call :meth:`EventStream.close()`, or use the stream as a context manager::
+
+        subs, events = pysubs2.iter_events("huge-karaoke-file.ass")
+        with events:
+            first_event = next(events)
+
+    Attributes:
+        fp: Text file object the events are read from.
+        close_fp: When true, :meth:`EventStream.close()` also closes ``fp``
+            (this is the case for :meth:`SSAFile.iter_events()`, which opens the file).
+
+    """
+
+    def __init__(self, events: Iterator[SSAEvent], fp: TextIO, pending: Iterable[SSAEvent] = ()) -> None:
+        self._events = events
+        self._pending = list(pending)[::-1]
+        self.fp = fp
+        self.close_fp = False
+
+    def __next__(self) -> SSAEvent:
+        if self._pending:
+            return self._pending.pop()
+        try:
+            return next(self._events)
+        except StopIteration:
+            self.close()
+            raise
+        except Exception:
+            # reader failed, it cannot be resumed
+            self.close()
+            raise
+
+    def close(self) -> None:
+        """Stop reading (so that cleanup of the format reader runs) and close ``fp`` if ``close_fp`` is set."""
+        self._pending.clear()
+        close_events = getattr(self._events, "close", None)
+        try:
+            if close_events is not None:
+                close_events()
+        finally:
+            if self.close_fp:
+                self.fp.close()
+
+    def __enter__(self) -> "EventStream":
+        return self
+
+    def __exit__(self, exc_type: Optional[type[BaseException]], exc_value: Optional[BaseException],
+                 traceback: Optional[TracebackType]) -> None:
+        self.close()
 
 
 class SSAFile(MutableSequence[SSAEvent]):
@@ -28,11 +94,17 @@ class SSAFile(MutableSequence[SSAEvent]):
 
     Attributes:
         events: List of :class:`SSAEvent` instances, ie. individual subtitles.
+            When loaded with ``columnar=True`` (see :meth:`SSAFile.load()`), this is
+            a :class:`pysubs2.columnar.ColumnarEventList` instead, which supports the same
+            list operations. The attribute is typed ``Union[list[SSAEvent], ColumnarEventList]``,
+            code which needs a plain ``list`` should narrow it with ``isinstance()``.
         styles: Dict of :class:`SSAStyle` instances.
         info: Dict with script metadata, ie. ``[Script Info]``.
         aegisub_project: Dict with Aegisub project, ie. ``[Aegisub Project Garbage]``.
-        fonts_opaque: Dict with embedded fonts, ie. ``[Fonts]``.
-        graphics_opaque: Dict with embedded images, ie. ``[Graphics]``.
+        fonts_opaque: Dict with embedded fonts, ie. ``[Fonts]``, as lists of uuencoded lines.
+            See :meth:`SSAFile.get_font()` and :meth:`SSAFile.set_font()` to work with the font files.
+        graphics_opaque: Dict with embedded images, ie. ``[Graphics]``, as lists of uuencoded lines.
+            See :meth:`SSAFile.get_graphic()` and :meth:`SSAFile.set_graphic()` to work with the image files.
         fps: Framerate used when reading the file, if applicable.
         format: Format of source subtitle file, if applicable, eg. ``"srt"``.
 
@@ -43,7 +115,7 @@ class SSAFile(MutableSequence[SSAEvent]):
         "ScaledBorderAndShadow": "yes",
         "Collisions": "Normal"
     }
-    events: list[SSAEvent]
+    events: Union[list[SSAEvent], ColumnarEventList]
     styles: dict[str, SSAStyle]
     info: dict[str, str]
     aegisub_project: dict[str, str]
@@ -51,6 +123,7 @@ class SSAFile(MutableSequence[SSAEvent]):
     graphics_opaque: dict[str, Any]
     fps: Optional[float]
     format: Optional[str]
+    _interval_index: Optional[tuple[object, IntervalIndex]]
 
     def __init__(self) -> None:
         self.events = []
@@ -61,6 +134,7 @@ class SSAFile(MutableSequence[SSAEvent]):
         self.graphics_opaque = {}
         self.fps = None
         self.format = None
+        self._interval_index = None
 
     # ------------------------------------------------------------------------
     # I/O methods
@@ -103,6 +177,9 @@ class SSAFile(MutableSequence[SSAEvent]):
                 be detected from the file, in which case you don't need
                 to specify it here (when given, this argument overrides
                 autodetection).
+            columnar (bool): Store subtitles in :class:`pysubs2.columnar.ColumnarEventList`
+                instead of ``list``. This greatly reduces memory usage for huge files,
+                at the cost of somewhat slower access to individual events.
             kwargs: Extra options for the reader.
 
         Returns:
@@ -166,7 +243,7 @@ class SSAFile(MutableSequence[SSAEvent]):
 
     @classmethod
     def from_file(cls, fp: TextIO, format_: Optional[str] = None, fps: Optional[float] = None,
-                  **kwargs: Any) -> "SSAFile":
+                  columnar: bool = False, **kwargs: Any) -> "SSAFile":
         """
         Read subtitle file from file object.
 
@@ -188,27 +265,123 @@ class SSAFile(MutableSequence[SSAEvent]):
                 be detected from the file, in which case you don't need
                 to specify it here (when given, this argument overrides
                 autodetection).
+            columnar (bool): Store subtitles in :class:`pysubs2.columnar.ColumnarEventList`.
 
         Returns:
             SSAFile
 
         """
         if format_ is None:
-            # Autodetect subtitle format, then read again using correct parser.
-            # The file might be a pipe and we need to read it twice,
-            # so just buffer everything.
-            text = fp.read()
-            fragment = text[:10000]
-            format_ = autodetect_format(fragment)
-            fp = io.StringIO(text)
+            format_, fp = cls._autodetect_format_from_file(fp)
 
         impl = get_format_class(format_)
         subs = cls() # an empty subtitle file
         subs.format = format_
         subs.fps = fps
+        if columnar:
+            subs.events = ColumnarEventList()
         impl.from_file(subs, fp, format_, fps=fps, **kwargs)
+        if columnar and not isinstance(subs.events, ColumnarEventList):
+            # some readers replace the list instead of filling it
+            subs.events = ColumnarEventList(subs.events)
         return subs
 
+    @classmethod
+    def iter_events(cls, path: PathOrStr, encoding: str = "utf-8", format_: Optional[str] = None,
+                    fps: Optional[float] = None, errors: Optional[str] = None,
+                    **kwargs: Any) -> tuple["SSAFile", EventStream]:
+        """
+        Open subtitle file from given path for streaming.
+
+        Unlike :meth:`SSAFile.load()`, this does not build the whole :attr:`SSAFile.events` list.
+        Instead, it returns the file header and an iterator of events which are parsed as you consume
+        them, so that memory usage does not depend on the number of subtitles. This is useful for
+        processing huge files event by event.
+
+        This method is implemented in terms of :meth:`SSAFile.iter_events_from_file()`,
+        see :meth:`SSAFile.load()` for description of the arguments.
+
+        Note:
+            Only some formats (eg. SubStation) can be parsed incrementally, other formats
+            are read whole before the first event is returned. See
+            :meth:`pysubs2.formats.FormatBase.iter_events()`.
+
+        Returns:
+            Tuple ``(subs, events)``, where ``subs`` is :class:`SSAFile` with everything
+            but events (ie. :attr:`SSAFile.info`, :attr:`SSAFile.styles`, etc.) and
+            ``events`` is :class:`EventStream`, an iterator of :class:`SSAEvent`. The file
+            is closed once the iterator is exhausted; if you may stop early, close it with
+            ``events.close()`` or use it as a context manager.
+
+        Example:
+            >>> subs, events = pysubs2.iter_events("huge-karaoke-file.ass")
+            >>> print(subs.info["PlayResX"], subs.styles.keys())
+            >>> with events:
+            ...     for e in events:
+            ...         print(e.text)
+
+        """
+        fp = Path(path).open(encoding=encoding, errors=errors)  # noqa: SIM115 (closed by EventStream)
+        try:
+            subs, events = cls.iter_events_from_file(fp, format_, fps=fps, **kwargs)
+        except BaseException:
+            fp.close()
+            raise
+
+        events.close_fp = True
+        return subs, events
+
+    @classmethod
+    def iter_events_from_file(cls, fp: TextIO, format_: Optional[str] = None, fps: Optional[float] = None,
+                              **kwargs: Any) -> tuple["SSAFile", EventStream]:
+        """
+        Read subtitle file from file object for streaming.
+
+        See :meth:`SSAFile.iter_events()` for full description. The file object must remain
+        open while the returned iterator is being consumed; it is not closed by the iterator.
+
+        Returns:
+            Tuple ``(subs, events)``, see :meth:`SSAFile.iter_events()`.
+
+        """
+        if format_ is None:
+            format_, fp = cls._autodetect_format_from_file(fp)
+
+        impl = get_format_class(format_)
+        subs = cls() # an empty subtitle file
+        subs.format = format_
+        subs.fps = fps
+        events = impl.iter_events(subs, fp, format_, fps=fps, **kwargs)
+
+        # Parse up to the first event, so that the header is available right away.
+        try:
+            first_event = next(events)
+        except StopIteration:
+            return subs, EventStream(events, fp)
+
+        return subs, EventStream(events, fp, [first_event])
+
+    @staticmethod
+    def _autodetect_format_from_file(fp: TextIO) -> tuple[str, TextIO]:
+        """Detect format of given file object, return format identifier and file object to be used for reading."""
+        # Autodetect subtitle format from the beginning of the file, then read again using correct parser.
+        # Seekable files are simply rewound; the file might be a pipe, in which case the fragment
+        # is replayed before the rest of the stream (we never buffer the whole file).
+        position: Optional[int]
+        try:
+            position = fp.tell() if fp.seekable() else None
+        except OSError:
+            position = None
+
+        fragment = fp.read(10000)
+        format_ = autodetect_format(fragment)
+
+        if position is not None:
+            fp.seek(position)
+        else:
+            fp = cast(TextIO, PrefixedTextIO(fragment, fp))
+        return format_, fp
+
     def save(self, path: PathOrStr, encoding: str = "utf-8", format_: Optional[str] = None, fps: Optional[float] = None,
              errors: Optional[str] = None, **kwargs: Any) -> None:
         """
@@ -263,6 +436,8 @@ class SSAFile(MutableSequence[SSAEvent]):
             ext = outpath.suffix.lower()
             format_ = get_format_identifier(ext)
 
+        # attachments loaded with attachments="lazy" must be read before we overwrite their source
+        load_attachments_from(self, outpath)
         with outpath.open("w", encoding=encoding, errors=errors) as fp:
             self.to_file(fp, format_, fps=fps, **kwargs)
 
@@ -298,6 +473,63 @@ class SSAFile(MutableSequence[SSAEvent]):
         impl = get_format_class(format_)
         impl.to_file(self, fp, format_, fps=fps, **kwargs)
 
+    def writer(self, fp: TextIO, format_: str, fps: Optional[float] = None, **kwargs: Any) -> "FormatWriter":
+        """
+        Get incremental writer for file object, using this file as header.
+
+        The writer lets you output subtitles one by one via
+        :meth:`pysubs2.formats.FormatWriter.write_event()`, so that they don't have
+        to be stored in :attr:`SSAFile.events` (which are ignored by the writer).
+        Styles, info and other header data are taken from this :class:`SSAFile`.
+
+        Currently supported for SubStation, SubRip, WebVTT and MicroDVD formats.
+        See :meth:`SSAFile.save()` for description of the arguments.
+
+        Arguments:
+            fp (file object): A file object, ie. :class:`TextIO` instance.
+                Note that the file must be opened in text mode (as opposed to binary).
+
+        Returns:
+            :class:`pysubs2.formats.FormatWriter`, the caller is responsible for
+            calling its ``close()`` method (eg. by using it in ``with`` statement).
+
+        Raises:
+            NotImplementedError: The format does not support incremental writing.
+
+        Example:
+            >>> header = SSAFile()
+            >>> with header.writer(sys.stdout, "srt") as writer:
+            ...     writer.write_event(SSAEvent(start=0, end=1000, text="Hello World!"))
+
+        """
+        impl = get_format_class(format_)
+        return impl.get_writer(fp, format_, self, fps=fps, **kwargs)
+
+    def open_writer(self, path: PathOrStr, format_: Optional[str] = None, encoding: str = "utf-8",
+                    fps: Optional[float] = None, errors: Optional[str] = None, **kwargs: Any) -> "FormatWriter":
+        """
+        Get incremental writer for given path, using this file as header.
+
+        See :meth:`SSAFile.writer()` for full description. The file
+        is closed when the writer is closed.
+
+        """
+        outpath = Path(path)
+        if format_ is None:
+            ext = outpath.suffix.lower()
+            format_ = get_format_identifier(ext)
+
+        impl = get_format_class(format_)
+        load_attachments_from(self, outpath)
+        fp = outpath.open("w", encoding=encoding, errors=errors)
+        try:
+            writer = impl.get_writer(fp, format_, self, fps=fps, **kwargs)
+        except BaseException:
+            fp.close()
+            raise
+        writer.close_fp = True
+        return writer
+
     # ------------------------------------------------------------------------
     # Retiming subtitles
     # ------------------------------------------------------------------------
@@ -324,9 +556,14 @@ class SSAFile(MutableSequence[SSAEvent]):
 
         """
         delta = make_time(h=h, m=m, s=s, ms=ms, frames=frames, fps=fps)
-        for line in self:
-            line.start += delta
-            line.end += delta
+        self._interval_index = None
+        if isinstance(self.events, ColumnarEventList):
+            self.events.transform_times(lambda times: shift_times(times, delta), lambda t: t + delta)
+        else:
+            # for plain list, gathering timestamps into a buffer costs more than the addition itself
+            for line in self:
+                line.start += delta
+                line.end += delta
 
     def transform_framerate(self, in_fps: float, out_fps: float) -> None:
         """
@@ -347,9 +584,80 @@ class SSAFile(MutableSequence[SSAEvent]):
             raise ValueError(f"Framerates must be positive, cannot transform {in_fps} -> {out_fps}")
 
         ratio = in_fps / out_fps
-        for line in self:
-            line.start = int(round(line.start * ratio))
-            line.end = int(round(line.end * ratio))
+
+        def scale_time(t: IntOrFloat) -> int:
+            return int(round(t * ratio))
+
+        self._interval_index = None
+        if isinstance(self.events, ColumnarEventList) or _get_numpy() is not None:
+            self._transform_times(lambda times: scale_times(times, ratio), scale_time)
+        else:
+            # without NumPy, gathering timestamps into a buffer would not pay off for plain list
+            for line in self:
+                line.start = scale_time(line.start)
+                line.end = scale_time(line.end)
+
+    def retime(self, points: Sequence[tuple[IntOrFloat, IntOrFloat]]) -> None:
+        """
+        Retime all subtitles using piecewise-linear map.
+
+        This is useful to synchronize subtitles with a re-edited video, where different
+        parts of the video are shifted (or stretched) by different amounts. The map is given
+        by pairs of corresponding timestamps, which are connected by line segments;
+        see :func:`pysubs2.time.map_times()` for details. Results are rounded
+        to whole milliseconds.
+
+        Arguments:
+            points: Sequence of ``(old_ms, new_ms)`` pairs sorted by ``old_ms``.
+
+        Raises:
+            ValueError: No points given, or points not sorted.
+
+        Example:
+            >>> # first 10 minutes are unchanged, then 5 seconds were cut,
+            >>> # and the rest of the video is slightly slower
+            >>> subs.retime([(0, 0),
+            ...              (make_time(m=10), make_time(m=10)),
+            ...              (make_time(m=10, s=5), make_time(m=10)),
+            ...              (make_time(m=40), make_time(m=40, s=1))])
+
+        """
+        time_map = make_time_map(points)  # validates the points
+        self._interval_index = None
+        self._transform_times(lambda times: map_times(times, points), time_map)
+
+    def _transform_times(self, func: Callable[["array[int]"], "array[int]"],
+                         scalar_func: Callable[[IntOrFloat], int]) -> None:
+        """
+        Apply bulk transformation to start and end times of all subtitles.
+
+        The function gets a contiguous integer array with timestamps and returns
+        a buffer of the same size and type with the new values. This is only done when
+        all timestamps are ints which fit into ``array("q")``; otherwise (float timestamps,
+        or huge ones), ``scalar_func`` is applied to each timestamp instead, so that
+        the timestamps are not rounded before the transformation.
+
+        """
+        events = self.events
+        if isinstance(events, ColumnarEventList):
+            events.transform_times(func, scalar_func)
+            return
+
+        n = len(events)
+        try:
+            times = array("q", map(attrgetter("start"), events))
+            times.extend(map(attrgetter("end"), events))
+            new_times = func(times).tolist()
+        except (TypeError, OverflowError):
+            for e in events:
+                e.start = scalar_func(e.start)
+                e.end = scalar_func(e.end)
+            return
+
+        for e, start in zip(events, new_times):
+            e.start = start
+        for e, end in zip(events, new_times[n:]):
+            e.end = end
 
     # ------------------------------------------------------------------------
     # Working with styles
@@ -403,6 +711,163 @@ class SSAFile(MutableSequence[SSAEvent]):
             if name not in self.styles or overwrite:
                 self.styles[name] = style
 
+    # ------------------------------------------------------------------------
+    # Working with attachments
+    # ------------------------------------------------------------------------
+
+    def get_font(self, name: str) -> bytes:
+        """
+        Get embedded font file, decoded from :attr:`SSAFile.fonts_opaque`.
+
+        Arguments:
+            name (str): Font file name, eg. ``"EBGaramond08-Regular_0.ttf"``.
+
+        Returns:
+            Content of the font file.
+
+        Raises:
+            KeyError: No font named name.
+            ValueError: The font data is corrupted.
+
+        """
+        return uudecode(self.fonts_opaque[name])
+
+    def set_font(self, name: str, data: bytes) -> None:
+        """
+        Embed font file, ie. store it uuencoded in :attr:`SSAFile.fonts_opaque`.
+
+        Arguments:
+            name (str): Font file name, eg. ``"EBGaramond08-Regular_0.ttf"``.
+            data (bytes): Content of the font file.
+
+        Raises:
+            ValueError: name is not a legal name (must be non-empty, without whitespace).
+
+        """
+        self._check_attachment_name(name)
+        self.fonts_opaque[name] = uuencode(data)
+
+    def get_graphic(self, name: str) -> bytes:
+        """
+        Get embedded picture file, decoded from :attr:`SSAFile.graphics_opaque`.
+
+        Arguments:
+            name (str): Picture file name, eg. ``"logo.png"``.
+
+        Returns:
+            Content of the picture file.
+
+        Raises:
+            KeyError: No picture named name.
+            ValueError: The picture data is corrupted.
+
+        """
+        return uudecode(self.graphics_opaque[name])
+
+    def set_graphic(self, name: str, data: bytes) -> None:
+        """
+        Embed picture file, ie. store it uuencoded in :attr:`SSAFile.graphics_opaque`.
+
+        Arguments:
+            name (str): Picture file name, eg. ``"logo.png"``.
+            data (bytes): Content of the picture file.
+
+        Raises:
+            ValueError: name is not a legal name (must be non-empty, without whitespace).
+
+        """
+        self._check_attachment_name(name)
+        self.graphics_opaque[name] = uuencode(data)
+
+    @staticmethod
+    def _check_attachment_name(name: str) -> None:
+        if name.split() != [name]:
+            raise ValueError(f"{name!r} is not a valid attachment name")
+
+    # ------------------------------------------------------------------------
+    # Querying subtitles by time
+    # ------------------------------------------------------------------------
+
+    def events_at(self, ms: IntOrFloat) -> list[SSAEvent]:
+        """
+        Return subtitles which are shown at given time, ie. ``start <= ms < end``.
+
+        The first call builds an index of the subtitles (see :class:`pysubs2.intervalindex.IntervalIndex`),
+        which makes subsequent queries fast (O(log n + k) for k results). The index is dropped when
+        subtitles are added, removed, reordered or retimed through :class:`SSAFile` methods.
+
+        Warning:
+            Changes made to :attr:`SSAEvent.start` and :attr:`SSAEvent.end` of individual subtitles
+            are not tracked. Call :meth:`SSAFile.invalidate_index()` after modifying them directly.
+
+        Arguments:
+            ms: Time in milliseconds.
+
+        Returns:
+            List of :class:`SSAEvent`, in the order in which they appear in :attr:`SSAFile.events`.
+
+        Example:
+            >>> for line in subs.events_at(make_time(h=1, m=23, s=45)):
+            ...     print(line.plaintext)
+
+        """
+        events = self.events
+        return [events[i] for i in self._get_interval_index().at(ms)]
+
+    def events_between(self, start: IntOrFloat, end: IntOrFloat) -> list[SSAEvent]:
+        """
+        Return subtitles which are shown at some point in time range ``[start, end)``.
+
+        These are subtitles with ``event.start < end and event.end > start``.
+        See :meth:`SSAFile.events_at()` for details.
+
+        Arguments:
+            start: Start of the range in milliseconds.
+            end: End of the range in milliseconds (exclusive).
+
+        Returns:
+            List of :class:`SSAEvent`, in the order in which they appear in :attr:`SSAFile.events`.
+
+        """
+        events = self.events
+        return [events[i] for i in self._get_interval_index().between(start, end)]
+
+    def overlaps(self) -> list[tuple[SSAEvent, SSAEvent]]:
+        """
+        Return pairs of subtitles which are shown at the same time.
+
+        Subtitles with zero duration do not overlap anything.
+        See :meth:`SSAFile.events_at()` for details.
+
+        Returns:
+            List of pairs of :class:`SSAEvent`, where the first one appears earlier in :attr:`SSAFile.events`.
+
+        """
+        events = self.events
+        return [(events[i], events[j]) for i, j in self._get_interval_index().overlaps()]
+
+    def invalidate_index(self) -> None:
+        """
+        Drop the time index used by :meth:`SSAFile.events_at()` and similar methods.
+
+        This is only needed after changing times of individual subtitles; the index will be
+        rebuilt on next query.
+
+        """
+        self._interval_index = None
+
+    def _get_interval_index(self) -> IntervalIndex:
+        # The index is also rebuilt when the event list was replaced or modified directly
+        # (eg. ``subs.events.append()``), as far as it can be noticed cheaply.
+        if self._interval_index is not None:
+            events, index = self._interval_index
+            if events is self.events and len(index) == len(self.events):
+                return index
+
+        index = IntervalIndex(self.events)
+        self._interval_index = (self.events, index)
+        return index
+
     # ------------------------------------------------------------------------
     # Helper methods
     # ------------------------------------------------------------------------
@@ -438,7 +903,10 @@ class SSAFile(MutableSequence[SSAEvent]):
 
             new_events.append(e)
 
-        self.events = new_events
+        if isinstance(self.events, ColumnarEventList):
+            self.events = ColumnarEventList(new_events)
+        else:
+            self.events = new_events
 
     def get_text_events(self) -> list[SSAEvent]:
         """
@@ -541,6 +1009,7 @@ class SSAFile(MutableSequence[SSAEvent]):
 
     def sort(self) -> None:
         """Sort subtitles time-wise, in-place."""
+        self._interval_index = None
         self.events.sort()
 
     def __iter__(self) -> Iterator[SSAEvent]:
@@ -566,6 +1035,7 @@ class SSAFile(MutableSequence[SSAEvent]):
         pass
 
     def __setitem__(self, key: Any, value: Any) -> None:
+        self._interval_index = None
         if isinstance(key, int):
             if isinstance(value, SSAEvent):
                 self.events[key] = value
@@ -589,12 +1059,14 @@ class SSAFile(MutableSequence[SSAEvent]):
         pass
 
     def __delitem__(self, key: Any) -> None:
+        self._interval_index = None
         del self.events[key]
 
     def __len__(self) -> int:
         return len(self.events)
 
     def insert(self, index: int, value: SSAEvent) -> None:
+        self._interval_index = None
         if isinstance(value, SSAEvent):
             self.events.insert(index, value)
         else:
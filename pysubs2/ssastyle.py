@@ -1,10 +1,12 @@
 import warnings
 from typing import Any, ClassVar
 import dataclasses
+from operator import attrgetter
 
-from .common import Color, Alignment
+from .common import Color, Alignment, add_slots
 
 
+@add_slots
 @dataclasses.dataclass(repr=False)
 class SSAStyle:
     """
@@ -20,6 +22,9 @@ class SSAStyle:
 
     This class defines equality (equality of all fields).
 
+    .. note :: The class uses ``__slots__``, so attributes other than the fields
+       listed here cannot be set on instances.
+
     Attributes:
         fontname: Font name
         fontsize: Font size (in pixels)
@@ -90,11 +95,11 @@ class SSAStyle:
     drawing: bool = False
 
     def copy(self) -> "SSAStyle":
-        return SSAStyle(**self.as_dict())
+        return SSAStyle(*_get_field_values(self))
 
     def as_dict(self) -> dict[str, Any]:
         # dataclasses.asdict() would recursively dictify Color objects, which we don't want
-        return {field.name: getattr(self, field.name) for field in dataclasses.fields(self)}
+        return dict(zip(_FIELD_NAMES, _get_field_values(self)))
 
     def __repr__(self) -> str:
         return f"<SSAStyle {self.fontsize!r}px" \
@@ -103,4 +108,7 @@ class SSAStyle:
                f" {self.fontname!r}>"
 
 
+_FIELD_NAMES: tuple[str, ...] = tuple(field.name for field in dataclasses.fields(SSAStyle))
+_get_field_values = attrgetter(*_FIELD_NAMES)
+
 SSAStyle.DEFAULT_STYLE = SSAStyle()
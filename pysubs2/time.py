@@ -1,5 +1,8 @@
+from array import array
+from bisect import bisect_right
+from functools import lru_cache
 import re
-from typing import Optional, Sequence, NamedTuple
+from typing import Callable, Optional, Sequence, NamedTuple, Any
 
 from .common import IntOrFloat
 
@@ -176,3 +179,144 @@ def ms_to_str(ms: IntOrFloat, fractions: bool = False) -> str:
         return f"{sgn}{h:01d}:{m:02d}:{s:02d}.{ms:03d}"
     else:
         return f"{sgn}{h:01d}:{m:02d}:{s:02d}"
+
+
+# ------------------------------------------------------------------------
+# Bulk operations on timestamps
+# ------------------------------------------------------------------------
+# Timestamps are passed around in contiguous integer arrays (``array("q")`` or ``array("i")``).
+# If NumPy is installed, the transformation is done on a NumPy view of the buffer; otherwise
+# it falls back to plain Python. Both paths do the same floating-point operations,
+# so that results are identical.
+
+@lru_cache(maxsize=None)
+def _get_numpy() -> Any:
+    try:
+        import numpy  # type: ignore[import-not-found, unused-ignore]
+    except ImportError:
+        return None
+    return numpy
+
+
+def _numpy_to_array(np: Any, values: Any, typecode: str) -> "array[int]":
+    dtype = np.dtype(typecode)
+    if values.size and (values.min() < np.iinfo(dtype).min or values.max() > np.iinfo(dtype).max):
+        raise OverflowError("Timestamp out of range of the buffer")
+    return array(typecode, values.astype(dtype).tobytes())
+
+
+def shift_times(times: "array[int]", delta: int) -> "array[int]":
+    """
+    Add ``delta`` milliseconds to all timestamps in buffer.
+
+    Arguments:
+        times: Timestamps in milliseconds, ie. ``array("q")``.
+        delta: Time shift in milliseconds.
+
+    Returns:
+        New array of timestamps (of the same typecode).
+
+    """
+    np = _get_numpy()
+    if np is not None:
+        values = np.frombuffer(times, dtype=times.typecode)
+        info = np.iinfo(values.dtype)
+        # check the range before adding, int64 addition would silently wrap around
+        if values.size and not (info.min <= int(values.min()) + delta and int(values.max()) + delta <= info.max):
+            raise OverflowError("Timestamp out of range of the buffer")
+        return _numpy_to_array(np, values.astype(np.int64) + delta, times.typecode)
+    else:
+        return array(times.typecode, [t + delta for t in times])
+
+
+def scale_times(times: "array[int]", ratio: float) -> "array[int]":
+    """
+    Multiply all timestamps in buffer by ``ratio``, rounding to whole milliseconds.
+
+    Arguments:
+        times: Timestamps in milliseconds, ie. ``array("q")``.
+        ratio: Scaling factor.
+
+    Returns:
+        New array of timestamps (of the same typecode).
+
+    """
+    np = _get_numpy()
+    if np is not None:
+        values = np.rint(np.frombuffer(times, dtype=times.typecode) * ratio)
+        return _numpy_to_array(np, values, times.typecode)
+    else:
+        return array(times.typecode, [int(round(t * ratio)) for t in times])
+
+
+def map_times(times: "array[int]", points: Sequence[tuple[IntOrFloat, IntOrFloat]]) -> "array[int]":
+    """
+    Transform all timestamps in buffer by piecewise-linear map, rounding to whole milliseconds.
+
+    The map is given by points ``(source_ms, target_ms)`` which are connected by line segments.
+    Timestamps before the first point or after the last point are mapped using the first
+    or the last segment, respectively. A single point means constant shift.
+
+    Arguments:
+        times: Timestamps in milliseconds, ie. ``array("q")``.
+        points: Sequence of ``(source_ms, target_ms)`` pairs, sorted by strictly
+            increasing ``source_ms``.
+
+    Returns:
+        New array of timestamps (of the same typecode).
+
+    Raises:
+        ValueError: No points given, or points not sorted by source time.
+
+    """
+    xs, ys, slopes = _piecewise_linear_map(points)
+    last_segment = len(slopes) - 1
+
+    np = _get_numpy()
+    if np is not None:
+        values = np.frombuffer(times, dtype=times.typecode).astype(np.int64)
+        segments = np.clip(np.searchsorted(xs, values, side="right") - 1, 0, last_segment)
+        x0 = np.asarray(xs)[segments]
+        y0 = np.asarray(ys)[segments]
+        slope = np.asarray(slopes)[segments]
+        return _numpy_to_array(np, np.rint(y0 + (values - x0) * slope), times.typecode)
+    else:
+        return array(times.typecode, map(make_time_map(points), times))
+
+
+def make_time_map(points: Sequence[tuple[IntOrFloat, IntOrFloat]]) -> Callable[[IntOrFloat], int]:
+    """
+    Return function which transforms one timestamp by piecewise-linear map, see :func:`map_times()`.
+
+    Unlike :func:`map_times()`, the returned function also accepts float timestamps
+    and timestamps of any size.
+
+    Raises:
+        ValueError: No points given, or points not sorted by source time.
+
+    """
+    xs, ys, slopes = _piecewise_linear_map(points)
+    last_segment = len(slopes) - 1
+
+    def time_map(t: IntOrFloat) -> int:
+        i = min(max(bisect_right(xs, t) - 1, 0), last_segment)
+        return int(round(ys[i] + (t - xs[i]) * slopes[i]))
+
+    return time_map
+
+
+def _piecewise_linear_map(points: Sequence[tuple[IntOrFloat, IntOrFloat]]) \
+        -> tuple[list[float], list[float], list[float]]:
+    """Validate points of piecewise-linear map and return their coordinates and slopes of segments."""
+    if not points:
+        raise ValueError("Retiming map must have at least one point")
+    if len(points) == 1:
+        (x, y), = points
+        points = [(x, y), (x + 1, y + 1)]
+
+    xs = [float(x) for x, _ in points]
+    ys = [float(y) for _, y in points]
+    if any(x0 >= x1 for x0, x1 in zip(xs, xs[1:])):
+        raise ValueError("Retiming map points must have strictly increasing source times")
+    slopes = [(y1 - y0) / (x1 - x0) for x0, x1, y0, y1 in zip(xs, xs[1:], ys, ys[1:])]
+    return xs, ys, slopes
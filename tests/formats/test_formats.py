@@ -1,7 +1,10 @@
 import multiprocessing
 import itertools
+from pathlib import Path
+from typing import Optional
 import pytest
 import pysubs2
+from pysubs2.formats.base import FormatBase
 
 
 def test_identifier_to_class() -> None:
@@ -48,3 +51,98 @@ def test_97_format_detection_multiprocessing_error() -> None:
             pool.starmap(_test_97_func, zip(range(4), itertools.repeat(0)))
         with pytest.raises(pysubs2.FormatAutodetectionError):
             pool.starmap(_test_97_func, zip(range(4), itertools.repeat(1)))
+
+
+def _guess_format_per_class(content: str) -> set[str]:
+    formats = set()
+    for impl in pysubs2.formats.FORMAT_IDENTIFIER_TO_FORMAT_CLASS.values():
+        guess = impl.guess_format(content)
+        if guess is not None:
+            formats.add(guess)
+    return formats
+
+
+AUTODETECTION_SAMPLES = [
+    "",
+    "1\n00:00:00,000 --> 00:00:01,000\nSubRip\n",
+    "1\r\n00:00:00,000 --> 00:00:01,000\r\nSubRip with Windows newlines\r\n",
+    "WEBVTT\n\n00:00.000 --> 00:01.000\nWebVTT\n",
+    "[Script Info]\n[V4+ Styles]\n[Events]\n",
+    "[Script Info]\n[V4 Styles]\n[Events]\n",
+    "[Script Info]\n[V4 Styles]\n[v4+ styles]\n",
+    "{1}{1}23.976\n{10}{20}MicroDVD\n",
+    "[10][20]MPL2\n[30][40]/italic\n",
+    "00:00:01:TMP\n00:00:05:second line\n",
+    "00:00:01:TMP 00:00:05:ambiguous line\n",
+    "<SAMI>\n<BODY><SYNC Start=0>SAMI</BODY></SAMI>",
+    '<tt xmlns="http://www.w3.org/ns/ttml"><body/></tt>',
+    '{"info": {}, "styles": {}, "events": []}',
+    "[00:02.880 -> 00:07.240]  Whisper JAX\n",
+    "  \n[00:02.880 -> 00:07.240]  Whisper JAX after blank line\n",
+    "1\n00:00:00,000 --> 00:00:01,000\n{10}{20}SubRip and MicroDVD\n",
+    "just some text\nwithout any subtitles\n",
+]
+
+
+@pytest.mark.parametrize("content", AUTODETECTION_SAMPLES)
+def test_detect_formats_matches_guess_format(content: str) -> None:
+    guesses = pysubs2.formats.detect_formats(content)
+    assert {g.format for g in guesses} == _guess_format_per_class(content)
+    assert len(guesses) == len({g.format for g in guesses})
+    assert all(guesses[i].confidence >= guesses[i+1].confidence for i in range(len(guesses) - 1))
+
+
+def test_detect_formats_test_data() -> None:
+    data_dir = Path(__file__).parent.parent / "data"
+    for path in data_dir.glob("*.*"):
+        if path.suffix in (".ass", ".ttml"):
+            content = path.read_text(encoding="utf-8")[:10000]
+            assert {g.format for g in pysubs2.formats.detect_formats(content)} == _guess_format_per_class(content)
+
+
+def test_detect_formats_ranking() -> None:
+    content = "WEBVTT\n\n{10}{20}Both WebVTT and MicroDVD\n"
+    guesses = pysubs2.formats.detect_formats(content)
+    assert [g.format for g in guesses] == ["vtt", "microdvd"]
+    assert guesses[0].confidence > guesses[1].confidence
+
+    with pytest.raises(pysubs2.FormatAutodetectionError) as exc_info:
+        pysubs2.formats.autodetect_format(content)
+    assert exc_info.value.formats == ["vtt", "microdvd"]
+
+
+def test_detect_formats_custom_format(monkeypatch: pytest.MonkeyPatch) -> None:
+    class CustomFormat(FormatBase):
+        @classmethod
+        def guess_format(cls, text: str) -> Optional[str]:
+            return "custom" if text.startswith("CUSTOM") else None
+
+    monkeypatch.setitem(pysubs2.formats.FORMAT_IDENTIFIER_TO_FORMAT_CLASS, "custom", CustomFormat)
+    assert pysubs2.formats.autodetect_format("CUSTOM subtitles") == "custom"
+
+
+def test_format_registry() -> None:
+    registry = pysubs2.formats.FormatRegistry({"srt": "pysubs2.formats.subrip:SubripFormat"})
+    assert list(registry) == ["srt"]
+    assert registry.is_builtin("srt")
+    assert registry["srt"] is pysubs2.formats.SubripFormat
+    assert registry.is_builtin("srt")
+
+    registry["srt"] = pysubs2.formats.MicroDVDFormat
+    assert not registry.is_builtin("srt")
+    registry["vtt"] = pysubs2.formats.WebVTTFormat
+    assert not registry.is_builtin("vtt")
+    assert dict(registry) == {"srt": pysubs2.formats.MicroDVDFormat, "vtt": pysubs2.formats.WebVTTFormat}
+    del registry["srt"]
+    assert "srt" not in registry and len(registry) == 1
+
+
+def test_detect_formats_overridden_builtin(monkeypatch: pytest.MonkeyPatch) -> None:
+    class CustomSubripFormat(pysubs2.formats.SubripFormat):
+        @classmethod
+        def guess_format(cls, text: str) -> Optional[str]:
+            return "srt" if text.startswith("CUSTOM") else None
+
+    monkeypatch.setitem(pysubs2.formats.FORMAT_IDENTIFIER_TO_FORMAT_CLASS, "srt", CustomSubripFormat)
+    assert pysubs2.formats.autodetect_format("CUSTOM subtitles") == "srt"
+    assert pysubs2.formats.detect_formats("1\n00:00:00,000 --> 00:00:01,000\nSubRip\n") == []
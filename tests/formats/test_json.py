@@ -31,3 +31,13 @@ def test_read_unsupported_json_issue_85(tmp_path: Any) -> None:
 
     with pytest.raises(FormatAutodetectionError):
         SSAFile.load(path)
+
+
+def test_read_interns_event_fields() -> None:
+    subs = SSAFile()
+    subs.extend(SSAEvent(style="Some " + "style", name="Actor") for _ in range(2))
+    subs2 = SSAFile.from_string(subs.to_string("json"))
+    assert subs2[0].style == "Some style"
+    assert subs2[0].style is subs2[1].style
+    assert subs2[0].name is subs2[1].name
+    assert subs2[0].type is subs2[1].type
@@ -1,3 +1,4 @@
+import io
 from textwrap import dedent
 
 from pysubs2 import SSAFile, SSAEvent, make_time
@@ -44,3 +45,13 @@ def test_simple_writing() -> None:
         """)
 
     assert subs.to_string("mpl2").strip() == reference_output.strip()
+
+
+def test_iter_events_is_lazy() -> None:
+    fp = io.StringIO("".join(f"[{i * 10}][{i * 10 + 5}] Line {i}\n" for i in range(10000)))
+
+    header, events = SSAFile.iter_events_from_file(fp, "mpl2")
+    assert header.format == "mpl2" and len(header) == 0
+    assert next(events) == SSAEvent(start=0, end=500, text="Line 0")
+    assert fp.tell() < len(fp.getvalue()) // 2
+    assert len(list(events)) == 9999
@@ -1,4 +1,9 @@
+import io
+
+import pytest
+
 import pysubs2
+import pysubs2.formats.sami
 
 
 SAMI_INPUT1 = """\
@@ -163,3 +168,23 @@ def test_sami_basic_tags():
     subs = pysubs2.SSAFile.from_string(SAMI_INPUT2)
     assert len(subs) == 1
     assert subs[0].text == r"Test of {\b1}bold {\i1}italic {\u1}underline {\s1}strikethrough{\s0}{\u0}{\i0}{\b0}"
+
+
+def test_sami_chunked_parsing(monkeypatch: pytest.MonkeyPatch) -> None:
+    ref = pysubs2.SSAFile.from_string(SAMI_INPUT1)
+    for chunk_size in (1, 7, 100):
+        monkeypatch.setattr(pysubs2.formats.sami, "SAMI_CHUNK_SIZE", chunk_size)
+        subs = pysubs2.SSAFile.from_string(SAMI_INPUT1)
+        assert subs.equals(ref)
+
+
+def test_sami_iter_events_is_lazy() -> None:
+    text = "<SAMI><Body>\n" + "".join(f"<SYNC Start={i * 1000}><P>Subtitle {i}\n" for i in range(5000)) + "</Body></SAMI>"
+    fp = io.StringIO(text)
+
+    header, events = pysubs2.SSAFile.iter_events_from_file(fp, "sami")
+    assert header.format == "sami" and len(header) == 0
+    first_event = next(events)
+    assert (first_event.start, first_event.end, first_event.text) == (0, 1000, "Subtitle 0")
+    assert fp.tell() < len(text) // 2
+    assert len(list(events)) == 4999
@@ -2,6 +2,7 @@
 pysubs2.formats.subrip tests
 
 """
+import io
 from textwrap import dedent
 import pytest
 from typing import Any
@@ -223,6 +224,47 @@ def test_keep_unknown_html_tags() -> None:
     assert subs_keep.to_string("srt") == ref_keep.to_string("srt")
 
 
+def test_read_tags_nested_in_unknown_tag() -> None:
+    # supported tags are converted before stripping other tags, even when they are inside one
+    text = dedent("""\
+        1
+        00:00:10,500 --> 00:00:13,000
+        <font <i>Elephant's</i> Dream> is <x <b>long
+
+        """)
+
+    subs = SSAFile.from_string(text)
+    assert subs[0].text == " is <x {\\b1}long"
+    subs = SSAFile.from_string(text, keep_unknown_html_tags=True)
+    assert subs[0].text == "<font {\\i1}Elephant's{\\i0} Dream> is <x {\\b1}long"
+    subs = SSAFile.from_string(text, keep_html_tags=True)
+    assert subs[0].text == "<font <i>Elephant's</i> Dream> is <x <b>long"
+
+
+def test_iter_events() -> None:
+    text = dedent("""\
+        1
+        00:00:01,000 --> 00:00:02,000
+        First
+        2
+        00:00:03,000 --> 00:00:04,000
+        <i>Second</i>
+        with two lines 42
+
+        3
+        00:00:05,000 00:00:06,000
+        Third, without arrow
+        """)
+
+    subs, events = SSAFile.iter_events_from_file(io.StringIO(text), "srt")
+    assert [(e.start, e.end, e.text) for e in events] == [
+        (make_time(s=1), make_time(s=2), "First"),
+        (make_time(s=3), make_time(s=4), "{\\i1}Second{\\i0}\\Nwith two lines 42"),
+        (make_time(s=5), make_time(s=6), "Third, without arrow"),
+    ]
+    assert len(subs) == 0
+
+
 def test_write_drawing() -> None:
     # test for 7bde9a6c3a250cf0880a8a9fe31d1b6a69ff21a0
     subs = SSAFile()
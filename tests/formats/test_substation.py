@@ -2,10 +2,13 @@
 pysubs2.formats.substation tests
 
 """
+import io
 import typing
+from pathlib import Path
 from textwrap import dedent
 from pysubs2 import SSAFile, SSAEvent, SSAStyle, make_time, Color, Alignment
-from pysubs2.formats.substation import color_to_ass_rgba, color_to_ssa_rgb, rgba_to_color, MAX_REPRESENTABLE_TIME, SubstationFormat
+from pysubs2.formats.substation import color_to_ass_rgba, color_to_ssa_rgb, rgba_to_color, MAX_REPRESENTABLE_TIME, SubstationFormat, \
+    SubstationWriter, LazySSAEvent
 import pytest
 
 
@@ -308,6 +311,13 @@ def test_simple_read() -> None:
     assert ref.equals(subs2)
 
 
+def test_read_interns_event_fields() -> None:
+    subs = SSAFile.from_string(SIMPLE_ASS_REF)
+    assert subs[0].style is subs[1].style is subs[2].style
+    assert subs[0].effect is subs[1].effect
+    assert subs[0].type is subs[2].type
+
+
 def test_color_parsing() -> None:
     solid_color = Color(r=1, g=2, b=3)
     transparent_color = Color(r=1, g=2, b=3, a=4)
@@ -494,3 +504,270 @@ def test_empty_layer_issue_87() -> None:
     with pytest.warns(RuntimeWarning, match="Failed to parse layer"):
         subs = SSAFile.from_string(ASS_EMPTY_LAYERS_ISSUE_87)
     assert subs[0].layer == 0
+
+
+def test_iter_events_from_file() -> None:
+    ref = build_ref()
+    subs, events = SSAFile.iter_events_from_file(io.StringIO(SIMPLE_ASS_REF))
+
+    # header is available before consuming any events
+    assert subs.format == "ass"
+    assert subs.info["My Custom Info"] == "Some: Test, String."
+    assert set(subs.styles.keys()) == {"Default", "topleft", "left"}
+    assert len(subs.events) == 0
+
+    events_list = list(events)
+    assert len(events_list) == len(ref)
+    for ev, ev_ref in zip(events_list, ref):
+        assert ev.equals(ev_ref)
+    assert len(subs.events) == 0
+
+
+def test_iter_events(tmp_path: Path) -> None:
+    path = tmp_path / "test.ass"
+    path.write_text(SIMPLE_ASS_REF, encoding="utf-8")
+
+    subs, events = SSAFile.iter_events(path)
+    assert subs.styles["topleft"].bold
+    assert [ev.type for ev in events] == ["Dialogue", "Comment", "Dialogue"]
+    assert events.fp.closed
+
+
+def test_iter_events_close(tmp_path: Path) -> None:
+    path = tmp_path / "test.ass"
+    path.write_text(SIMPLE_ASS_REF, encoding="utf-8")
+
+    _, events = SSAFile.iter_events(path)
+    assert not events.fp.closed
+    events.close()
+    assert events.fp.closed
+
+    with SSAFile.iter_events(path)[1] as events:
+        assert next(events).type == "Dialogue"
+    assert events.fp.closed
+
+
+def test_iter_events_close_runs_reader_cleanup(monkeypatch: pytest.MonkeyPatch) -> None:
+    cleanup = []
+
+    def iter_events(*args: typing.Any, **kwargs: typing.Any) -> typing.Iterator[SSAEvent]:
+        try:
+            yield SSAEvent(text="First")
+            yield SSAEvent(text="Second")
+        finally:
+            cleanup.append(True)
+
+    monkeypatch.setattr(SubstationFormat, "iter_events", iter_events)
+    fp = io.StringIO(SIMPLE_ASS_REF)
+    _, events = SSAFile.iter_events_from_file(fp, "ass")
+    events.close()
+    assert cleanup == [True]
+    assert not fp.closed  # the file object belongs to the caller
+    assert list(events) == []
+
+    _, events = SSAFile.iter_events_from_file(fp, "ass")
+    assert [ev.text for ev in events] == ["First", "Second"]
+    assert cleanup == [True, True]
+
+
+def test_iter_events_is_lazy() -> None:
+    ref = build_ref()
+    for i in range(1000):
+        ref.append(SSAEvent(start=i, end=i+1, text=f"Subtitle {i}"))
+    fp = io.StringIO(ref.to_string("ass"))
+
+    _, events = SSAFile.iter_events_from_file(fp, "ass")
+    first_event = next(events)
+    assert first_event.equals(ref[0])
+    assert fp.tell() < len(fp.getvalue()) // 2
+
+
+def test_iter_events_empty_file() -> None:
+    subs = SSAFile()
+    subs.events.clear()
+    subs, events = SSAFile.iter_events_from_file(io.StringIO(subs.to_string("ass")))
+    assert list(events) == []
+    assert "Default" in subs.styles
+
+
+def test_format_line_column_order() -> None:
+    text = dedent("""\
+        [Script Info]
+        ScriptType: v4.00+
+
+        [V4+ Styles]
+        Format: Name, Fontsize, Fontname, PrimaryColour, Bold, Unknown
+        Style: Big,40,Arial,&H000000FF,-1,whatever
+
+        [Events]
+        Format: Start, End, Layer, Actor, Style, Text
+        Dialogue: 0:00:01.00,0:00:02.00,3,Alice,Big,Hello, world!
+        Comment: 0:00:03.00,0:00:04.00,0,,Big,Comment
+        """)
+
+    subs = SSAFile.from_string(text)
+    assert subs.styles["Big"] == SSAStyle(fontsize=40, fontname="Arial", primarycolor=Color(255, 0, 0), bold=True)
+    assert subs.events == [
+        SSAEvent(start=make_time(s=1), end=make_time(s=2), layer=3, name="Alice", style="Big", text="Hello, world!"),
+        SSAEvent(start=make_time(s=3), end=make_time(s=4), style="Big", text="Comment", type="Comment"),
+    ]
+
+
+def test_format_line_short_style_line() -> None:
+    text = dedent("""\
+        [Script Info]
+        ScriptType: v4.00+
+
+        [V4+ Styles]
+        Format: Fontname, Name, Fontsize
+        Style: Arial
+        Style: Arial,Big,40
+        """)
+
+    with pytest.warns(RuntimeWarning, match="missing Name column"):
+        subs = SSAFile.from_string(text)
+    assert subs.styles["Arial"] == SSAStyle()
+    assert subs.styles["Big"] == SSAStyle(fontname="Arial", fontsize=40)
+
+
+@pytest.mark.parametrize("lazy_events", [False, True])
+def test_format_line_text_not_last(lazy_events: bool) -> None:
+    text = dedent("""\
+        [Script Info]
+        ScriptType: v4.00+
+
+        [Events]
+        Format: Start, End, Text, Style
+        Dialogue: 0:00:01.00,0:00:02.00,Hello, world, again!,Big
+        Dialogue: 0:00:03.00,0:00:04.00,Bye,Default
+        Dialogue: 0:00:05.00,0:00:06.00,Short
+        """)
+
+    subs = SSAFile.from_string(text, "ass", lazy_events=lazy_events)
+    assert [(ev.start, ev.text, ev.style) for ev in subs] == [
+        (make_time(s=1), "Hello, world, again!", "Big"),
+        (make_time(s=3), "Bye", "Default"),
+        (make_time(s=5), "Short", "Default"),
+    ]
+
+
+def test_format_line_without_text_is_ignored() -> None:
+    text = dedent("""\
+        [Script Info]
+        ScriptType: v4.00+
+
+        [Events]
+        Format: Start, End
+        Dialogue: 0,0:00:01.00,0:00:02.00,Default,,0,0,0,,Hello
+        """)
+
+    with pytest.warns(RuntimeWarning, match="format line"):
+        subs = SSAFile.from_string(text, format_="ass")
+    assert subs.events == [SSAEvent(start=make_time(s=1), end=make_time(s=2), text="Hello")]
+
+
+def test_writer_unusual_field_types() -> None:
+    subs = SSAFile()
+    fp = io.StringIO()
+    with subs.writer(fp, "ass") as writer:
+        assert isinstance(writer, SubstationWriter)
+        writer.write_event(SSAEvent(start=1000, end=2000, text="First"))
+        assert fp.getvalue().endswith("Dialogue: 0,0:00:01.00,0:00:02.00,Default,,0,0,0,,First\n")
+        writer.write_event(SSAEvent(start=1000.4, end=2000, layer=True, marginl=1.5, text="Second"))  # type: ignore[arg-type]
+        assert "Dialogue: 0,0:00:01.00,0:00:02.00,Default,,0,0,0,,First\n" in fp.getvalue()
+        assert "Dialogue: -1,0:00:01.00,0:00:02.00,Default,,1.5,0,0,,Second\n" in fp.getvalue()
+        writer.write_event(SSAEvent(start=3000, end=4000, text="Third", type="Comment"))
+    assert fp.getvalue().endswith("Comment: 0,0:00:03.00,0:00:04.00,Default,,0,0,0,,Third\n")
+
+    fp = io.StringIO()
+    subs.events = [SSAEvent(start=1000, end=2000, text="First", marked=True)]
+    subs.to_file(fp, "ssa")
+    assert fp.getvalue().endswith("Dialogue: Marked=1,0:00:01.00,0:00:02.00,Default,,0,0,0,,First\n")
+
+
+def test_to_file_chunks(monkeypatch: pytest.MonkeyPatch) -> None:
+    ref = build_ref()
+    for i in range(10):
+        ref.append(SSAEvent(start=i, end=i+1, text=f"Subtitle {i}"))
+    text = ref.to_string("ass")
+
+    monkeypatch.setattr("pysubs2.formats.substation.SUBSTATION_WRITE_CHUNK_SIZE", 3)
+    assert ref.to_string("ass") == text
+
+
+def test_load_sections() -> None:
+    ref = build_ref()
+    ref.aegisub_project["Video File"] = "movie.mkv"
+    ref.set_font("font.ttf", b"font data")
+    for i in range(1000):
+        ref.append(SSAEvent(start=i, end=i+1, text=f"Subtitle {i}"))
+    text = ref.to_string("ass")
+
+    fp = io.StringIO(text)
+    subs = SSAFile.from_file(fp, "ass", sections={"info", "styles"})
+    assert subs.info == ref.info
+    assert subs.styles == ref.styles
+    assert not subs.fonts_opaque
+    assert len(subs.events) == 0
+    assert fp.tell() < len(text) // 2  # reading stopped after the styles
+
+    subs = SSAFile.from_string(text, sections=["fonts", "events"])
+    assert not subs.info
+    assert not subs.styles
+    assert subs.get_font("font.ttf") == b"font data"
+    assert len(subs.events) == len(ref.events)
+
+    subs = SSAFile.from_string(text, sections=["aegisub"])
+    assert subs.aegisub_project == ref.aegisub_project
+    assert not subs.info
+
+    with pytest.raises(ValueError):
+        SSAFile.from_string(text, sections={"info", "bogus"})
+
+
+def test_lazy_events() -> None:
+    text = dedent("""\
+        [Script Info]
+        ScriptType: v4.00+
+
+        [Events]
+        Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
+        Dialogue: 0,0:00:01.0,0:00:02.00,Default,,0,0,0,,Hello, world!
+        Dialogue: 1,0:00:03.00,0:00:04.00,Signs,,0,0,0,,Sign
+        Comment: 0,bogus,0:00:05.00,Signs,,0,0,0,,Broken
+        """)
+
+    subs = SSAFile.from_string(text, "ass", lazy_events=True)
+    assert all(isinstance(ev, LazySSAEvent) for ev in subs)
+
+    # fields are only decoded when read, so the broken timestamp does not matter unless we read it
+    assert [ev.style for ev in subs] == ["Default", "Signs", "Signs"]
+    with pytest.raises(ValueError):
+        assert subs[2].start >= 0
+    del subs[2]
+
+    ref = SSAFile.from_string(text.replace("Comment: 0,bogus,", "Comment: 0,0:00:00.00,"), "ass")
+    del ref[2]
+    assert subs.equals(ref)
+    first, second = subs
+    assert isinstance(first, LazySSAEvent) and isinstance(second, LazySSAEvent)
+    assert first.raw == "0,0:00:01.0,0:00:02.00,Default,,0,0,0,,Hello, world!"
+
+    # unmodified events are written as they were read
+    subs[1].layer = 1  # setting the same value does not count as modification
+    subs[1].text = "Modified"
+    output = subs.to_string("ass")
+    assert "Dialogue: 0,0:00:01.0,0:00:02.00,Default,,0,0,0,,Hello, world!\n" in output
+    assert "Dialogue: 1,0:00:03.00,0:00:04.00,Signs,,0,0,0,,Modified\n" in output
+    assert first.raw is not None
+    assert second.raw is None
+    assert subs[1].equals(SSAEvent(start=make_time(s=3), end=make_time(s=4), layer=1, style="Signs",
+                                   text="Modified"))
+
+    # column order of the source file is not what we write, so lines are written from the fields
+    text = text.replace("Comment: 0,bogus,0:00:05.00,Signs,,0,0,0,,Broken\n", "")
+    subs = SSAFile.from_string(text.replace("Style, Name,", "Name, Style,"), "ass", lazy_events=True)
+    assert subs[0].name == "Default"
+    assert "Dialogue: 0,0:00:01.00,0:00:02.00,,Default,0,0,0,,Hello, world!\n" in subs.to_string("ass")
+    assert "Dialogue: Marked=0,0:00:01.00,0:00:02.00,Default,,0,0,0,,Hello, world!\n" in \
+           SSAFile.from_string(text, "ass", lazy_events=True).to_string("ssa")
@@ -3,6 +3,7 @@ pysubs2.formats.tmp tests
 
 """
 
+import io
 from textwrap import dedent
 import pytest
 
@@ -129,3 +130,15 @@ def test_overflow_timestamp_write() -> None:
         text = ref.to_string("tmp")
     subs = SSAFile.from_string(text)
     assert subs[0].start == MAX_REPRESENTABLE_TIME
+
+
+def test_iter_events_is_lazy() -> None:
+    fp = io.StringIO("".join(f"{i // 3600:02d}:{i // 60 % 60:02d}:{i % 60:02d}:Line {i}\n" for i in range(10000)))
+
+    header, events = SSAFile.iter_events_from_file(fp, "tmp")
+    assert header.format == "tmp" and len(header) == 0
+    assert next(events) == SSAEvent(start=0, end=1000, text="Line 0")
+    assert fp.tell() < len(fp.getvalue()) // 2
+    events_list = list(events)
+    assert len(events_list) == 9999
+    assert events_list[-1].start == make_time(s=9999)
@@ -3,8 +3,10 @@ pysubs2.formats.ttml tests
 
 """
 
+import io
 import pytest
 from pysubs2 import SSAFile, SSAEvent, SSAStyle
+from pysubs2.formats.ttml import TTMLFormat, TTMLTimeParameters
 import pysubs2
 from pathlib import Path
 
@@ -80,3 +82,128 @@ def test_serialize():
     ])
 
     assert subs.to_string("ttml").strip() == TEST_SERIALIZE_REFERENCE.strip()
+
+
+TEST_PARSE_STRUCTURE = """
+<tt xmlns="http://www.w3.org/ns/ttml">
+  <head/>
+  <body begin="1s">
+    <p begin="0s" end="1s">Not in div, ignored</p>
+    <div begin="1s">
+      <p begin="1s" end="2s">First <span> with <span>nested</span></span> <br/>  span</p>
+      <div><p begin="0s" end="1s">Nested div, ignored</p></div>
+      <p begin="2s" dur="5s" duration="500ms">Second<unknown>ignored</unknown> tail</p>
+    </div>
+    <div>
+      <p begin="1s" end="2s">Third</p>
+    </div>
+  </body>
+  <body>
+    <div><p begin="0s" end="1s">Second body, ignored</p></div>
+  </body>
+</tt>
+"""
+
+
+def test_parse_structure() -> None:
+    subs = SSAFile.from_string(TEST_PARSE_STRUCTURE)
+    assert [(ev.start, ev.end, ev.text) for ev in subs] == [
+        (3000, 4000, "First  with nested\\Nspan"),
+        (4000, 4500, "Second tail"),
+        (2000, 3000, "Third"),
+    ]
+
+
+def test_iter_events_is_lazy() -> None:
+    subs = SSAFile()
+    for i in range(2000):
+        subs.append(SSAEvent(start=i * 1000, end=i * 1000 + 500, text=f"Subtitle {i}"))
+    fp = io.StringIO(subs.to_string("ttml"))
+
+    header, events = SSAFile.iter_events_from_file(fp, "ttml")
+    assert header.format == "ttml" and len(header) == 0
+    first_event = next(events)
+    assert first_event.equals(subs[0])
+    assert fp.tell() < len(fp.getvalue()) // 2
+    assert [ev.text for ev in events] == [ev.text for ev in subs[1:]]
+
+
+def test_writer_is_incremental() -> None:
+    subs = SSAFile()
+    subs.styles.clear()
+    fp = io.StringIO()
+    writer = subs.writer(fp, "ttml")
+    writer.write_event(SSAEvent(start=1000, end=2000, text="First & <second>"))
+    assert fp.getvalue() == (
+        '<tt xmlns="http://www.w3.org/ns/ttml" xmlns:tts="http://www.w3.org/ns/ttml#styling">\n'
+        "  <head>\n"
+        "    <styling />\n"
+        "  </head>\n"
+        "  <body>\n"
+        "    <div>\n"
+        '      <p begin="00:00:01.000" end="00:00:02.000" style="Default">First &amp; &lt;second&gt;</p>'
+    )
+    writer.close()
+    assert fp.getvalue().endswith("</p>\n    </div>\n  </body>\n</tt>\n")
+    assert SSAFile.from_string(fp.getvalue())[0].text == "First & <second>"
+
+
+def test_writer_no_events() -> None:
+    subs = SSAFile()
+    subs.append(SSAEvent(start=0, end=1000, text=r"{\p1}m 0 0 l 100 0 100 100"))
+    assert "\n  <body>\n    <div />\n  </body>\n" in subs.to_string("ttml")
+
+
+def test_timestamp_to_ms() -> None:
+    assert TTMLFormat.timestamp_to_ms("00:01:02.5") == 62500
+    assert TTMLFormat.timestamp_to_ms("1:02:03") == 3723000
+    assert TTMLFormat.timestamp_to_ms("02.25") == 2250
+    assert TTMLFormat.timestamp_to_ms("1.5h") == 5400000
+    assert TTMLFormat.timestamp_to_ms("2m") == 120000
+    assert TTMLFormat.timestamp_to_ms("500ms") == 500
+
+    # default frame rate is 30 and tick rate is 1
+    assert TTMLFormat.timestamp_to_ms("45f") == 1500
+    assert TTMLFormat.timestamp_to_ms("00:00:01:15") == 1500
+    assert TTMLFormat.timestamp_to_ms("3t") == 3000
+
+    time_parameters = TTMLTimeParameters(frame_rate=25, sub_frame_rate=2, tick_rate=10_000_000)
+    assert TTMLFormat.timestamp_to_ms("00:00:01:12.1", time_parameters) == 1500
+    assert TTMLFormat.timestamp_to_ms("12345670000t", time_parameters) == 1234567
+
+    for expr in ["1", "1x", "00:00:01.5:12", "wallclock(\"2024-01-01\")"]:
+        with pytest.raises(NotImplementedError):
+            TTMLFormat.timestamp_to_ms(expr)
+
+
+def test_time_parameters() -> None:
+    ttp = "{http://www.w3.org/ns/ttml#parameter}"
+    assert TTMLTimeParameters.from_attrib({}) == TTMLTimeParameters(30, 1, 1)
+    assert TTMLTimeParameters.from_attrib({f"{ttp}frameRate": "24", f"{ttp}frameRateMultiplier": "1000 1001",
+                                           f"{ttp}subFrameRate": "2"}) == TTMLTimeParameters(24000 / 1001, 2, 48000 / 1001)
+    assert TTMLTimeParameters.from_attrib({f"{ttp}tickRate": "10000000"}) == TTMLTimeParameters(30, 1, 10_000_000)
+
+    for attrib in [{f"{ttp}frameRate": "0"}, {f"{ttp}frameRateMultiplier": "1"}, {f"{ttp}tickRate": "fast"}]:
+        with pytest.raises(ValueError):
+            TTMLTimeParameters.from_attrib(attrib)
+
+
+TEST_PARSE_TICKS_AND_FRAMES = """
+<tt xmlns="http://www.w3.org/ns/ttml" xmlns:ttp="http://www.w3.org/ns/ttml#parameter"
+    ttp:frameRate="24" ttp:frameRateMultiplier="1000 1001" ttp:tickRate="10000000">
+  <body>
+    <div>
+      <p begin="10010000t" end="30030000t">Ticks</p>
+      <p begin="00:00:10:06" end="48f">Frames</p>
+    </div>
+  </body>
+</tt>
+"""
+
+
+def test_parse_ticks_and_frames() -> None:
+    subs = SSAFile.from_string(TEST_PARSE_TICKS_AND_FRAMES)
+    assert [(ev.start, ev.end, ev.text) for ev in subs] == [
+        (1001, 3003, "Ticks"),
+        (10250, 2002, "Frames"),
+    ]
@@ -0,0 +1,88 @@
+"""
+pysubs2.formats.base.FormatWriter tests
+
+"""
+import io
+from pathlib import Path
+
+import pytest
+
+from pysubs2 import SSAFile, SSAEvent, SSAStyle, make_time
+from pysubs2.exceptions import UnknownFPSError
+
+
+def build_ref() -> SSAFile:
+    subs = SSAFile()
+    subs.styles["italic"] = SSAStyle(italic=True)
+    subs.append(SSAEvent(start=make_time(s=1), end=make_time(s=2), text="First subtitle"))
+    subs.append(SSAEvent(start=make_time(s=3), end=make_time(s=4), text="Comment", type="Comment"))
+    subs.append(SSAEvent(start=make_time(s=5), end=make_time(s=6), text="{\\p1}m 0 0 l 100 0 100 100"))
+    subs.append(SSAEvent(start=make_time(s=7), end=make_time(s=8), text="Second\\Nsubtitle", style="italic"))
+    return subs
+
+
+@pytest.mark.parametrize("format_", ["srt", "vtt", "ass", "ssa", "microdvd", "ttml"])
+def test_writer_matches_to_string(format_: str) -> None:
+    subs = build_ref()
+    ref = subs.to_string(format_, fps=25)
+
+    header = build_ref()
+    header.events.clear()
+    fp = io.StringIO()
+    with header.writer(fp, format_, fps=25) as writer:
+        for e in subs:
+            writer.write_event(e)
+
+    assert fp.getvalue() == ref
+
+
+def test_writer_header_only() -> None:
+    subs = build_ref()
+    subs.events.clear()
+    ref = subs.to_string("ass")
+
+    fp = io.StringIO()
+    writer = subs.writer(fp, "ass")
+    writer.close()
+    assert fp.getvalue() == ref
+
+    fp = io.StringIO()
+    writer = subs.writer(fp, "vtt")
+    writer.close()
+    assert fp.getvalue() == "WEBVTT\n\n"
+
+
+def test_writer_is_incremental() -> None:
+    subs = build_ref()
+    fp = io.StringIO()
+    writer = SSAFile().writer(fp, "srt")
+    writer.write_event(subs[0])
+    assert fp.getvalue() == "1\n00:00:01,000 --> 00:00:02,000\nFirst subtitle\n\n"
+    writer.write_event(subs[3])
+    assert fp.getvalue().endswith("2\n00:00:07,000 --> 00:00:08,000\nSecond\nsubtitle\n\n")
+    writer.close()
+
+    with pytest.raises(ValueError):
+        writer.write_event(subs[0])
+
+
+def test_open_writer(tmp_path: Path) -> None:
+    subs = build_ref()
+    path = tmp_path / "test.srt"
+
+    with subs.open_writer(path) as writer:
+        for e in subs:
+            writer.write_event(e)
+
+    assert writer.fp.closed
+    assert path.read_text(encoding="utf-8") == subs.to_string("srt")
+
+
+def test_writer_microdvd_fps() -> None:
+    with pytest.raises(UnknownFPSError):
+        SSAFile().writer(io.StringIO(), "microdvd")
+
+
+def test_writer_unsupported_format() -> None:
+    with pytest.raises(NotImplementedError):
+        SSAFile().writer(io.StringIO(), "json")
@@ -3,9 +3,15 @@ test of SubStation [Fonts] handling
 
 """
 
-from pysubs2 import SSAFile
+import io
+import shutil
 from pathlib import Path
 
+import pytest
+
+from pysubs2 import SSAEvent, SSAFile
+from pysubs2.attachments import LazyAttachment, uudecode, uuencode
+
 current_dir = Path(__file__).parent
 
 FONT_SUBS_AEGISUB_PATH = current_dir / "data/subtitle_with_attached_fonts_aegisub.ass"
@@ -55,76 +61,193 @@ def test_image_passthrough_from_aegisub() -> None:
     subs_pysubs2 = SSAFile.from_string(subs_pysubs2_text)
     assert subs_pysubs2_ref.equals(subs_pysubs2)
 
-# the following tests would be useful if we supported fonts in a non-opaque way
-
-# GARAMOND_REGULAR_PATH = current_dir / "data" / "EBGaramond08-Regular.ttf"
-# GARAMOND_ITALIC_PATH = current_dir / "data" / "EBGaramond08-Italic.ttf"
-#
-#
-# def test_synthetic_empty_font():
-#     fonts = {"empty.ttf": b""}
-#
-#     subs = SSAFile()
-#     subs.events.append(SSAEvent(text="test subtitle"))
-#     subs.fonts.update(fonts)
-#
-#     s = subs.to_string("ass")
-#     subs_loaded = SSAFile.from_string(s)
-#
-#     assert subs.equals(subs_loaded)
-#     assert subs_loaded.fonts == fonts
-#
-#
-# def test_synthetic_single_font():
-#     fonts = {"simple.ttf": b"This is a simple binary file" + bytes(range(256))}
-#
-#     subs = SSAFile()
-#     subs.events.append(SSAEvent(text="test subtitle"))
-#     subs.fonts.update(fonts)
-#
-#     s = subs.to_string("ass")
-#     subs_loaded = SSAFile.from_string(s)
-#
-#     assert subs.equals(subs_loaded)
-#     assert subs_loaded.fonts == fonts
-#
-#
-# def test_synthetic_multiple_fonts():
-#
-#
-#     fonts = {
-#         "first.ttf": b"This is a simple binary file" + bytes(range(256)),
-#         "second.ttf": b"Another binary file"
-#     }
-#
-#     subs = SSAFile()
-#     subs.events.append(SSAEvent(text="test subtitle"))
-#     subs.fonts.update(fonts)
-#
-#     s = subs.to_string("ass")
-#     subs_loaded = SSAFile.from_string(s)
-#
-#     assert subs.equals(subs_loaded)
-#     assert subs_loaded.fonts == fonts
-#
-#
-# def test_real_multiple_fonts():
-#     with GARAMOND_REGULAR_PATH.open("rb") as fp:
-#         garamond_regular_data = fp.read()
-#     with GARAMOND_ITALIC_PATH.open("rb") as fp:
-#         garamond_italic_data = fp.read()
-#
-#     fonts = {
-#         GARAMOND_REGULAR_PATH.name: garamond_regular_data,
-#         GARAMOND_ITALIC_PATH.name: garamond_italic_data
-#     }
-#
-#     subs = SSAFile()
-#     subs.events.append(SSAEvent(text="test subtitle"))
-#     subs.fonts.update(fonts)
-#
-#     s = subs.to_string("ass")
-#     subs_loaded = SSAFile.from_string(s)
-#
-#     assert subs.equals(subs_loaded)
-#     assert subs_loaded.fonts == fonts
+@pytest.mark.parametrize("path", [FONT_SUBS_AEGISUB_PATH, FONT_SUBS_NO_EVENTS_PATH, IMAGE_SUBS_AEGISUB_PATH])
+def test_lazy_attachments(path: Path) -> None:
+    subs_ref = SSAFile.load(path)
+    subs = SSAFile.load(path, attachments="lazy")
+    assert subs.fonts_opaque or subs.graphics_opaque
+
+    for attachments in (subs.fonts_opaque, subs.graphics_opaque):
+        for lines in attachments.values():
+            assert isinstance(lines, LazyAttachment)
+            assert not lines.is_loaded
+
+    assert subs.equals(subs_ref)
+    assert subs.to_string("ass") == subs_ref.to_string("ass")
+
+    name, lines = next(iter({**subs.fonts_opaque, **subs.graphics_opaque}.items()))
+    lines_ref = {**subs_ref.fonts_opaque, **subs_ref.graphics_opaque}[name]
+    assert len(lines) == len(lines_ref)
+    assert lines[-1] == lines_ref[-1]
+    assert lines.is_loaded
+    assert lines == lines_ref
+
+
+def test_lazy_attachments_without_source_file() -> None:
+    with open(FONT_SUBS_AEGISUB_PATH) as fp:
+        text = fp.read()
+
+    subs = SSAFile.from_string(text, attachments="lazy")
+    assert subs.fonts_opaque
+    assert all(isinstance(lines, list) for lines in subs.fonts_opaque.values())
+    assert subs.equals(SSAFile.from_string(text))
+
+
+def test_lazy_attachments_save_in_place(tmp_path: Path) -> None:
+    path = tmp_path / "subs.ass"
+    shutil.copy(FONT_SUBS_AEGISUB_PATH, path)
+    subs_ref = SSAFile.load(path)
+
+    subs = SSAFile.load(path, attachments="lazy")
+    subs.save(path)
+    assert SSAFile.load(path).equals(subs_ref)
+
+
+def test_lazy_attachments_changed_source_file(tmp_path: Path) -> None:
+    path = tmp_path / "subs.ass"
+    shutil.copy(FONT_SUBS_AEGISUB_PATH, path)
+    subs = SSAFile.load(path, attachments="lazy")
+
+    path.write_text("")
+    with pytest.raises(ValueError, match="has changed"):
+        subs.to_string("ass")
+
+
+def test_skip_attachments() -> None:
+    subs_ref = SSAFile.load(FONT_SUBS_AEGISUB_PATH)
+    subs = SSAFile.load(FONT_SUBS_AEGISUB_PATH, attachments="skip")
+    assert not subs.fonts_opaque
+    assert subs.info == subs_ref.info
+    assert subs.styles == subs_ref.styles
+    assert subs.events == subs_ref.events
+
+    subs = SSAFile.load(IMAGE_SUBS_AEGISUB_PATH, attachments="skip")
+    assert not subs.graphics_opaque
+
+    with pytest.raises(ValueError):
+        SSAFile.from_file(io.StringIO(""), "ass", attachments="bogus")
+
+
+GARAMOND_REGULAR_PATH = current_dir / "data" / "EBGaramond08-Regular.ttf"
+GARAMOND_ITALIC_PATH = current_dir / "data" / "EBGaramond08-Italic.ttf"
+
+
+def get_fonts(subs: SSAFile) -> dict[str, bytes]:
+    return {name: subs.get_font(name) for name in subs.fonts_opaque}
+
+
+def test_synthetic_empty_font() -> None:
+    fonts = {"empty.ttf": b""}
+
+    subs = SSAFile()
+    subs.events.append(SSAEvent(text="test subtitle"))
+    subs.set_font("empty.ttf", b"")
+
+    s = subs.to_string("ass")
+    subs_loaded = SSAFile.from_string(s)
+
+    assert subs.equals(subs_loaded)
+    assert get_fonts(subs_loaded) == fonts
+
+
+def test_synthetic_single_font() -> None:
+    fonts = {"simple.ttf": b"This is a simple binary file" + bytes(range(256))}
+
+    subs = SSAFile()
+    subs.events.append(SSAEvent(text="test subtitle"))
+    for name, data in fonts.items():
+        subs.set_font(name, data)
+
+    s = subs.to_string("ass")
+    subs_loaded = SSAFile.from_string(s)
+
+    assert subs.equals(subs_loaded)
+    assert get_fonts(subs_loaded) == fonts
+
+
+def test_synthetic_multiple_fonts() -> None:
+    fonts = {
+        "first.ttf": b"This is a simple binary file" + bytes(range(256)),
+        "second.ttf": b"Another binary file"
+    }
+
+    subs = SSAFile()
+    subs.events.append(SSAEvent(text="test subtitle"))
+    for name, data in fonts.items():
+        subs.set_font(name, data)
+
+    s = subs.to_string("ass")
+    subs_loaded = SSAFile.from_string(s)
+
+    assert subs.equals(subs_loaded)
+    assert get_fonts(subs_loaded) == fonts
+
+
+def test_real_multiple_fonts() -> None:
+    fonts = {
+        GARAMOND_REGULAR_PATH.name: GARAMOND_REGULAR_PATH.read_bytes(),
+        GARAMOND_ITALIC_PATH.name: GARAMOND_ITALIC_PATH.read_bytes(),
+    }
+
+    subs = SSAFile()
+    subs.events.append(SSAEvent(text="test subtitle"))
+    for name, data in fonts.items():
+        subs.set_font(name, data)
+
+    s = subs.to_string("ass")
+    subs_loaded = SSAFile.from_string(s)
+
+    assert subs.equals(subs_loaded)
+    assert get_fonts(subs_loaded) == fonts
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_font_data_from_aegisub(lazy: bool) -> None:
+    subs = SSAFile.load(FONT_SUBS_AEGISUB_PATH, attachments="lazy" if lazy else "load")
+    assert subs.get_font("EBGaramond08-Regular_0.ttf") == GARAMOND_REGULAR_PATH.read_bytes()
+    assert subs.get_font("EBGaramond08-Italic_0.ttf") == GARAMOND_ITALIC_PATH.read_bytes()
+
+    # re-encoding gives the same lines as Aegisub
+    for name, lines in subs.fonts_opaque.items():
+        assert uuencode(subs.get_font(name)) == list(lines)
+
+
+def test_graphic_data_from_aegisub() -> None:
+    subs = SSAFile.load(IMAGE_SUBS_AEGISUB_PATH)
+    assert subs.get_graphic("github.png").startswith(b"\x89PNG")
+    assert subs.get_graphic("github.jpg").startswith(b"\xff\xd8")
+
+    subs_copy = SSAFile()
+    for name, lines in subs.graphics_opaque.items():
+        subs_copy.set_graphic(name, subs.get_graphic(name))
+        assert subs_copy.graphics_opaque[name] == lines
+
+
+def test_uuencode() -> None:
+    data = bytes(range(256)) * 1000
+    for n in [*range(200), len(data) - 1, len(data)]:
+        lines = uuencode(data[:n])
+        assert all(len(line) == 80 for line in lines[:-1])
+        assert uudecode(lines) == data[:n]
+        # line breaks do not matter
+        assert uudecode(["".join(lines)]) == data[:n]
+
+    assert uuencode(b"") == []
+    assert uudecode([]) == b""
+    assert uuencode(b"pysubs2") == ["=(FT>7*T-A"]
+
+    for bad_lines in (["=(FT>7*T-Aa"], ["=(FT>7*T-A!!!"], ["=(FT>7*T- A"], ["=(FT>7*T-\u00e1"]):
+        with pytest.raises(ValueError):
+            uudecode(bad_lines)
+
+
+def test_attachment_names() -> None:
+    subs = SSAFile()
+    for name in ("", "my font.ttf", " font.ttf"):
+        with pytest.raises(ValueError):
+            subs.set_font(name, b"")
+        with pytest.raises(ValueError):
+            subs.set_graphic(name, b"")
+
+    with pytest.raises(KeyError):
+        subs.get_font("missing.ttf")
@@ -1,8 +1,13 @@
+import json
+import socket
 import sys
+import threading
 from typing import Any
 import subprocess
 from io import StringIO
 
+import pytest
+
 from pysubs2.cli import Pysubs2CLI
 
 
@@ -420,3 +425,124 @@ def test_win1250_passthrough_with_surrogateescape(tmp_path: Any) -> None:
         output_bytes = fp.read().replace(b"\r", b"")
 
     assert input_bytes_win1250 == output_bytes
+
+
+def test_parallel_jobs(tmp_path: Any, capsys: Any) -> None:
+    N = 4
+    inpaths = [tmp_path / f"test-{i}.srt" for i in range(N)]
+    for inpath in inpaths:
+        with inpath.open("w", encoding="utf-8") as fp:
+            fp.write(TEST_SRT_FILE)
+    bad_path = tmp_path / "bad.srt"
+    with bad_path.open("w", encoding="utf-8") as fp:
+        fp.write("this is not a subtitle file")
+    missing_path = tmp_path / "missing.srt"
+    output_dir = tmp_path / "output"
+
+    cli = Pysubs2CLI()
+    rv = cli(["--to", "microdvd", "--fps", "1000", "--jobs", "2", "-o", str(output_dir),
+              str(bad_path), str(missing_path)] + [str(p) for p in inpaths])
+    assert rv == 1
+
+    for inpath in inpaths:
+        with (output_dir / inpath.with_suffix(".sub").name).open("r", encoding="utf-8") as fp:
+            assert fp.read() == TEST_MICRODVD_FILE
+    assert not (output_dir / "bad.sub").exists()
+
+    captured = capsys.readouterr()
+    assert f"Skipping {missing_path} (does not exist)" in captured.out
+    assert "Failed to convert 1 of 5 files:" in captured.out
+    assert f"  {bad_path}: FormatAutodetectionError: No suitable formats" in captured.out
+
+
+def test_serve_stream(tmp_path: Any) -> None:
+    inpath = tmp_path / "test.srt"
+    with inpath.open("w", encoding="utf-8") as fp:
+        fp.write(TEST_SRT_FILE)
+    outpath = tmp_path / "out.sub"
+
+    requests = [
+        {"id": 1, "input": str(inpath), "output": str(outpath), "fps": 1000},
+        {"id": 2, "input": str(inpath), "to": "srt", "output_dir": str(tmp_path / "shifted"), "shift": "1s"},
+        {"id": 3, "input": str(tmp_path / "missing.srt")},
+        {"id": 4, "input": str(inpath), "shift": 1000, "shift_back": 1000},
+    ]
+    infile = StringIO("".join(json.dumps(r) + "\n" for r in requests) + "this is not json\n")
+    outfile = StringIO()
+
+    cli = Pysubs2CLI()
+    args = cli.parser.parse_args(["--serve"])
+    args.output_enc = args.input_enc
+    cli.serve_stream(infile, outfile, args, {}, {})
+
+    responses = [json.loads(line) for line in outfile.getvalue().splitlines()]
+    assert [r["id"] for r in responses] == [1, 2, 3, 4, None]
+    assert [r["status"] for r in responses] == ["ok", "ok", "error", "error", "error"]
+    assert responses[0]["output"] == str(outpath)
+    assert responses[1]["output"] == str(tmp_path / "shifted" / "test.srt")
+    assert responses[2]["error"].startswith("FileNotFoundError")
+
+    with outpath.open(encoding="utf-8") as fp:
+        assert fp.read() == TEST_MICRODVD_FILE
+    with (tmp_path / "shifted" / "test.srt").open(encoding="utf-8") as fp:
+        assert "00:00:01,000 --> 00:01:01,000" in fp.read()
+
+
+@pytest.mark.parametrize("request_, error", [
+    ([], "TypeError: Request must be a JSON object, not list"),
+    ("input.srt", "TypeError: Request must be a JSON object, not str"),
+    ({"input": "in.srt", "clean": "yes"}, "TypeError: 'clean' must be true or false"),
+    ({"input": "in.srt", "clean": 1}, "TypeError: 'clean' must be true or false"),
+    ({"input": "in.srt", "shift": [1, 2]}, "TypeError: 'shift' must be a time string"),
+    ({"input": "in.srt", "shift_back": None}, "TypeError: 'shift_back' must be a time string"),
+    ({"input": "in.srt", "shift": True}, "TypeError: 'shift' must be a time string"),
+    ({"input": "in.srt", "transform_framerate": 25}, "TypeError: 'transform_framerate' must be a list of two numbers"),
+    ({"input": "in.srt", "transform_framerate": [25]}, "TypeError: 'transform_framerate' must be a list of two numbers"),
+    ({"input": "in.srt", "transform_framerate": [25, 23.976, 1]}, "TypeError: 'transform_framerate' must be a list"),
+    ({"input": "in.srt", "transform_framerate": ["25", "24"]}, "TypeError: 'transform_framerate' must be a list"),
+    ({"input": "in.srt", "fps": "25"}, "TypeError: 'fps' must be a number"),
+    ({"input": 1}, "TypeError: 'input' must be a string"),
+    ({"input": "in.srt", "output": ["out.srt"]}, "TypeError: 'output' must be a string"),
+    ({"input": "in.srt", "to": 1}, "TypeError: 'to' must be a string"),
+    ({"input": "in.srt", "input_enc": None}, "TypeError: 'input_enc' must be a string"),
+])
+def test_serve_stream_rejects_invalid_request(request_: Any, error: str) -> None:
+    infile = StringIO(json.dumps({"id": 1, **request_} if isinstance(request_, dict) else request_) + "\n")
+    outfile = StringIO()
+
+    cli = Pysubs2CLI()
+    args = cli.parser.parse_args(["--serve"])
+    cli.serve_stream(infile, outfile, args, {}, {})
+
+    response = json.loads(outfile.getvalue())
+    assert response["status"] == "error"
+    assert response["error"].startswith(error)
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="Unix sockets not supported")
+def test_serve_socket(tmp_path: Any) -> None:
+    inpath = tmp_path / "test.srt"
+    with inpath.open("w", encoding="utf-8") as fp:
+        fp.write(TEST_SRT_FILE)
+    socket_path = str(tmp_path / "pysubs2.sock")
+
+    cli = Pysubs2CLI()
+    args = cli.parser.parse_args(["--serve", socket_path, "--to", "microdvd", "--fps", "1000"])
+    args.output_enc = args.input_enc
+    with cli.make_socket_server(socket_path, args, {}, {}) as server:
+        thread = threading.Thread(target=server.serve_forever)
+        thread.start()
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+                client.connect(socket_path)
+                with client.makefile("rw", encoding="utf-8") as fp:
+                    fp.write(json.dumps({"input": str(inpath)}) + "\n")
+                    fp.flush()
+                    response = json.loads(fp.readline())
+        finally:
+            server.shutdown()
+            thread.join()
+
+    assert response == {"id": None, "status": "ok", "output": str(tmp_path / "test.sub")}
+    with (tmp_path / "test.sub").open(encoding="utf-8") as fp:
+        assert fp.read() == TEST_MICRODVD_FILE
@@ -0,0 +1,171 @@
+import pytest
+
+from pysubs2 import SSAFile, SSAEvent, make_time
+from pysubs2.columnar import ColumnarEventList, ColumnarEvent
+
+ASS_TEXT = """\
+[Script Info]
+ScriptType: v4.00+
+
+[V4+ Styles]
+Format: Name, Fontname, Fontsize, PrimaryColour, SecondaryColour, OutlineColour, BackColour, Bold, Italic, Underline, StrikeOut, ScaleX, ScaleY, Spacing, Angle, BorderStyle, Outline, Shadow, Alignment, MarginL, MarginR, MarginV, Encoding
+Style: Default,Arial,20,&H00FFFFFF,&H000000FF,&H00000000,&H00000000,0,0,0,0,100,100,0,0,1,2,2,2,10,10,10,1
+
+[Events]
+Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
+Dialogue: 0,0:00:05.00,0:00:06.00,Default,Alice,0,0,0,,Second
+Comment: 1,0:00:01.00,0:00:02.00,Default,Bob,1,2,3,Banner;10,First{\\i1}line
+Dialogue: 2,0:00:03.00,0:00:04.00,Default,,0,0,0,,Third
+"""
+
+
+def make_events() -> list[SSAEvent]:
+    return [SSAEvent(start=make_time(s=i), end=make_time(s=i + 1), text=f"Subtitle {i}", layer=i % 3,
+                     name=f"Actor {i % 2}", type="Comment" if i % 4 == 0 else "Dialogue")
+            for i in range(10)]
+
+
+def test_columnar_roundtrip() -> None:
+    events = make_events()
+    columnar = ColumnarEventList(events)
+
+    assert len(columnar) == len(events)
+    for ev, ref in zip(columnar, events):
+        assert isinstance(ev, ColumnarEvent)
+        assert ev.equals(ref)
+        assert ev.as_dict() == ref.as_dict()
+    assert columnar == events
+    assert columnar[-1].equals(events[-1])
+    assert [ev.text for ev in columnar[2:5]] == [ev.text for ev in events[2:5]]
+
+
+def test_columnar_view_writes_through() -> None:
+    columnar = ColumnarEventList(make_events())
+
+    ev = columnar[3]
+    ev.text = "changed"
+    ev.shift(s=1)
+    ev.marked = True
+    ev.is_comment = True
+    assert columnar[3].text == "changed"
+    assert columnar[3].start == make_time(s=4)
+    assert columnar[3].marked is True
+    assert columnar[3].type == "Comment"
+
+    plain = columnar[3].copy()
+    assert type(plain) is SSAEvent
+    plain.text = "not written"
+    assert columnar[3].text == "changed"
+
+
+def test_columnar_mutable_sequence() -> None:
+    events = make_events()
+    columnar = ColumnarEventList(events)
+
+    new_event = SSAEvent(start=0, end=1, text="inserted")
+    events.insert(2, new_event)
+    columnar.insert(2, new_event)
+    del events[5]
+    del columnar[5]
+    events[0] = SSAEvent(text="replaced")
+    columnar[0] = SSAEvent(text="replaced")
+    events[-3:] = [SSAEvent(text="a"), SSAEvent(text="b")]
+    columnar[-3:] = [SSAEvent(text="a"), SSAEvent(text="b")]
+    del events[::2]
+    del columnar[::2]
+    removed = columnar.pop()
+    assert removed.text == events.pop().text
+
+    assert [ev.as_dict() for ev in columnar] == [ev.as_dict() for ev in events]
+
+    columnar.clear()
+    assert len(columnar) == 0
+
+    with pytest.raises(TypeError):
+        columnar.append("not an event")  # type: ignore[arg-type]
+
+
+def test_columnar_sort() -> None:
+    events = make_events()[::-1]
+    events.append(SSAEvent(start=make_time(s=5), end=make_time(s=5.5)))
+    columnar = ColumnarEventList(events)
+
+    events.sort()
+    columnar.sort()
+    assert [ev.as_dict() for ev in columnar] == [ev.as_dict() for ev in events]
+
+    columnar.sort(key=lambda ev: ev.text, reverse=True)
+    assert [ev.text for ev in columnar] == sorted((ev.text for ev in events), reverse=True)
+
+
+def test_load_columnar() -> None:
+    ref = SSAFile.from_string(ASS_TEXT)
+    subs = SSAFile.from_string(ASS_TEXT, columnar=True)
+
+    assert isinstance(subs.events, ColumnarEventList)
+    assert subs.equals(ref)
+    assert subs.to_string("ass") == ref.to_string("ass")
+    assert subs.to_string("srt") == ref.to_string("srt")
+
+    subs.shift(s=1)
+    subs.sort()
+    subs.remove_miscellaneous_events()
+    assert isinstance(subs.events, ColumnarEventList)
+    assert [(ev.start, ev.text) for ev in subs] == [(make_time(s=4), "Third"), (make_time(s=6), "Second")]
+
+
+def test_load_columnar_other_formats() -> None:
+    subs = SSAFile.from_string(SSAFile.from_string(ASS_TEXT).to_string("json"), columnar=True)
+    assert isinstance(subs.events, ColumnarEventList)
+    assert len(subs) == 3
+
+
+def test_columnar_storage_is_compacted() -> None:
+    columnar = ColumnarEventList()
+    for i in range(10):
+        columnar[:] = [SSAEvent(start=j, end=j + 1, text=f"{i}/{j}") for j in range(1000)]
+        assert len(columnar._start) <= 2000
+        assert [ev.text for ev in columnar[:3]] == [f"{i}/0", f"{i}/1", f"{i}/2"]
+
+    event = columnar.pop(0)
+    assert isinstance(event, SSAEvent) and event.text == "9/0"
+    for _ in range(600):
+        del columnar[0]
+    assert len(columnar) == 399
+    assert len(columnar._text) < 1000
+    assert [(ev.start, ev.text) for ev in columnar[:2]] == [(601, "9/601"), (602, "9/602")]
+
+    columnar.reverse()
+    assert columnar[0].text == "9/999"
+    columnar.clear()
+    assert len(columnar._text) == 0
+
+
+@pytest.mark.parametrize("start", [1.5, 2**31, 2**63])
+def test_columnar_timestamps_not_fitting_array(start: int) -> None:
+    events = [SSAEvent(start=start, end=2**40), SSAEvent(start=1000, end=2000, layer=1)]
+    columnar = ColumnarEventList(events)
+    assert columnar == events
+    assert [type(ev.start) for ev in columnar] == [type(ev.start) for ev in events]
+
+    columnar.append(SSAEvent(start=3000, end=4000))
+    columnar[1].end = 2.5  # type: ignore[assignment]
+    columnar[1].marginl = 2**40
+    assert (columnar[1].end, columnar[1].marginl) == (2.5, 2**40)
+
+    subs, columnar_subs = SSAFile(), SSAFile()
+    subs.events = [ev.copy() for ev in columnar]
+    columnar_subs.events = columnar
+    for s in (subs, columnar_subs):
+        s.shift(ms=10)
+        s.transform_framerate(25, 50)
+    assert columnar_subs.events == subs.events
+    assert [ev.start for ev in columnar] == [ev.start for ev in subs]
+
+
+def test_columnar_bulk_shift_overflow() -> None:
+    columnar = ColumnarEventList([SSAEvent(start=2**63 - 100, end=2**63 - 1)])
+    subs = SSAFile()
+    subs.events = columnar
+    subs.shift(ms=1000)
+    assert (columnar[0].start, columnar[0].end) == (2**63 + 900, 2**63 + 999)
@@ -1,5 +1,6 @@
+import io
 from pysubs2 import Color
-from pysubs2.common import etree_register_namespace_override
+from pysubs2.common import etree_register_namespace_override, PrefixedTextIO
 import pytest
 import xml.etree.ElementTree as ET
 
@@ -23,3 +24,23 @@ def test_etree_register_namespace_override() -> None:
         assert ET.tostring(test_xml_elem) == b'<test xmlns="http://my-namespace" />'
 
     assert ET.tostring(test_xml_elem) == b'<ns0:test xmlns:ns0="http://my-namespace" />'
+
+
+def test_prefixed_text_io() -> None:
+    rest = io.StringIO("ne 2\nline 3\nline 4")
+    fp = PrefixedTextIO("line 1\nli", rest)
+    assert fp.readline() == "line 1\n"
+    assert fp.readline() == "line 2\n"
+    assert list(fp) == ["line 3\n", "line 4"]
+
+    fp = PrefixedTextIO("abc", io.StringIO("def"))
+    assert fp.read(2) == "ab"
+    assert fp.read(2) == "cd"
+    assert fp.read() == "ef"
+    assert fp.read() == ""
+
+    fp = PrefixedTextIO("", io.StringIO("abc"))
+    assert fp.read() == "abc"
+
+    fp = PrefixedTextIO("", io.TextIOWrapper(io.BytesIO(), encoding="latin-1", errors="surrogateescape"))
+    assert (fp.encoding, fp.errors) == ("latin-1", "surrogateescape")
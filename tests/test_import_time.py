@@ -0,0 +1,66 @@
+"""
+Guard import time of ``import pysubs2``, see ``python -X importtime``.
+
+Format classes are imported lazily (see :class:`pysubs2.formats.FormatRegistry`) and the CLI
+is only imported when needed, so modules with heavy dependencies should not be imported
+until they are actually used.
+
+"""
+import subprocess
+import sys
+
+import pytest
+
+HEAVY_MODULES = [
+    "xml.etree.ElementTree",
+    "html.parser",
+    "json",
+    "multiprocessing",
+    "concurrent.futures",
+    "socketserver",
+    "pysubs2.cli",
+    "pysubs2.formats.sami",
+    "pysubs2.formats.ttml",
+    "pysubs2.formats.jsonformat",
+]
+
+
+def get_imported_modules(code: str) -> set[str]:
+    cmd = [sys.executable, "-X", "importtime", "-c", code]
+    p = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, check=True)
+    modules = set()
+    for line in p.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if line.startswith("import time:") and "|" in line:
+            name = line.rsplit("|", 1)[1].strip()
+            if not name.startswith("imported package"):
+                modules.add(name)
+    return modules
+
+
+def test_import_pysubs2() -> None:
+    modules = get_imported_modules("import pysubs2")
+    assert "pysubs2.ssafile" in modules
+    assert [m for m in HEAVY_MODULES if m in modules] == []
+
+
+def test_load_srt_imports_only_needed_modules() -> None:
+    code = ("import pysubs2; "
+            "subs = pysubs2.SSAFile.from_string('1\\n00:00:00,000 --> 00:00:01,000\\nHello\\n'); "
+            "assert subs.format == 'srt'; "
+            "subs.to_string('ass')")
+    modules = get_imported_modules(code)
+    assert [m for m in HEAVY_MODULES if m in modules] == []
+
+
+@pytest.mark.parametrize("code, module", [
+    ("import pysubs2; pysubs2.SSAFile.from_string('<tt xmlns=\"http://www.w3.org/ns/ttml\"><body/></tt>')",
+     "pysubs2.formats.ttml"),
+    ("import pysubs2; pysubs2.SSAFile().to_string('json')", "pysubs2.formats.jsonformat"),
+    ("import pysubs2; pysubs2.cli", "pysubs2.cli"),
+    ("from pysubs2.formats import SAMIFormat", "pysubs2.formats.sami"),
+])
+def test_lazy_modules_are_imported_on_use(code: str, module: str) -> None:
+    # modules imported by importlib.import_module() are not reported by -X importtime
+    cmd = [sys.executable, "-c", f"{code}; import sys; print({module!r} in sys.modules)"]
+    assert subprocess.check_output(cmd, text=True).strip() == "True"
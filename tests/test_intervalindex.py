@@ -0,0 +1,88 @@
+import random
+
+from pysubs2 import SSAFile, SSAEvent, make_time
+from pysubs2.intervalindex import IntervalIndex
+
+
+def make_random_events(n: int, seed: int = 0) -> list[SSAEvent]:
+    rng = random.Random(seed)
+    events = []
+    for _ in range(n):
+        start = rng.randint(0, 10_000)
+        duration = rng.choice([0, rng.randint(1, 100), rng.randint(100, 3000)])
+        events.append(SSAEvent(start=start, end=start + duration))
+    return events
+
+
+def test_queries_match_linear_scan() -> None:
+    events = make_random_events(500)
+    index = IntervalIndex(events)
+
+    for ms in range(-10, 13_000, 37):
+        assert index.at(ms) == [i for i, e in enumerate(events) if e.start <= ms < e.end]
+
+    rng = random.Random(1)
+    for _ in range(200):
+        a = rng.randint(-100, 13_000)
+        b = a + rng.randint(0, 2000)
+        assert index.between(a, b) == [i for i, e in enumerate(events) if e.start < b and e.end > a]
+
+    ref_overlaps = [(i, j) for i, e in enumerate(events) for j, f in enumerate(events)
+                    if i < j and e.start < e.end and f.start < f.end and e.start < f.end and f.start < e.end]
+    assert index.overlaps() == ref_overlaps
+
+
+def test_empty_index() -> None:
+    index = IntervalIndex([])
+    assert index.at(0) == []
+    assert index.between(0, 1000) == []
+    assert index.overlaps() == []
+
+
+def test_ssafile_events_at() -> None:
+    subs = SSAFile()
+    e1 = SSAEvent(start=0, end=make_time(s=5), text="first")
+    e2 = SSAEvent(start=make_time(s=2), end=make_time(s=3), text="second")
+    e3 = SSAEvent(start=make_time(s=10), end=make_time(s=11), text="third")
+    subs.extend([e3, e1, e2])
+
+    assert subs.events_at(make_time(s=2.5)) == [e1, e2]
+    assert subs.events_at(make_time(s=3)) == [e1]
+    assert subs.events_at(make_time(s=5)) == []
+    assert subs.events_between(make_time(s=4), make_time(s=10)) == [e1]
+    assert subs.events_between(make_time(s=4), make_time(s=10.5)) == [e3, e1]
+    assert subs.overlaps() == [(e1, e2)]
+
+
+def test_ssafile_index_invalidation() -> None:
+    subs = SSAFile()
+    e1 = SSAEvent(start=0, end=1000, text="first")
+    e2 = SSAEvent(start=2000, end=3000, text="second")
+    subs.append(e1)
+    assert subs.events_at(500) == [e1]
+
+    subs.append(e2)
+    assert subs.events_at(2500) == [e2]
+
+    subs.shift(ms=100)
+    assert subs.events_at(50) == []
+    assert subs.events_at(2050) == []
+    assert subs.events_at(2500) == [e2]
+
+    subs[1] = e3 = SSAEvent(start=500, end=600)
+    assert subs.events_at(550) == [e1, e3]
+    del subs[0]
+    assert subs.events_at(550) == [e3]
+
+    # direct modification of the list is noticed through its length
+    subs.events.append(e2)
+    assert subs.events_at(2500) == [e2]
+    subs.events = [e1]
+    assert subs.events_at(2500) == []
+
+    # changes to individual events are not tracked
+    e1.start = 5000
+    e1.end = 6000
+    assert subs.events_at(5500) == []
+    subs.invalidate_index()
+    assert subs.events_at(5500) == [e1]
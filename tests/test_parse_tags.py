@@ -1,5 +1,7 @@
-from pysubs2 import SSAStyle
-from pysubs2.formats.substation import parse_tags
+import itertools
+
+from pysubs2 import SSAStyle, SSAEvent
+from pysubs2.formats.substation import parse_tags, parse_event_tags, is_drawing_text
 
 
 def test_no_tags() -> None:
@@ -61,3 +63,50 @@ def test_no_drawing_tag() -> None:
     for fragment_text, fragment_style in fragments:
         assert fragment_text == "test"
         assert fragment_style.drawing is False
+
+
+def test_many_override_sequences() -> None:
+    text = "".join(rf"{{\k10\i{i % 2}}}syllable {i} " for i in range(500))
+
+    fragments = parse_tags(text)
+    assert len(fragments) == 501
+    assert fragments[0] == ("", SSAStyle())
+    for i, (fragment_text, fragment_style) in enumerate(fragments[1:]):
+        assert fragment_text == f"syllable {i} "
+        assert fragment_style.italic == bool(i % 2)
+
+    # each fragment gets its own style instance
+    assert len({id(sty) for _, sty in fragments}) == len(fragments)
+
+
+def test_parse_tags_uses_current_style() -> None:
+    text = r"{\rstyle}test"
+    styles = {"style": SSAStyle(fontname="Arial")}
+    assert parse_tags(text, styles=styles)[1][1].fontname == "Arial"
+
+    # parsed tags are cached, styles are not
+    styles["style"].fontname = "Verdana"
+    assert parse_tags(text, styles=styles)[1][1].fontname == "Verdana"
+    base_style = SSAStyle(bold=True)
+    assert parse_tags(r"{\i1}test", base_style)[1][1] == SSAStyle(bold=True, italic=True)
+    base_style.bold = False
+    assert parse_tags(r"{\i1}test", base_style)[1][1] == SSAStyle(italic=True)
+
+
+def test_is_drawing_text() -> None:
+    tags = ["", r"\p1", r"\p0", r"\p2", r"\r", r"\rstyle", r"\i1", r"\pos(1,2)"]
+    for a, b, c in itertools.product(tags, repeat=3):
+        for text in (f"{{{a}}}m 0 0 l 1 1{{{b}}}text{{{c}}}", f"{{{a}{b}}}m 0 0{{{c}}}"):
+            expected = any(sty.drawing for _, sty in parse_tags(text))
+            assert is_drawing_text(text) == expected, text
+
+
+def test_parse_event_tags() -> None:
+    styles = {"Default": SSAStyle(), "Italic": SSAStyle(italic=True)}
+
+    event = SSAEvent(text=r"Hello, {\b1}world", style="Italic")
+    assert parse_event_tags(event, styles) == parse_tags(event.text, styles["Italic"], styles)
+    assert parse_event_tags(SSAEvent(text=r"{\b1}", style="Unknown"), styles, skip_empty_fragments=True) == []
+
+    assert parse_event_tags(SSAEvent(text="Comment", type="Comment"), styles) is None
+    assert parse_event_tags(SSAEvent(text=r"{\p1}m 0 0 l 100 0 100 100{\p0}"), styles) is None
@@ -1,3 +1,5 @@
+import weakref
+
 import pytest
 
 from pysubs2 import SSAEvent, make_time
@@ -86,3 +88,16 @@ def test_fields() -> None:
             "start", "end", "text", "marked", "layer", "style",
             "name", "marginl", "marginr", "marginv", "effect", "type"
         ])
+
+
+def test_slots() -> None:
+    ev = SSAEvent(start=1, end=2, text="Hello")
+    assert not hasattr(ev, "__dict__")
+    with pytest.raises(AttributeError):
+        ev.txet = "typo"  # type: ignore[attr-defined]
+    assert weakref.ref(ev)() is ev
+
+    ev2 = ev.copy()
+    assert ev2 is not ev and ev2.equals(ev)
+    assert ev.as_dict() == {"start": 1, "end": 2, "text": "Hello", "marked": False, "layer": 0, "style": "Default",
+                            "name": "", "marginl": 0, "marginr": 0, "marginv": 0, "effect": "", "type": "Dialogue"}
@@ -1,6 +1,8 @@
+import io
 import pytest
 
 from pysubs2 import SSAFile, SSAStyle, SSAEvent, make_time
+from pysubs2.columnar import ColumnarEventList
 
 
 def test_repr_default() -> None:
@@ -111,6 +113,72 @@ def test_transform_framerate() -> None:
     assert subs[1] == SSAEvent(start=500, end=505)
 
 
+def test_retime() -> None:
+    subs = SSAFile()
+    subs.append(SSAEvent(start=0, end=1000))
+    subs.append(SSAEvent(start=make_time(m=10, s=2), end=make_time(m=10, s=4)))
+    subs.append(SSAEvent(start=make_time(m=30), end=make_time(m=31)))
+
+    # 5 seconds cut from 10:00
+    subs.retime([(0, 0),
+                 (make_time(m=10), make_time(m=10)),
+                 (make_time(m=10, s=5), make_time(m=10)),
+                 (make_time(m=40), make_time(m=39, s=55))])
+    assert [(e.start, e.end) for e in subs] == [
+        (0, 1000),
+        (make_time(m=10), make_time(m=10)),
+        (make_time(m=29, s=55), make_time(m=30, s=55)),
+    ]
+
+    with pytest.raises(ValueError):
+        subs.retime([])
+
+
+@pytest.mark.parametrize("backend", ["numpy", "python"])
+def test_transform_times_float_and_huge_timestamps(backend: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    if backend == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr("pysubs2.time._get_numpy", lambda: None)
+        monkeypatch.setattr("pysubs2.ssafile._get_numpy", lambda: None)
+
+    # float timestamps are not rounded before the transformation
+    subs = SSAFile()
+    subs.append(SSAEvent(start=1.5, end=2.5))  # type: ignore[arg-type]
+    subs.transform_framerate(1, 0.5)
+    assert (subs[0].start, subs[0].end) == (3, 5)
+
+    subs = SSAFile()
+    subs.append(SSAEvent(start=1.5, end=2.5))  # type: ignore[arg-type]
+    subs.retime([(0, 0), (10, 20)])
+    assert (subs[0].start, subs[0].end) == (3, 5)
+
+    # timestamps out of range of int64 still work
+    huge = 2**70
+    subs = SSAFile()
+    subs.append(SSAEvent(start=0, end=1000))
+    subs.append(SSAEvent(start=huge, end=huge))
+    subs.transform_framerate(1, 0.5)
+    assert [(e.start, e.end) for e in subs] == [(0, 2000), (2 * huge, 2 * huge)]
+    subs.retime([(0, 0), (10, 5)])
+    assert [(e.start, e.end) for e in subs] == [(0, 1000), (huge, huge)]
+
+
+def test_retime_columnar() -> None:
+    subs = SSAFile()
+    for i in range(10):
+        subs.append(SSAEvent(start=i * 1000, end=i * 1000 + 500))
+    columnar_subs = SSAFile()
+    columnar_subs.events = ColumnarEventList(subs)
+
+    for s in (subs, columnar_subs):
+        s.shift(ms=-100)
+        s.transform_framerate(25, 23.976)
+        s.retime([(0, 0), (5000, 6000)])
+
+    assert [(e.start, e.end) for e in columnar_subs] == [(e.start, e.end) for e in subs]
+
+
 def test_insertion_of_wrong_type() -> None:
     subs = SSAFile()
     subs.append(SSAEvent())
@@ -147,3 +215,29 @@ def test_slice_api() -> None:
     assert subs[0].text == "X"
     assert subs[1].text == "Y"
     assert subs[2].text == "Z"
+
+
+class NonSeekableStringIO(io.StringIO):
+    def seekable(self) -> bool:
+        return False
+
+
+def test_from_file_autodetection_rewinds_seekable_file() -> None:
+    text = "".join(f"{i}\n00:00:{i:02d},000 --> 00:00:{i+1:02d},000\nSubtitle {i}\n\n" for i in range(50))
+    fp = io.StringIO("some prefix which is not read\n" + text)
+    fp.readline()
+    subs = SSAFile.from_file(fp)
+    assert subs.format == "srt"
+    assert len(subs) == 50
+    assert subs[0].text == "Subtitle 0"
+
+
+def test_from_file_autodetection_non_seekable_file() -> None:
+    # longer than the autodetection fragment, so that it gets split
+    text = "".join(f"{i}\n00:00:{i % 60:02d},000 --> 00:00:{i % 60:02d},500\nSubtitle {i}\n\n" for i in range(1000))
+    assert len(text) > 10000
+    ref = SSAFile.from_string(text)
+
+    subs = SSAFile.from_file(NonSeekableStringIO(text))
+    assert subs.format == "srt"
+    assert ref.equals(subs)
@@ -1,3 +1,5 @@
+import weakref
+
 import pytest
 
 from pysubs2 import SSAStyle
@@ -41,3 +43,15 @@ def test_fields() -> None:
 
             "drawing"
         ])
+
+
+def test_slots() -> None:
+    style = SSAStyle(bold=True)
+    assert not hasattr(style, "__dict__")
+    assert weakref.ref(style)() is style
+
+    style2 = style.copy()
+    assert style2 is not style
+    assert style2 == style
+    style2.italic = True
+    assert style.italic is False
@@ -2,12 +2,14 @@
 pysubs2.time tests
 
 """
+import random
 import typing
+from array import array
 from fractions import Fraction
 import pytest
 
 from pysubs2.time import TIMESTAMP, TIMESTAMP_SHORT, timestamp_to_ms, times_to_ms, ms_to_times, Times, frames_to_ms, \
-    ms_to_frames, ms_to_str
+    ms_to_frames, ms_to_str, shift_times, scale_times, map_times
 
 
 # helper functions
@@ -201,3 +203,57 @@ def test_ms_to_str() -> None:
     assert ms_to_str(-h2ms(1)) == "-1:00:00"
     assert ms_to_str(-h2ms(1), fractions=True) == "-1:00:00.000"
     assert ms_to_str(h2ms(1000)) == "1000:00:00"
+
+
+@pytest.fixture(params=["numpy", "python"])
+def bulk_backend(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr("pysubs2.time._get_numpy", lambda: None)
+    return typing.cast(str, request.param)
+
+
+def random_times(n: int = 1000) -> "array[int]":
+    rng = random.Random(42)
+    return array("q", [rng.randint(-10_000, 20_000_000) for _ in range(n)] + [0, 1, 5, 15, 25, 1000])
+
+
+def test_shift_times(bulk_backend: str) -> None:
+    times = random_times()
+    assert shift_times(times, -1500).tolist() == [t - 1500 for t in times]
+
+
+def test_scale_times(bulk_backend: str) -> None:
+    times = random_times()
+    for ratio in (0.5, 25 / 23.976, 23.976 / 25, 2.0):
+        assert scale_times(times, ratio).tolist() == [int(round(t * ratio)) for t in times]
+
+
+def test_map_times(bulk_backend: str) -> None:
+    times = array("q", [-100, 0, 50, 100, 150, 200, 300])
+
+    # single point is constant shift
+    assert map_times(times, [(100, 150)]).tolist() == [-50, 50, 100, 150, 200, 250, 350]
+    # identity between points, extrapolation using first and last segment
+    assert map_times(times, [(0, 0), (100, 100), (200, 400)]).tolist() == [-100, 0, 50, 100, 250, 400, 700]
+    # cut: segment of zero slope
+    assert map_times(times, [(0, 0), (100, 100), (200, 100), (300, 200)]).tolist() == [-100, 0, 50, 100, 100, 100, 200]
+    # rounding
+    assert map_times(array("q", [1, 2, 3]), [(0, 0), (4, 2)]).tolist() == [0, 1, 2]
+
+    with pytest.raises(ValueError):
+        map_times(times, [])
+    with pytest.raises(ValueError):
+        map_times(times, [(100, 0), (100, 10)])
+    with pytest.raises(ValueError):
+        map_times(times, [(100, 0), (0, 10)])
+
+
+def test_map_times_backends_agree(monkeypatch: pytest.MonkeyPatch) -> None:
+    pytest.importorskip("numpy")
+    times = random_times()
+    points = [(0, 0), (60_000, 61_234), (600_000, 598_765), (1_000_000, 1_000_000 * 25 / 23.976)]
+    numpy_result = map_times(times, points)
+    monkeypatch.setattr("pysubs2.time._get_numpy", lambda: None)
+    assert map_times(times, points) == numpy_result